@@ -1,10 +1,16 @@
 
 import streamlit as st
-import time
-import webbrowser
+from streamlit.runtime.scriptrunner import add_script_run_ctx
+import os
 import json
 import random
 from datetime import datetime
+from signlink.bindings import BindingsFile
+from signlink.events import EventBus
+from signlink.metrics import header_metrics
+from signlink.recognizer import GestureRecognitionSimulator, RecognizerState
+from signlink.ringbuffer import RingBuffer
+from signlink.streaming import default_metrics
 
 # ==================== STREAMLIT CONFIGURATION ====================
 st.set_page_config(
@@ -78,115 +84,70 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# ==================== REFRESH CONFIGURATION ====================
+# Seconds between gesture panel refreshes while the simulation is active
+REFRESH_INTERVAL = float(os.environ.get("SIGNLINK_REFRESH_INTERVAL", "0.5"))
+
+# ==================== HISTORY LIMITS ====================
+MESSAGE_HISTORY = 500  # chat messages kept per session
+
 # ==================== SESSION STATE INITIALIZATION ====================
 if 'messages' not in st.session_state:
-    st.session_state.messages = []
+    st.session_state.messages = RingBuffer(MESSAGE_HISTORY)
 if 'current_sector' not in st.session_state:
     st.session_state.current_sector = "enterprise"
-if 'typed_text' not in st.session_state:
-    st.session_state.typed_text = ""
 if 'camera_active' not in st.session_state:
     st.session_state.camera_active = False
-if 'feedback_message' not in st.session_state:
-    st.session_state.feedback_message = ""
-if 'asl_prediction' not in st.session_state:
-    st.session_state.asl_prediction = ""
-if 'gesture_stability' not in st.session_state:
-    st.session_state.gesture_stability = 0.0
-if 'last_gesture_time' not in st.session_state:
-    st.session_state.last_gesture_time = 0
 if 'simulation_active' not in st.session_state:
     st.session_state.simulation_active = False
+if 'reply_stream' not in st.session_state:
+    st.session_state.reply_stream = None  # assistant reply currently streaming, if any
+if 'refresh_interval' not in st.session_state:
+    st.session_state.refresh_interval = REFRESH_INTERVAL
+# Typed text, cooldown, gesture mode and notifications start from the recognizer's defaults
+for key, value in vars(RecognizerState()).items():
+    if key not in st.session_state:
+        st.session_state[key] = value
 
 # ==================== SECTOR CONFIGURATION ====================
-SECTORS = {
-    "healthcare": {
-        "name": "🏥 Healthcare",
-        "color": "#00FFFF",
-        "scenario": "Patient Accessibility & Rehabilitation",
-        "description": "Medical chart access, patient communication, and rehabilitation support",
-        "icon": "🏥"
-    },
-    "enterprise": {
-        "name": "💼 Enterprise", 
-        "color": "#FF64FF",
-        "scenario": "Manufacturing Control & Productivity",
-        "description": "CAD control, presentations, and multi-monitor management",
-        "icon": "💼"
-    },
-    "education": {
-        "name": "🎓 Education",
-        "color": "#FFA500", 
-        "scenario": "Inclusive Learning & Disability Support",
-        "description": "Interactive learning, whiteboard control, and accessibility tools",
-        "icon": "🎓"
-    }
-}
+# Sectors, quick actions, patient requests and what each gesture does come from
+# signlink/gestures.json, recompiled when the file changes (see signlink.bindings).
+# This app sends no patient notifications: in healthcare, letters type as in
+# every other sector instead of raising requests.
+APP_BINDINGS = {"healthcare": {"type": {"A-Z": {"action": "type", "feedback": "✍️ Typed: {gesture}"}}}}
 
-QUICK_ACTIONS = {
-    "healthcare": [
-        {"name": "Patient Info", "gesture": "P", "icon": "👤", "color": "#00FFFF", "url": "https://www.epic.com"},
-        {"name": "Medical Chart", "gesture": "M", "icon": "📋", "color": "#FFFF00", "url": ""},
-        {"name": "Emergency", "gesture": "E", "icon": "🚨", "color": "#FF0000", "url": ""},
-        {"name": "Communicate", "gesture": "C", "icon": "💬", "color": "#00FF00", "url": ""},
-        {"name": "Voice CMD", "gesture": "V", "icon": "🎤", "color": "#FF69B4", "url": ""}
-    ],
-    "enterprise": [
-        {"name": "Dashboard", "gesture": "D", "icon": "📊", "color": "#FF64FF", "url": "https://www.tableau.com"},
-        {"name": "CAD Control", "gesture": "C", "icon": "🖥️", "color": "#64FFFF", "url": ""},
-        {"name": "Presentation", "gesture": "P", "icon": "📽️", "color": "#FFFF64", "url": ""},
-        {"name": "Monitors", "gesture": "M", "icon": "🖥️🖥️", "color": "#FF6464", "url": ""},
-        {"name": "Voice CMD", "gesture": "V", "icon": "🎤", "color": "#64FF64", "url": ""}
-    ],
-    "education": [
-        {"name": "Lesson Control", "gesture": "L", "icon": "📚", "color": "#FFA500", "url": "https://classroom.google.com"},
-        {"name": "Whiteboard", "gesture": "W", "icon": "🖊️", "color": "#90EE90", "url": "https://whiteboard.microsoft.com"},
-        {"name": "Assessment", "gesture": "A", "icon": "📝", "color": "#FFFF64", "url": ""},
-        {"name": "Accessibility", "gesture": "X", "icon": "♿", "color": "#00FFFF", "url": "https://accessibility.google"},
-        {"name": "Voice CMD", "gesture": "V", "icon": "🎤", "color": "#FF69B4", "url": ""}
-    ]
-}
+@st.cache_resource
+def get_bindings():
+    return BindingsFile(overrides=APP_BINDINGS)
+
+BINDINGS = get_bindings().current()
+SECTORS = BINDINGS.sectors
+QUICK_ACTIONS = BINDINGS.quick_actions
+
+# ==================== GESTURE RECOGNITION ====================
+# Recognition and dispatch run in signlink.recognizer against session state
+if 'gesture_simulator' not in st.session_state:
+    # Slides and quick actions run on the bus's threads, which need this session's script context
+    st.session_state.gesture_simulator = GestureRecognitionSimulator(
+        st.session_state, bindings=get_bindings(), bus=EventBus(on_thread=add_script_run_ctx)
+    )
+gesture_simulator = st.session_state.gesture_simulator
 
 # ==================== AI CHAT FUNCTIONALITY ====================
 def get_ai_response(user_input, sector):
     """Generate AI response based on sector context"""
-    sector_context = {
-        "healthcare": {
-            "keywords": ["patient", "medical", "health", "doctor", "hospital", "emergency", "chart", "record"],
-            "responses": [
-                "I can help you with patient information systems and medical chart access.",
-                "For healthcare settings, SignLink Pro enables hands-free medical record access.",
-                "The emergency gesture can quickly alert medical staff when needed.",
-                "Patient communication features help with rehabilitation and therapy sessions."
-            ]
-        },
-        "enterprise": {
-            "keywords": ["cad", "dashboard", "presentation", "monitor", "control", "manufacturing", "design"],
-            "responses": [
-                "In enterprise mode, you can control CAD systems and manufacturing dashboards.",
-                "Use gesture controls for presentations and multi-monitor management.",
-                "SignLink Pro enhances productivity in control room environments.",
-                "Quick access gestures streamline professional workflow tasks."
-            ]
-        },
-        "education": {
-            "keywords": ["lesson", "teach", "student", "whiteboard", "assessment", "learning", "classroom"],
-            "responses": [
-                "For education, SignLink Pro supports interactive learning and whiteboard control.",
-                "Accessibility features help students with special needs participate fully.",
-                "Teachers can control lessons and assessments using gesture commands.",
-                "The system enables inclusive classroom technology for all learners."
-            ]
-        }
-    }
+    from signlink.assistant import default_knowledge
+    from signlink.retrieval import default_retriever
     
-    context = sector_context.get(sector, sector_context["enterprise"])
-    user_input_lower = user_input.lower()
+    # Best matching answer from the sector's local FAQ corpus (see signlink.retrieval)
+    answer = default_retriever().answer(sector, user_input)
+    if answer:
+        return answer
     
-    # Check for sector-specific keywords
-    for keyword in context["keywords"]:
-        if keyword in user_input_lower:
-            return random.choice(context["responses"])
+    # Sector keywords are matched in one pass over the query (see signlink.assistant)
+    responses = default_knowledge().responses(sector, user_input)
+    if responses:
+        return random.choice(responses)
     
     # Default responses
     default_responses = [
@@ -198,67 +159,70 @@ def get_ai_response(user_input, sector):
     
     return random.choice(default_responses)
 
+@st.cache_resource
+def warm_assistant():
+    """Load the FAQ indexes on a background thread once per process, so the first reply is quick"""
+    import threading
+    from signlink.retrieval import default_retriever
+    
+    def load():
+        retriever = default_retriever()
+        for sector in SECTORS:
+            retriever.index(sector)
+    
+    thread = threading.Thread(target=load, name="signlink-faq-warmup", daemon=True)
+    thread.start()
+    return thread
+
+def stream_ai_response(user_input, sector):
+    """Yield the assistant's reply a few words at a time as it is produced"""
+    from signlink.streaming import word_chunks
+    yield from word_chunks(get_ai_response(user_input, sector))
+
+def stream_reply(question):
+    """Show a reply as it streams and keep it in the chat history
+
+    Cancels any reply still in flight from an earlier run.
+    """
+    from signlink.streaming import ResponseStream
+    if st.session_state.reply_stream is not None:
+        st.session_state.reply_stream.cancel()
+    message = add_message("assistant", "")
+    
+    def finish(stream):
+        # An interrupted reply keeps the words that were already shown
+        message["content"] = stream.text if stream.completed else (stream.text + " …" if stream.parts else "(cancelled)")
+    
+    stream = st.session_state.reply_stream = ResponseStream(
+        stream_ai_response(question, st.session_state.current_sector), metrics=default_metrics(), on_finish=finish
+    )
+    
+    # Redraw one placeholder per chunk; st.write_stream imports pandas before its first chunk
+    placeholder = st.empty()
+    for _ in stream:
+        placeholder.markdown(stream.text + "▌")
+    placeholder.markdown(stream.text)
+    st.session_state.reply_stream = None
+    return stream
+
 def add_message(role, content):
     """Add message to chat history"""
-    st.session_state.messages.append({"role": role, "content": content, "timestamp": datetime.now()})
+    message = {"role": role, "content": content, "timestamp": datetime.now()}
+    st.session_state.messages.append(message)
+    return message
 
 # ==================== SECTOR FUNCTIONS ====================
 def switch_sector(new_sector):
     """Switch between sectors"""
     st.session_state.current_sector = new_sector
     st.session_state.feedback_message = f"✅ Switched to {SECTORS[new_sector]['name']} - {SECTORS[new_sector]['scenario']}"
-    st.session_state.typed_text = ""  # Clear typed text when switching sectors
+    # Each sector keeps its own typed text, restored when switching back
 
 def execute_sector_action(action_name):
     """Execute sector-specific actions"""
-    sector = st.session_state.current_sector
-    actions = QUICK_ACTIONS[sector]
-    
-    for action in actions:
-        if action["name"] == action_name:
-            if action["url"]:
-                webbrowser.open(action["url"])
-                st.session_state.feedback_message = f"🌐 Opening {action_name}..."
-            else:
-                st.session_state.feedback_message = f"✅ {action_name} activated in {SECTORS[sector]['name']} mode"
-            break
+    gesture_simulator.run_quick_action(action_name)
 
 # ==================== GESTURE SIMULATION ====================
-def simulate_gesture_detection():
-    """Simulate gesture detection for demo purposes"""
-    gestures = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 
-                'N', 'O', 'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z',
-                'SPACE', 'ENTER', 'BACKSPACE']
-    
-    current_time = time.time()
-    
-    # Only simulate if enough time has passed since last gesture
-    if current_time - st.session_state.last_gesture_time > 2.0:
-        if random.random() < 0.4:  # 40% chance of detecting a gesture
-            gesture = random.choice(gestures)
-            stability = min(st.session_state.gesture_stability + random.uniform(0.2, 0.4), 1.0)
-            st.session_state.gesture_stability = stability
-            
-            if stability >= 0.8:
-                st.session_state.asl_prediction = gesture
-                if gesture in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
-                    st.session_state.typed_text += gesture
-                    st.session_state.feedback_message = f"✍️ Typed: {gesture}"
-                elif gesture == 'SPACE':
-                    st.session_state.typed_text += ' '
-                    st.session_state.feedback_message = "␣ Space added"
-                elif gesture == 'BACKSPACE' and st.session_state.typed_text:
-                    st.session_state.typed_text = st.session_state.typed_text[:-1]
-                    st.session_state.feedback_message = "⌫ Character deleted"
-                elif gesture == 'ENTER':
-                    st.session_state.feedback_message = "↵ Execute command"
-                
-                st.session_state.gesture_stability = 0.0  # Reset after action
-                st.session_state.last_gesture_time = current_time
-        else:
-            # Gradually decrease stability when no gesture detected
-            st.session_state.gesture_stability = max(st.session_state.gesture_stability - 0.1, 0.0)
-
 def start_gesture_simulation():
     """Start continuous gesture simulation"""
     st.session_state.simulation_active = True
@@ -289,14 +253,15 @@ def render_header():
     </div>
     """, unsafe_allow_html=True)
     
-    # Metrics
+    # Metrics (measured by `python -m signlink.bench suite`)
+    accuracy, response = header_metrics()
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.markdown(f"""
         <div class="metric-card">
             <h3>🔄 Accuracy</h3>
-            <h2>97%</h2>
+            <h2>{accuracy}</h2>
         </div>
         """, unsafe_allow_html=True)
     
@@ -304,7 +269,7 @@ def render_header():
         st.markdown(f"""
         <div class="metric-card">
             <h3>⚡ Response</h3>
-            <h2>65ms</h2>
+            <h2>{response}</h2>
         </div>
         """, unsafe_allow_html=True)
     
@@ -317,7 +282,7 @@ def render_header():
         """, unsafe_allow_html=True)
     
     with col4:
-        chars_typed = len(st.session_state.typed_text)
+        chars_typed = len(gesture_simulator.buffer)
         st.markdown(f"""
         <div class="metric-card">
             <h3>📝 Typed</h3>
@@ -353,6 +318,9 @@ def render_sidebar():
         with sim_col2:
             if st.button("⏹️ Stop Simulation", use_container_width=True):
                 stop_gesture_simulation()
+        st.session_state.refresh_interval = st.slider(
+            "Refresh interval (s)", 0.1, 2.0, st.session_state.refresh_interval, 0.1
+        )
         
         # Manual gesture input
         st.markdown("### Manual Gesture Input")
@@ -364,16 +332,8 @@ def render_sidebar():
         )
         
         if st.button("👆 Simulate This Gesture", use_container_width=True):
-            st.session_state.asl_prediction = manual_gesture
-            if manual_gesture in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
-                st.session_state.typed_text += manual_gesture
-                st.session_state.feedback_message = f"✍️ Manually typed: {manual_gesture}"
-            elif manual_gesture == 'SPACE':
-                st.session_state.typed_text += ' '
-                st.session_state.feedback_message = "␣ Space added"
-            elif manual_gesture == 'BACKSPACE' and st.session_state.typed_text:
-                st.session_state.typed_text = st.session_state.typed_text[:-1]
-                st.session_state.feedback_message = "⌫ Character deleted"
+            gesture_simulator.process_gesture(manual_gesture)
+            gesture_simulator.settle()  # requests and quick actions run on the bus's threads
         
         st.markdown("---")
         
@@ -383,7 +343,7 @@ def render_sidebar():
         
         for action in sector_actions:
             if st.button(
-                f"{action['icon']} {action['name']} ({action['gesture']})", 
+                f"{action['icon']} {action['name']} (↵ {action['gesture']})", 
                 use_container_width=True,
                 key=f"sidebar_{action['name']}"
             ):
@@ -395,7 +355,13 @@ def render_sidebar():
         st.markdown("### System Status")
         st.info(f"**Sector**: {SECTORS[st.session_state.current_sector]['name']}")
         st.info(f"**Simulation**: {'Active' if st.session_state.simulation_active else 'Inactive'}")
-        st.info(f"**Gestures**: {len(st.session_state.typed_text)} characters")
+        st.info(f"**Gestures**: {len(gesture_simulator.buffer)} characters")
+        reply_stats = default_metrics().stats()
+        if reply_stats["ttft_p50_ms"] is not None:
+            total = reply_stats["total_p50_ms"]
+            st.info(f"**Assistant**: first words {reply_stats['ttft_p50_ms']:.1f}ms, "
+                    f"full reply {'n/a' if total is None else f'{total:.1f}ms'} (p50), "
+                    f"{reply_stats['cancelled']} cancelled")
 
 def render_quick_access():
     """Render quick access buttons"""
@@ -407,10 +373,10 @@ def render_quick_access():
     for idx, action in enumerate(actions):
         with cols[idx]:
             if st.button(
-                f"{action['icon']}\n\n**{action['name']}**\n\nGesture: **{action['gesture']}**",
+                f"{action['icon']}\n\n**{action['name']}**\n\nGesture: **↵ {action['gesture']}**",
                 use_container_width=True,
                 key=f"quick_{action['name']}",
-                help=f"Execute {action['name']} action"
+                help=f"Execute {action['name']} action (sign ENTER, then {action['gesture']})"
             ):
                 execute_sector_action(action['name'])
             
@@ -497,32 +463,70 @@ def render_gesture_interface():
         st.markdown("### 📝 Communication Output")
         st.text_area(
             "Current typed text:",
-            st.session_state.typed_text,
+            gesture_simulator.buffer.text,
             height=120,
             key="typed_display_area",
             label_visibility="collapsed"
         )
         
+        # Word completions; the ENTER gesture accepts the top one
+        suggestions = gesture_simulator.suggestions()
+        if suggestions:
+            st.caption("Suggestions")
+            suggestion_cols = st.columns(len(suggestions))
+            for idx, word in enumerate(suggestions):
+                with suggestion_cols[idx]:
+                    if st.button(word, key=f"suggest_{idx}", use_container_width=True):
+                        gesture_simulator.complete_word(word)
+                        st.rerun()
+        
         # Text management buttons
-        col_clear1, col_clear2 = st.columns(2)
+        col_clear1, col_undo, col_clear2 = st.columns(3)
         with col_clear1:
             if st.button("🗑️ Clear Text", use_container_width=True):
-                st.session_state.typed_text = ""
-                st.session_state.feedback_message = "📝 Text cleared"
+                gesture_simulator.buffer.clear()
+                st.session_state.feedback_message = "📝 Text cleared (undo restores it)"
+                st.rerun()
+        with col_undo:
+            if st.button("↶ Undo", use_container_width=True, disabled=not gesture_simulator.buffer.can_undo):
+                gesture_simulator.buffer.undo()
+                st.rerun()
         with col_clear2:
-            if st.button("📋 Copy Text", use_container_width=True) and st.session_state.typed_text:
+            if st.button("📋 Copy Text", use_container_width=True) and len(gesture_simulator.buffer):
                 st.session_state.feedback_message = "📋 Text copied to clipboard"
 
+def render_live_gesture_panel():
+    """Advance the simulation and redraw only the gesture panel
+
+    Runs as a fragment on a timer while the simulation is active; a committed
+    gesture triggers one full-page rerun so the header and footer catch up.
+    """
+    last_commit = st.session_state.last_gesture_time
+    if st.session_state.simulation_active:
+        gesture_simulator.detect_gesture()
+    
+    render_gesture_interface()
+    
+    if st.session_state.last_gesture_time != last_commit:
+        gesture_simulator.settle()  # slides and quick actions run on the bus's threads
+        st.rerun(scope="app")
+
+def render_gesture_panel():
+    """Render the gesture panel as a fragment refreshing at the configured interval"""
+    run_every = st.session_state.refresh_interval if st.session_state.simulation_active else None
+    st.fragment(render_live_gesture_panel, run_every=run_every)()
+
 def render_ai_chat():
     """Render AI chat interface"""
     st.markdown("## 🤖 AI Assistant")
+    warm_assistant()
     
     # Chat container
     chat_container = st.container(height=400)
     
     with chat_container:
         # Display chat messages
-        for message in st.session_state.messages[-10:]:  # Show last 10 messages
+        for message in st.session_state.messages.last(10):  # Show last 10 messages
             if message["role"] == "user":
                 st.markdown(f"""
                 <div class="chat-message user-message">
@@ -551,9 +555,9 @@ def render_ai_chat():
         # Add user message
         add_message("user", user_input)
         
-        # Get AI response
-        ai_response = get_ai_response(user_input, st.session_state.current_sector)
-        add_message("assistant", ai_response)
+        # Stream the reply into the chat box so the first words show at once
+        with chat_container:
+            stream_reply(user_input)
         
         # Clear input by rerunning
         st.rerun()
@@ -572,8 +576,8 @@ def render_ai_chat():
         with quick_cols[idx]:
             if st.button(label, use_container_width=True):
                 add_message("user", question)
-                ai_response = get_ai_response(question, st.session_state.current_sector)
-                add_message("assistant", ai_response)
+                with chat_container:
+                    stream_reply(question)
                 st.rerun()
 
 def render_footer():
@@ -581,6 +585,8 @@ def render_footer():
     # Feedback message
     if st.session_state.feedback_message:
         st.success(st.session_state.feedback_message)
+    if st.session_state.gesture_mode != BINDINGS.default_mode:
+        st.caption(f"Mode: {BINDINGS.modes.get(st.session_state.gesture_mode, {}).get('label', st.session_state.gesture_mode)}")
     
     st.markdown("---")
     st.markdown("""
@@ -606,19 +612,13 @@ def main():
         render_quick_access()
         
         # Gesture interface
-        render_gesture_interface()
+        render_gesture_panel()
         
         # AI Chat
         render_ai_chat()
     
     # Footer
     render_footer()
-    
-    # Continuous gesture simulation (if active)
-    if st.session_state.simulation_active:
-        simulate_gesture_detection()
-        time.sleep(0.5)  # Small delay for simulation
-        st.rerun()
 
 if __name__ == "__main__":
     main()
@@ -1,17 +1,18 @@
 import streamlit as st
-import time
-import webbrowser
+from streamlit.runtime.scriptrunner import add_script_run_ctx
+import os
+import sys
 import json
 import random
 from datetime import datetime
-import cv2
-import numpy as np
-import base64
-from PIL import Image
-import io
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from signlink.coalesce import NotificationCoalescer
+from signlink.events import EventBus
+from signlink.metrics import header_metrics
+from signlink.ringbuffer import RingBuffer
+from signlink.streaming import default_metrics
+from signlink.bindings import default_bindings
+from signlink.recognizer import TRIGGERS, GestureRecognitionSimulator, GestureRecognizer, is_emergency
+from signlink.textbuffer import SectorBuffers
 
 # ==================== STREAMLIT CONFIGURATION ====================
 st.set_page_config(
@@ -128,13 +129,30 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# ==================== REFRESH CONFIGURATION ====================
+# Seconds between gesture panel refreshes while recognition is active
+REFRESH_INTERVAL = float(os.environ.get("SIGNLINK_REFRESH_INTERVAL", "0.5"))
+
+# ==================== NOTIFICATION POLICY ====================
+# Identical requests within `window` seconds merge into one notification; each
+# patient may open `burst` notifications at once, refilled at `per_minute`
+NOTIFICATION_POLICY = {
+    "window": float(os.environ.get("SIGNLINK_MERGE_WINDOW", "60")),
+    "burst": 5,
+    "per_minute": 2.0
+}
+
+# ==================== HISTORY LIMITS ====================
+MESSAGE_HISTORY = 500        # chat messages kept per session
+NOTIFICATION_HISTORY = 1000  # healthcare notifications kept per session
+
 # ==================== SESSION STATE INITIALIZATION ====================
 if 'messages' not in st.session_state:
-    st.session_state.messages = []
+    st.session_state.messages = RingBuffer(MESSAGE_HISTORY)
 if 'current_sector' not in st.session_state:
     st.session_state.current_sector = "enterprise"
-if 'typed_text' not in st.session_state:
-    st.session_state.typed_text = ""
+if 'text_buffers' not in st.session_state:
+    st.session_state.text_buffers = SectorBuffers()  # typed text per sector, with cursor and undo
 if 'camera_active' not in st.session_state:
     st.session_state.camera_active = False
 if 'feedback_message' not in st.session_state:
@@ -160,215 +178,163 @@ if 'healthcare_gestures' not in st.session_state:
 if 'emergency_gestures' not in st.session_state:
     st.session_state.emergency_gestures = {}
 if 'email_notifications' not in st.session_state:
-    st.session_state.email_notifications = []
+    st.session_state.email_notifications = RingBuffer(NOTIFICATION_HISTORY, flag=is_emergency)
 if 'gesture_hold_start' not in st.session_state:
     st.session_state.gesture_hold_start = None
+if 'patient_id' not in st.session_state:
+    st.session_state.patient_id = "default"
+if 'notification_coalescer' not in st.session_state:
+    st.session_state.notification_coalescer = NotificationCoalescer(**NOTIFICATION_POLICY)
+if 'trigger_matcher' not in st.session_state:
+    st.session_state.trigger_matcher = None
+if 'gesture_mode' not in st.session_state:
+    st.session_state.gesture_mode = "type"  # ENTER with nothing to complete arms one quick action
+if 'reply_stream' not in st.session_state:
+    st.session_state.reply_stream = None  # assistant reply currently streaming, if any
+if 'refresh_interval' not in st.session_state:
+    st.session_state.refresh_interval = REFRESH_INTERVAL
 
 # ==================== SECTOR CONFIGURATION ====================
-SECTORS = {
-    "healthcare": {
-        "name": "🏥 Healthcare",
-        "color": "#00FFFF",
-        "scenario": "Patient Accessibility & Rehabilitation",
-        "description": "Medical chart access, patient communication, and rehabilitation support",
-        "icon": "🏥"
-    },
-    "enterprise": {
-        "name": "💼 Enterprise", 
-        "color": "#FF64FF",
-        "scenario": "Manufacturing Control & Productivity",
-        "description": "CAD control, presentations, and multi-monitor management",
-        "icon": "💼"
-    },
-    "education": {
-        "name": "🎓 Education",
-        "color": "#FFA500", 
-        "scenario": "Inclusive Learning & Disability Support",
-        "description": "Interactive learning, whiteboard control, and accessibility tools",
-        "icon": "🎓"
-    }
-}
-
-QUICK_ACTIONS = {
-    "healthcare": [
-        {"name": "Patient Info", "gesture": "P", "icon": "👤", "color": "#00FFFF", "url": "https://www.epic.com"},
-        {"name": "Medical Chart", "gesture": "M", "icon": "📋", "color": "#FFFF00", "url": ""},
-        {"name": "Emergency", "gesture": "E", "icon": "🚨", "color": "#FF0000", "url": ""},
-        {"name": "Communicate", "gesture": "C", "icon": "💬", "color": "#00FF00", "url": ""},
-        {"name": "Voice CMD", "gesture": "V", "icon": "🎤", "color": "#FF69B4", "url": ""}
-    ],
-    "enterprise": [
-        {"name": "Dashboard", "gesture": "D", "icon": "📊", "color": "#FF64FF", "url": "https://www.tableau.com"},
-        {"name": "CAD Control", "gesture": "C", "icon": "🖥️", "color": "#64FFFF", "url": ""},
-        {"name": "Presentation", "gesture": "P", "icon": "📽️", "color": "#FFFF64", "url": ""},
-        {"name": "Monitors", "gesture": "M", "icon": "🖥️🖥️", "color": "#FF6464", "url": ""},
-        {"name": "Voice CMD", "gesture": "V", "icon": "🎤", "color": "#64FF64", "url": ""}
-    ],
-    "education": [
-        {"name": "Lesson Control", "gesture": "L", "icon": "📚", "color": "#FFA500", "url": "https://classroom.google.com"},
-        {"name": "Whiteboard", "gesture": "W", "icon": "🖊️", "color": "#90EE90", "url": "https://whiteboard.microsoft.com"},
-        {"name": "Assessment", "gesture": "A", "icon": "📝", "color": "#FFFF64", "url": ""},
-        {"name": "Accessibility", "gesture": "X", "icon": "♿", "color": "#00FFFF", "url": "https://accessibility.google"},
-        {"name": "Voice CMD", "gesture": "V", "icon": "🎤", "color": "#FF69B4", "url": ""}
-    ]
-}
-
-# ==================== HEALTHCARE GESTURE CONFIGURATION ====================
-HEALTHCARE_GESTURES = {
-    "B": {"name": "Breakfast", "description": "Request breakfast", "emergency": False},
-    "L": {"name": "Lunch", "description": "Request lunch", "emergency": False},
-    "D": {"name": "Dinner", "description": "Request dinner", "emergency": False},
-    "T": {"name": "Tablets", "description": "Request medication", "emergency": False},
-    "W": {"name": "Water", "description": "Request water", "emergency": False},
-    "P": {"name": "Pain", "description": "Report pain", "emergency": True},
-    "H": {"name": "Help", "description": "Request assistance", "emergency": True},
-    "E": {"name": "Emergency", "description": "Critical emergency", "emergency": True}
-}
+# Sectors, quick actions, patient requests and what each gesture does come from
+# signlink/gestures.json, recompiled when the file changes (see signlink.bindings)
+BINDINGS = default_bindings().current()
+SECTORS = BINDINGS.sectors
+QUICK_ACTIONS = BINDINGS.quick_actions
 
 # ==================== EMAIL CONFIGURATION ====================
 EMAIL_CONFIG = {
-    "smtp_server": "smtp.gmail.com",
-    "smtp_port": 587,
-    "sender_email": "healthcare.alerts@hospital.com",
-    "sender_password": "password_placeholder",  # In production, use environment variables
-    "admin_email": "admin@hospital.com"
+    "enabled": "SIGNLINK_SMTP_SERVER" in os.environ,
+    "smtp_server": os.environ.get("SIGNLINK_SMTP_SERVER", "smtp.gmail.com"),
+    "smtp_port": int(os.environ.get("SIGNLINK_SMTP_PORT", "587")),
+    "sender_email": os.environ.get("SIGNLINK_SMTP_SENDER", "healthcare.alerts@hospital.com"),
+    "sender_password": os.environ.get("SIGNLINK_SMTP_PASSWORD", ""),
+    "admin_email": os.environ.get("SIGNLINK_SMTP_ADMIN", "admin@hospital.com")
 }
 
-# ==================== GESTURE RECOGNITION SIMULATION ====================
-class GestureRecognitionSimulator:
-    def __init__(self):
-        self.gestures = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 
-                        'N', 'O', 'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z',
-                        'SPACE', 'ENTER', 'BACKSPACE', 'SWIPE_LEFT', 'SWIPE_RIGHT']
-        self.current_gesture = None
-        self.hold_timer = 0
-        
-    def detect_gesture(self):
-        """Simulate gesture detection with realistic timing"""
-        current_time = time.time()
-        
-        # Only simulate if enough time has passed since last gesture
-        if current_time - st.session_state.last_gesture_time > 2.0:
-            if random.random() < 0.4:  # 40% chance of detecting a gesture
-                gesture = random.choice(self.gestures)
-                stability = min(st.session_state.gesture_stability + random.uniform(0.2, 0.4), 1.0)
-                st.session_state.gesture_stability = stability
-                
-                if stability >= 0.8:
-                    self.current_gesture = gesture
-                    self.process_gesture(gesture)
-                    st.session_state.gesture_stability = 0.0  # Reset after action
-                    st.session_state.last_gesture_time = current_time
-            else:
-                # Gradually decrease stability when no gesture detected
-                st.session_state.gesture_stability = max(st.session_state.gesture_stability - 0.1, 0.0)
-                
-        return self.current_gesture
-    
-    def process_gesture(self, gesture):
-        """Process detected gesture based on current sector"""
-        sector = st.session_state.current_sector
-        
-        if gesture in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
-            if sector == "healthcare":
-                self.process_healthcare_gesture(gesture)
-            else:
-                st.session_state.typed_text += gesture
-                st.session_state.feedback_message = f"✍️ Typed: {gesture}"
-                
-                # Special case for education: typing "google" opens Google
-                if sector == "education" and "google" in st.session_state.typed_text.lower():
-                    webbrowser.open("https://www.google.com")
-                    st.session_state.feedback_message = "🌐 Opening Google..."
-                    st.session_state.typed_text = ""
-                    
-        elif gesture == 'SPACE':
-            st.session_state.typed_text += ' '
-            st.session_state.feedback_message = "␣ Space added"
-        elif gesture == 'BACKSPACE' and st.session_state.typed_text:
-            st.session_state.typed_text = st.session_state.typed_text[:-1]
-            st.session_state.feedback_message = "⌫ Character deleted"
-        elif gesture == 'ENTER':
-            st.session_state.feedback_message = "↵ Execute command"
-        elif gesture == 'SWIPE_LEFT' and sector == "enterprise":
-            self.previous_slide()
-        elif gesture == 'SWIPE_RIGHT' and sector == "enterprise":
-            self.next_slide()
-            
-        st.session_state.asl_prediction = gesture
-        
-    def process_healthcare_gesture(self, gesture):
-        """Process healthcare-specific gestures"""
-        if gesture in HEALTHCARE_GESTURES:
-            gesture_info = HEALTHCARE_GESTURES[gesture]
-            current_time = datetime.now()
-            
-            # Track gesture hold time for emergency tagging
-            if st.session_state.gesture_hold_start is None:
-                st.session_state.gesture_hold_start = current_time
-                
-            hold_duration = (current_time - st.session_state.gesture_hold_start).total_seconds()
-            
-            # Create notification
-            notification = {
-                "gesture": gesture,
-                "name": gesture_info["name"],
-                "description": gesture_info["description"],
-                "timestamp": current_time,
-                "emergency": gesture_info["emergency"] or hold_duration > 3.0,
-                "hold_duration": hold_duration
-            }
-            
-            st.session_state.email_notifications.append(notification)
-            
-            # Send email notification for emergency or held gestures
-            if notification["emergency"]:
-                self.send_healthcare_notification(notification)
-                st.session_state.feedback_message = f"🚨 EMERGENCY: {gesture_info['name']} - Notification sent!"
-            else:
-                st.session_state.feedback_message = f"🏥 {gesture_info['name']} requested"
-                
-            # Reset hold timer
-            st.session_state.gesture_hold_start = None
-            
-    def send_healthcare_notification(self, notification):
-        """Send email notification for healthcare gestures"""
-        try:
-            # In a real implementation, this would connect to an SMTP server
-            # For demo purposes, we'll simulate this
-            subject = "URGENT" if notification["emergency"] else "Patient Request"
-            message = f"""
-            Patient Gesture Notification:
-            
-            Gesture: {notification['gesture']} - {notification['name']}
-            Description: {notification['description']}
-            Time: {notification['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}
-            Emergency: {'YES' if notification['emergency'] else 'No'}
-            Hold Duration: {notification['hold_duration']:.1f} seconds
-            
-            Please respond accordingly.
-            """
-            
-            # Simulate sending email (in production, use smtplib)
-            print(f"EMAIL SENT: {subject}\n{message}")
-            
-        except Exception as e:
-            print(f"Failed to send email: {e}")
-            
-    def next_slide(self):
-        """Navigate to next presentation slide"""
-        if st.session_state.current_slide < st.session_state.total_slides:
-            st.session_state.current_slide += 1
-            st.session_state.feedback_message = "➡️ Next slide"
-            
-    def previous_slide(self):
-        """Navigate to previous presentation slide"""
-        if st.session_state.current_slide > 1:
-            st.session_state.current_slide -= 1
-            st.session_state.feedback_message = "⬅️ Previous slide"
+@st.cache_resource
+def get_notification_dispatcher():
+    """Process-wide SMTP dispatcher shared by all sessions, or None if email is off"""
+    if not EMAIL_CONFIG["enabled"]:
+        return None
+    from signlink.notify import NotificationDispatcher
+    return NotificationDispatcher(EMAIL_CONFIG, workers=2)
+
+# ==================== NOTIFICATION LOG ====================
+NOTIFICATION_DB = os.environ.get(
+    "SIGNLINK_NOTIFICATION_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "signlink_notifications.db")
+)
+
+@st.cache_resource
+def get_notification_log():
+    """Process-wide durable notification log; the database opens on first write"""
+    from signlink.notifylog import NotificationLog
+    return NotificationLog(NOTIFICATION_DB)
+
+# ==================== RECOGNITION MODEL ====================
+# Saved LetterClassifier (.npz); the built-in letter templates are used if unset
+MODEL_PATH = os.environ.get("SIGNLINK_MODEL")
+
+@st.cache_resource
+def get_classifier():
+    """Process-wide read-only letter classifier shared by every session"""
+    from signlink.features import LetterClassifier, default_classifier
+    if MODEL_PATH:
+        return LetterClassifier.load(MODEL_PATH)
+    return default_classifier()
+
+# Worker processes for landmark inference; 0 runs it on a thread in this process
+INFERENCE_WORKERS = int(os.environ.get("SIGNLINK_INFERENCE_WORKERS", "0"))
+# Track the hand in a padded crop instead of running detection on every full frame
+ROI_TRACKING = os.environ.get("SIGNLINK_ROI_TRACKING", "1") == "1"
+# Skip frames and lower resolution to hold this capture-to-result latency (0 disables)
+TARGET_LATENCY_MS = float(os.environ.get("SIGNLINK_TARGET_LATENCY_MS", "120"))
 
-# Initialize gesture simulator
-gesture_simulator = GestureRecognitionSimulator()
+@st.cache_resource
+def get_inference_pool():
+    """Process-wide inference worker pool shared by every camera session, or None"""
+    if INFERENCE_WORKERS <= 0:
+        return None
+    import functools
+    from signlink.features import LetterClassifier, default_classifier
+    from signlink.capture import MediaPipeHands, tracked_hands
+    from signlink.procpool import InferencePool
+    classifier_factory = functools.partial(LetterClassifier.load, MODEL_PATH) if MODEL_PATH else default_classifier
+    landmarker_factory = tracked_hands if ROI_TRACKING else MediaPipeHands
+    return InferencePool(INFERENCE_WORKERS, landmarker_factory=landmarker_factory,
+                         classifier_factory=classifier_factory).start()
+
+# ==================== TYPED TRIGGERS ====================
+@st.cache_resource(max_entries=1)
+def get_triggers(signature):
+    """Typed trigger words per sector, compiled once per gesture config
+
+    Only the explicit TRIGGERS tokens, such as "google" in education.  Quick
+    action names are ordinary words ("open the dashboard"), so quick actions
+    run from command mode or their buttons instead.
+    """
+    from signlink.triggers import TriggerSet
+    return TriggerSet({sector: dict(TRIGGERS.get(sector, {})) for sector in QUICK_ACTIONS})
+
+# ==================== WORD COMPLETION ====================
+@st.cache_resource(max_entries=1)
+def get_completions(signature):
+    """Fingerspelling completion per sector, compiled once per gesture config
+
+    The built-in vocabulary only: accepting a completion never runs a quick
+    action or trigger.
+    """
+    from signlink.completion import WordCompleter
+    from signlink.vocabulary import sector_vocabulary
+    return WordCompleter({sector: sector_vocabulary(sector) for sector in QUICK_ACTIONS})
+
+# ==================== EVENT STREAM ====================
+# Local port publishing recognized gestures to other applications (0 disables)
+EVENT_PORT = int(os.environ.get("SIGNLINK_EVENT_PORT", "0"))
+# Browser origins allowed to read the stream, comma-separated; local apps send none and are always served
+EVENT_ORIGINS = [origin.strip() for origin in os.environ.get("SIGNLINK_EVENT_ORIGINS", "").split(",") if origin.strip()]
+
+@st.cache_resource
+def get_event_server():
+    """Process-wide SSE/WebSocket event server on localhost, or None if disabled or the port is taken"""
+    if EVENT_PORT <= 0:
+        return None
+    from signlink.eventserver import EventServer
+    try:
+        return EventServer(port=EVENT_PORT, allowed_origins=EVENT_ORIGINS).start()
+    except RuntimeError as exc:
+        print(exc, file=sys.stderr)
+        return None
+
+# ==================== GESTURE RECOGNITION ====================
+# Initialize gesture simulator and camera recognizer.  The model is shared by
+# the process; these per-session objects hold only smoothing buffers, timers
+# and (for the recognizer) capture threads, and live in session state to
+# survive script reruns
+notification_dispatcher = get_notification_dispatcher()
+notification_log = get_notification_log()
+event_server = get_event_server()
+# Slides, patient requests and quick actions run on the bus's threads, which
+# need this session's script context to reach session state
+if 'gesture_simulator' not in st.session_state:
+    st.session_state.gesture_simulator = GestureRecognitionSimulator(
+        st.session_state, notifier=notification_dispatcher, notification_log=notification_log,
+        bus=EventBus(on_thread=add_script_run_ctx)
+    )
+    if event_server is not None:
+        event_server.attach(st.session_state.gesture_simulator.bus)
+gesture_simulator = st.session_state.gesture_simulator
+if 'gesture_recognizer' not in st.session_state:
+    st.session_state.gesture_recognizer = GestureRecognizer(
+        st.session_state, notifier=notification_dispatcher, notification_log=notification_log,
+        bus=EventBus(on_thread=add_script_run_ctx)
+    )
+    if event_server is not None:
+        event_server.attach(st.session_state.gesture_recognizer.bus)
+gesture_recognizer = st.session_state.gesture_recognizer
+# Follow the current gesture config, which may have been edited since the last run
+for recognizer in (gesture_simulator, gesture_recognizer):
+    recognizer.triggers = get_triggers(BINDINGS.signature)
+    recognizer.completions = get_completions(BINDINGS.signature)
 
 # ==================== VISUAL KEYBOARD COMPONENT ====================
 def render_visual_keyboard():
@@ -388,20 +354,16 @@ def render_visual_keyboard():
         for idx, key in enumerate(row):
             with cols[idx]:
                 if st.button(key, key=f"key_{key}", use_container_width=True):
+                    # Typing goes through the trigger matcher, which runs sector trigger words
                     if key == 'SPACE':
-                        st.session_state.typed_text += ' '
-                    elif key == 'BACKSPACE' and st.session_state.typed_text:
-                        st.session_state.typed_text = st.session_state.typed_text[:-1]
+                        gesture_simulator.type_text(' ')
+                    elif key == 'BACKSPACE' and gesture_simulator.buffer.cursor:
+                        gesture_simulator.delete_text()
                     elif key == 'ENTER':
-                        st.session_state.feedback_message = "↵ Command executed"
-                    else:
-                        st.session_state.typed_text += key
-                        
-                    # Special case for education: typing "google" opens Google
-                    if st.session_state.current_sector == "education" and "google" in st.session_state.typed_text.lower():
-                        webbrowser.open("https://www.google.com")
-                        st.session_state.feedback_message = "🌐 Opening Google..."
-                        st.session_state.typed_text = ""
+                        if gesture_simulator.complete_word() is None:
+                            st.session_state.feedback_message = "↵ Command executed"
+                    elif key != 'BACKSPACE':
+                        gesture_simulator.type_text(key)
 
 # ==================== VISUAL MOUSE COMPONENT ====================
 def render_visual_mouse():
@@ -496,12 +458,14 @@ def render_healthcare_communication():
     """Render healthcare communication interface"""
     st.markdown("### 🏥 Patient Communication System")
     
+    st.session_state.patient_id = st.text_input("Patient / Bed", st.session_state.patient_id) or "default"
+    
     # Healthcare gesture buttons
     st.markdown("#### Patient Needs & Requests")
     
     # Create buttons for healthcare gestures
     cols = st.columns(4)
-    gesture_list = list(HEALTHCARE_GESTURES.items())
+    gesture_list = list(BINDINGS.requests["healthcare"].items())
     
     for idx, (gesture, info) in enumerate(gesture_list):
         with cols[idx % 4]:
@@ -515,10 +479,10 @@ def render_healthcare_communication():
                 gesture_simulator.process_healthcare_gesture(gesture)
     
     # Emergency notifications
-    emergency_notifications = [n for n in st.session_state.email_notifications if n["emergency"]]
+    emergency_notifications = st.session_state.email_notifications.last_flagged(3)
     if emergency_notifications:
         st.markdown("#### 🚨 Emergency Notifications")
-        for notification in emergency_notifications[-3:]:  # Show last 3 emergencies
+        for notification in emergency_notifications:  # Show last 3 emergencies
             st.markdown(f"""
             <div class="healthcare-alert">
                 <strong>{notification['name']}</strong> - {notification['description']}
@@ -529,50 +493,26 @@ def render_healthcare_communication():
     # Recent notifications
     if st.session_state.email_notifications:
         st.markdown("#### 📋 Recent Notifications")
-        for notification in st.session_state.email_notifications[-5:]:  # Show last 5 notifications
+        for notification in st.session_state.email_notifications.last(5):  # Show last 5 notifications
             emoji = "🚨" if notification["emergency"] else "📨"
-            st.info(f"{emoji} {notification['name']}: {notification['description']} ({notification['timestamp'].strftime('%H:%M')})")
+            repeats = f" ×{notification['count']}" if notification.get("count", 1) > 1 else ""
+            st.info(f"{emoji} {notification['name']}{repeats}: {notification['description']} ({notification['timestamp'].strftime('%H:%M')})")
 
 # ==================== AI CHAT FUNCTIONALITY ====================
 def get_ai_response(user_input, sector):
     """Generate AI response based on sector context"""
-    sector_context = {
-        "healthcare": {
-            "keywords": ["patient", "medical", "health", "doctor", "hospital", "emergency", "chart", "record"],
-            "responses": [
-                "I can help you with patient information systems and medical chart access.",
-                "For healthcare settings, SignLink Pro enables hands-free medical record access.",
-                "The emergency gesture can quickly alert medical staff when needed.",
-                "Patient communication features help with rehabilitation and therapy sessions."
-            ]
-        },
-        "enterprise": {
-            "keywords": ["cad", "dashboard", "presentation", "monitor", "control", "manufacturing", "design"],
-            "responses": [
-                "In enterprise mode, you can control CAD systems and manufacturing dashboards.",
-                "Use gesture controls for presentations and multi-monitor management.",
-                "SignLink Pro enhances productivity in control room environments.",
-                "Quick access gestures streamline professional workflow tasks."
-            ]
-        },
-        "education": {
-            "keywords": ["lesson", "teach", "student", "whiteboard", "assessment", "learning", "classroom"],
-            "responses": [
-                "For education, SignLink Pro supports interactive learning and whiteboard control.",
-                "Accessibility features help students with special needs participate fully.",
-                "Teachers can control lessons and assessments using gesture commands.",
-                "The system enables inclusive classroom technology for all learners."
-            ]
-        }
-    }
+    from signlink.assistant import default_knowledge
+    from signlink.retrieval import default_retriever
     
-    context = sector_context.get(sector, sector_context["enterprise"])
-    user_input_lower = user_input.lower()
+    # Best matching answer from the sector's local FAQ corpus (see signlink.retrieval)
+    answer = default_retriever().answer(sector, user_input)
+    if answer:
+        return answer
     
-    # Check for sector-specific keywords
-    for keyword in context["keywords"]:
-        if keyword in user_input_lower:
-            return random.choice(context["responses"])
+    # Sector keywords are matched in one pass over the query (see signlink.assistant)
+    responses = default_knowledge().responses(sector, user_input)
+    if responses:
+        return random.choice(responses)
     
     # Default responses
     default_responses = [
@@ -584,30 +524,68 @@ def get_ai_response(user_input, sector):
     
     return random.choice(default_responses)
 
+@st.cache_resource
+def warm_assistant():
+    """Load the FAQ indexes on a background thread once per process, so the first reply is quick"""
+    import threading
+    from signlink.retrieval import default_retriever
+    
+    def load():
+        retriever = default_retriever()
+        for sector in SECTORS:
+            retriever.index(sector)
+    
+    thread = threading.Thread(target=load, name="signlink-faq-warmup", daemon=True)
+    thread.start()
+    return thread
+
+def stream_ai_response(user_input, sector):
+    """Yield the assistant's reply a few words at a time as it is produced"""
+    from signlink.streaming import word_chunks
+    yield from word_chunks(get_ai_response(user_input, sector))
+
+def stream_reply(question):
+    """Show a reply as it streams and keep it in the chat history
+
+    Cancels any reply still in flight from an earlier run.
+    """
+    from signlink.streaming import ResponseStream
+    if st.session_state.reply_stream is not None:
+        st.session_state.reply_stream.cancel()
+    message = add_message("assistant", "")
+    
+    def finish(stream):
+        # An interrupted reply keeps the words that were already shown
+        message["content"] = stream.text if stream.completed else (stream.text + " …" if stream.parts else "(cancelled)")
+    
+    stream = st.session_state.reply_stream = ResponseStream(
+        stream_ai_response(question, st.session_state.current_sector), metrics=default_metrics(), on_finish=finish
+    )
+    
+    # Redraw one placeholder per chunk; st.write_stream imports pandas before its first chunk
+    placeholder = st.empty()
+    for _ in stream:
+        placeholder.markdown(stream.text + "▌")
+    placeholder.markdown(stream.text)
+    st.session_state.reply_stream = None
+    return stream
+
 def add_message(role, content):
     """Add message to chat history"""
-    st.session_state.messages.append({"role": role, "content": content, "timestamp": datetime.now()})
+    message = {"role": role, "content": content, "timestamp": datetime.now()}
+    st.session_state.messages.append(message)
+    return message
 
 # ==================== SECTOR FUNCTIONS ====================
 def switch_sector(new_sector):
     """Switch between sectors"""
     st.session_state.current_sector = new_sector
     st.session_state.feedback_message = f"✅ Switched to {SECTORS[new_sector]['name']} - {SECTORS[new_sector]['scenario']}"
-    st.session_state.typed_text = ""  # Clear typed text when switching sectors
+    # Each sector keeps its own typed text, restored when switching back
 
 def execute_sector_action(action_name):
     """Execute sector-specific actions"""
-    sector = st.session_state.current_sector
-    actions = QUICK_ACTIONS[sector]
-    
-    for action in actions:
-        if action["name"] == action_name:
-            if action["url"]:
-                webbrowser.open(action["url"])
-                st.session_state.feedback_message = f"🌐 Opening {action_name}..."
-            else:
-                st.session_state.feedback_message = f"✅ {action_name} activated in {SECTORS[sector]['name']} mode"
-            break
+    gesture_simulator.run_quick_action(action_name)
 
 # ==================== GESTURE SIMULATION ====================
 def start_gesture_simulation():
@@ -620,6 +598,28 @@ def stop_gesture_simulation():
     st.session_state.simulation_active = False
     st.session_state.feedback_message = "⏹️ Gesture simulation stopped"
 
+def start_camera_recognition():
+    """Start live recognition from the camera on background threads"""
+    try:
+        scheduler = None
+        if TARGET_LATENCY_MS > 0:
+            from signlink.scheduler import AdaptiveScheduler
+            scheduler = AdaptiveScheduler(target_latency=TARGET_LATENCY_MS / 1000)
+        gesture_recognizer.start(classifier=get_classifier(), pool=get_inference_pool(),
+                                 roi_tracking=ROI_TRACKING, scheduler=scheduler)
+    except Exception as e:
+        st.session_state.camera_active = False
+        st.session_state.feedback_message = f"📷 Camera unavailable: {e}"
+        return
+    st.session_state.camera_active = True
+    st.session_state.feedback_message = "📷 Camera recognition started"
+
+def stop_camera_recognition():
+    """Stop live camera recognition"""
+    gesture_recognizer.stop()
+    st.session_state.camera_active = False
+    st.session_state.feedback_message = "📷 Camera recognition stopped"
+
 # ==================== STREAMLIT UI COMPONENTS ====================
 def render_header():
     """Render the main header"""
@@ -640,14 +640,15 @@ def render_header():
     </div>
     """, unsafe_allow_html=True)
     
-    # Metrics
+    # Metrics (measured by `python -m signlink.bench suite`)
+    accuracy, response = header_metrics()
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.markdown(f"""
         <div class="metric-card">
             <h3>🔄 Accuracy</h3>
-            <h2>97%</h2>
+            <h2>{accuracy}</h2>
         </div>
         """, unsafe_allow_html=True)
     
@@ -655,7 +656,7 @@ def render_header():
         st.markdown(f"""
         <div class="metric-card">
             <h3>⚡ Response</h3>
-            <h2>65ms</h2>
+            <h2>{response}</h2>
         </div>
         """, unsafe_allow_html=True)
     
@@ -668,7 +669,7 @@ def render_header():
         """, unsafe_allow_html=True)
     
     with col4:
-        chars_typed = len(st.session_state.typed_text)
+        chars_typed = len(gesture_simulator.buffer)
         st.markdown(f"""
         <div class="metric-card">
             <h3>📝 Typed</h3>
@@ -722,6 +723,18 @@ def render_sidebar():
             if st.button("⏹️ Stop Simulation", use_container_width=True):
                 stop_gesture_simulation()
         
+        st.session_state.refresh_interval = st.slider(
+            "Refresh interval (s)", 0.1, 2.0, st.session_state.refresh_interval, 0.1
+        )
+        
+        # Live camera recognition control
+        camera = st.toggle("📷 Camera Recognition", value=st.session_state.camera_active)
+        if camera != st.session_state.camera_active:
+            if camera:
+                start_camera_recognition()
+            else:
+                stop_camera_recognition()
+        
         # Manual gesture input
         st.markdown("### Manual Gesture Input")
         manual_gesture = st.selectbox(
@@ -733,6 +746,7 @@ def render_sidebar():
         
         if st.button("👆 Simulate This Gesture", use_container_width=True):
             gesture_simulator.process_gesture(manual_gesture)
+            gesture_simulator.settle()
         
         st.markdown("---")
         
@@ -742,7 +756,7 @@ def render_sidebar():
         
         for action in sector_actions:
             if st.button(
-                f"{action['icon']} {action['name']} ({action['gesture']})", 
+                f"{action['icon']} {action['name']} (↵ {action['gesture']})", 
                 use_container_width=True,
                 key=f"sidebar_{action['name']}"
             ):
@@ -754,7 +768,23 @@ def render_sidebar():
         st.markdown("### System Status")
         st.info(f"**Sector**: {SECTORS[st.session_state.current_sector]['name']}")
         st.info(f"**Simulation**: {'Active' if st.session_state.simulation_active else 'Inactive'}")
-        st.info(f"**Gestures**: {len(st.session_state.typed_text)} characters")
+        st.info(f"**Gestures**: {len(gesture_simulator.buffer)} characters")
+        if gesture_recognizer.pipeline is not None:
+            stats = gesture_recognizer.pipeline.stats()
+            camera_line = f"**Camera**: {stats['processed_fps']:.0f} fps, {stats['mean_latency_ms']:.0f}ms, {stats['frames_dropped']} dropped"
+            if "target_fps" in stats:
+                camera_line += (f"\n\n**Rate**: {stats['target_fps']:.0f} fps at {stats['scale']:.0%} resolution "
+                                f"({stats['rate_reason']})")
+            if "roi_hit_rate" in stats:
+                camera_line += (f"\n\n**Hand tracking**: {stats['roi_hit_rate']:.0%} hits, "
+                                f"{stats['roi_pixel_fraction']:.0%} of pixels, {stats['landmark_ms']:.1f}ms/frame")
+            st.info(camera_line)
+        reply_stats = default_metrics().stats()
+        if reply_stats["ttft_p50_ms"] is not None:
+            total = reply_stats["total_p50_ms"]
+            st.info(f"**Assistant**: first words {reply_stats['ttft_p50_ms']:.1f}ms, "
+                    f"full reply {'n/a' if total is None else f'{total:.1f}ms'} (p50), "
+                    f"{reply_stats['cancelled']} cancelled")
         
         # API Recommendations
         st.markdown("### 🔌 Recommended APIs")
@@ -778,10 +808,10 @@ def render_quick_access():
     for idx, action in enumerate(actions):
         with cols[idx]:
             if st.button(
-                f"{action['icon']}\n\n**{action['name']}**\n\nGesture: **{action['gesture']}**",
+                f"{action['icon']}\n\n**{action['name']}**\n\nGesture: **↵ {action['gesture']}**",
                 use_container_width=True,
                 key=f"quick_{action['name']}",
-                help=f"Execute {action['name']} action"
+                help=f"Execute {action['name']} action (sign ENTER, then {action['gesture']})"
             ):
                 execute_sector_action(action['name'])
             
@@ -800,8 +830,8 @@ def render_gesture_interface():
         # Camera feed simulation
         st.markdown("### 🎥 Gesture Recognition Feed")
         
-        if st.session_state.simulation_active:
-            # Active simulation view
+        if st.session_state.simulation_active or st.session_state.camera_active:
+            # Active recognition view
             st.markdown("""
             <div class="camera-feed">
                 <div style="font-size: 5rem; margin-bottom: 1rem;">👋</div>
@@ -818,9 +848,6 @@ def render_gesture_interface():
                 st.session_state.gesture_stability * 100,
                 st.session_state.asl_prediction or "None"
             ), unsafe_allow_html=True)
-            
-            # Simulate gesture detection
-            gesture_simulator.detect_gesture()
         else:
             # Inactive simulation view
             st.markdown("""
@@ -839,6 +866,8 @@ def render_gesture_interface():
         # Feedback message
         if st.session_state.feedback_message:
             st.success(st.session_state.feedback_message)
+        mode = BINDINGS.modes.get(st.session_state.gesture_mode, {})
+        st.caption(f"Mode: {mode.get('label', st.session_state.gesture_mode)}")
         
         # Current gesture
         if st.session_state.asl_prediction:
@@ -852,12 +881,38 @@ def render_gesture_interface():
         
         # Typed text display
         st.markdown("### 📝 Typed Text")
-        st.text_area("Output", st.session_state.typed_text, height=100, key="typed_output", label_visibility="collapsed")
+        buffer = gesture_simulator.buffer
+        st.text_area("Output", buffer.text, height=100, key="typed_output", label_visibility="collapsed")
+        st.caption(f"Cursor at {buffer.cursor} of {len(buffer)} (swipe left/right to move it)")
+        
+        # Cursor and undo controls; edits rerun the page so the header count follows
+        edit_cols = st.columns(4)
+        edits = [("◀", "cursor_left", lambda: buffer.move(-1), buffer.cursor > 0),
+                 ("▶", "cursor_right", lambda: buffer.move(1), buffer.cursor < len(buffer)),
+                 ("↶ Undo", "undo_text", buffer.undo, buffer.can_undo),
+                 ("↷ Redo", "redo_text", buffer.redo, buffer.can_redo)]
+        for idx, (label, key, edit, enabled) in enumerate(edits):
+            with edit_cols[idx]:
+                if st.button(label, key=key, disabled=not enabled, use_container_width=True):
+                    edit()
+                    st.rerun()
+        
+        # Word completions; the ENTER gesture accepts the top one
+        suggestions = gesture_simulator.suggestions()
+        if suggestions:
+            st.caption("Suggestions")
+            suggestion_cols = st.columns(len(suggestions))
+            for idx, word in enumerate(suggestions):
+                with suggestion_cols[idx]:
+                    if st.button(word, key=f"suggest_{idx}", use_container_width=True):
+                        gesture_simulator.complete_word(word)
+                        st.rerun()
         
         # Clear text button
         if st.button("🗑️ Clear Text", use_container_width=True):
-            st.session_state.typed_text = ""
-            st.session_state.feedback_message = "📝 Text cleared"
+            buffer.clear()
+            st.session_state.feedback_message = "📝 Text cleared (undo restores it)"
+            st.rerun()
 
 def render_sector_specific_interface():
     """Render sector-specific interface components"""
@@ -878,9 +933,10 @@ def render_sector_specific_interface():
 def render_chat_interface():
     """Render AI chat interface"""
     st.markdown("## 💬 SignLink Assistant")
+    warm_assistant()
     
     # Display chat messages
-    for message in st.session_state.messages[-10:]:  # Show last 10 messages
+    for message in st.session_state.messages.last(10):  # Show last 10 messages
         with st.chat_message(message["role"]):
             st.write(message["content"])
             st.caption(message["timestamp"].strftime("%H:%M:%S"))
@@ -892,13 +948,36 @@ def render_chat_interface():
         with st.chat_message("user"):
             st.write(prompt)
         
-        # Get AI response
-        response = get_ai_response(prompt, st.session_state.current_sector)
-        
-        # Add AI response
-        add_message("assistant", response)
+        # Stream the reply so the first words show at once
         with st.chat_message("assistant"):
-            st.write(response)
+            stream_reply(prompt)
+
+def render_live_gesture_panel():
+    """Poll the recognizer and redraw only the gesture panel
+
+    Runs as a fragment on a timer while recognition is active, so steady-state
+    refreshes leave the rest of the page alone.  A committed gesture can change
+    the header, typed-text metrics and sector panels, so it triggers one
+    full-page rerun.
+    """
+    last_commit = st.session_state.last_gesture_time
+    if st.session_state.camera_active:
+        gesture_recognizer.detect_gesture()
+    elif st.session_state.simulation_active:
+        gesture_simulator.detect_gesture()
+    
+    render_gesture_interface()
+    
+    if st.session_state.last_gesture_time != last_commit:
+        # Slides and requests run on the bus's threads; let them land before the redraw
+        (gesture_recognizer if st.session_state.camera_active else gesture_simulator).settle()
+        st.rerun(scope="app")
+
+def render_gesture_panel():
+    """Render the gesture panel as a fragment refreshing at the configured interval"""
+    active = st.session_state.simulation_active or st.session_state.camera_active
+    run_every = st.session_state.refresh_interval if active else None
+    st.fragment(render_live_gesture_panel, run_every=run_every)()
 
 # ==================== MAIN APPLICATION ====================
 def main():
@@ -912,18 +991,13 @@ def main():
     st.markdown("---")
     
     # Main content area
-    render_gesture_interface()
+    render_gesture_panel()
     render_sector_specific_interface()
     
     st.markdown("---")
     
     # Chat interface
     render_chat_interface()
-    
-    # Auto-refresh for simulation
-    if st.session_state.simulation_active:
-        time.sleep(0.5)
-        st.rerun()
 
 if __name__ == "__main__":
     main()
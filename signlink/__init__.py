@@ -0,0 +1 @@
+"""SignLink Pro gesture recognition library."""
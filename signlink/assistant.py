@@ -0,0 +1,87 @@
+"""Sector knowledge behind the chat assistant, compiled once per process.
+
+Each sector's keywords go into one Aho-Corasick automaton (the typed
+triggers' automaton, built undelimited), so a query is matched against every
+keyword in a single pass over its characters, however many keywords there
+are.  Keywords match anywhere in the text, as the old substring scan did:
+"teach" matches "teacher" and a phrase keyword may span words.  Match results for normalized queries are memoized in an LRU cache;
+responses are still drawn at random from the matched sector on every call.
+"""
+import functools
+
+from signlink.triggers import TriggerAutomaton
+
+SECTOR_KNOWLEDGE = {
+    "healthcare": {
+        "keywords": ["patient", "medical", "health", "doctor", "hospital", "emergency", "chart", "record"],
+        "responses": [
+            "I can help you with patient information systems and medical chart access.",
+            "For healthcare settings, SignLink Pro enables hands-free medical record access.",
+            "The emergency gesture can quickly alert medical staff when needed.",
+            "Patient communication features help with rehabilitation and therapy sessions."
+        ]
+    },
+    "enterprise": {
+        "keywords": ["cad", "dashboard", "presentation", "monitor", "control", "manufacturing", "design"],
+        "responses": [
+            "In enterprise mode, you can control CAD systems and manufacturing dashboards.",
+            "Use gesture controls for presentations and multi-monitor management.",
+            "SignLink Pro enhances productivity in control room environments.",
+            "Quick access gestures streamline professional workflow tasks."
+        ]
+    },
+    "education": {
+        "keywords": ["lesson", "teach", "student", "whiteboard", "assessment", "learning", "classroom"],
+        "responses": [
+            "For education, SignLink Pro supports interactive learning and whiteboard control.",
+            "Accessibility features help students with special needs participate fully.",
+            "Teachers can control lessons and assessments using gesture commands.",
+            "The system enables inclusive classroom technology for all learners."
+        ]
+    }
+}
+
+
+def normalize_query(text):
+    """Lower-case with runs of whitespace collapsed, the form queries are cached under"""
+    return " ".join(text.lower().split())
+
+
+class KnowledgeIndex:
+    """Keyword automata and canned responses per sector, with an LRU match cache"""
+
+    def __init__(self, knowledge, default_sector="enterprise", cache_size=1024):
+        self.default_sector = default_sector
+        self._automata = {sector: TriggerAutomaton({keyword: keyword for keyword in context["keywords"]},
+                                                            delimited=False)
+                          for sector, context in knowledge.items()}
+        self._responses = {sector: tuple(context["responses"]) for sector, context in knowledge.items()}
+        self.match = functools.lru_cache(maxsize=cache_size)(self._match)
+
+    def _match(self, sector, query):
+        """The first keyword found in a normalized query, or None"""
+        automaton = self._automata[sector]
+        state = automaton.start
+        for char in query:
+            state = automaton.step(state, char)
+            found = automaton.matches(state)
+            if found:
+                return found[0][1]
+        return None
+
+    def responses(self, sector, text):
+        """Canned responses for ``text`` if it mentions a sector keyword, else ()"""
+        if sector not in self._automata:
+            sector = self.default_sector
+        if self.match(sector, normalize_query(text)) is None:
+            return ()
+        return self._responses[sector]
+
+    def cache_info(self):
+        return self.match.cache_info()
+
+
+@functools.lru_cache(maxsize=1)
+def default_knowledge():
+    """The built-in SECTOR_KNOWLEDGE, compiled once per process"""
+    return KnowledgeIndex(SECTOR_KNOWLEDGE)
@@ -0,0 +1,1394 @@
+"""Micro-benchmarks for the recognition pipeline.
+
+Run with ``python -m signlink.bench <name>``.  The ``suite`` benchmark times
+every pipeline stage, measures accuracy and writes the results file the app
+header reads.
+"""
+import argparse
+import time
+from datetime import datetime
+
+import numpy as np
+
+
+def _time_per_call(func, repeat, min_time=0.2):
+    """Best-of-``repeat`` seconds per call, looping each trial for at least ``min_time``"""
+    best = float("inf")
+    for _ in range(repeat):
+        calls = 0
+        start = time.perf_counter()
+        while True:
+            func()
+            calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = min(best, elapsed / calls)
+    return best
+
+# ==================== CLASSIFIER ====================
+def bench_classifier(batch_sizes=(1, 32, 1024), repeat=5):
+    """Feature extraction plus classification cost in microseconds per frame"""
+    from signlink.features import LETTERS, default_classifier, extract_features, template_landmarks
+
+    classifier = default_classifier()
+    rng = np.random.default_rng(0)
+    pool = np.concatenate([template_landmarks(letter, 64, 0.004, rng) for letter in LETTERS])
+    rows = []
+    for batch_size in batch_sizes:
+        batch = pool[rng.integers(0, len(pool), batch_size)]
+        features = _time_per_call(lambda: extract_features(batch), repeat)
+        total = _time_per_call(lambda: classifier.predict(batch), repeat)
+        rows.append({
+            "batch": batch_size,
+            "features_us_per_frame": features / batch_size * 1e6,
+            "total_us_per_frame": total / batch_size * 1e6,
+        })
+    return rows
+
+# ==================== SESSIONS ====================
+def bench_sessions(counts=(1, 10, 100), frames=50):
+    """Memory of N recognizer sessions sharing one model vs loading a model per session
+
+    Each session gets its own state and recognizer (smoothing buffers and
+    timers) and observes ``frames`` classified frames.  With the shared
+    model, memory per session should stay a small constant independent of
+    the model size.
+    """
+    import os
+    import tempfile
+    import tracemalloc
+
+    from signlink.features import LETTERS, LetterClassifier, default_classifier, template_landmarks
+    from signlink.recognizer import GestureRecognizer, RecognizerState
+
+    shared = default_classifier()
+    rng = np.random.default_rng(5)
+    landmarks = np.concatenate([template_landmarks(letter, 4, 0.004, rng) for letter in LETTERS])
+    probabilities = shared.predict_proba(landmarks)
+    handle, model_path = tempfile.mkstemp(suffix=".npz")
+    os.close(handle)
+    shared.save(model_path)
+
+    def open_session(classifier):
+        state = RecognizerState()
+        recognizer = GestureRecognizer(state, open_url=lambda url: None)
+        recognizer.use_labels(classifier.labels)
+        for i in range(frames):
+            recognizer.observe(i, probabilities[i % len(probabilities)])
+        return recognizer, classifier
+
+    rows = []
+    try:
+        for strategy, model in (("shared", lambda: shared), ("per_session", lambda: LetterClassifier.load(model_path))):
+            for count in counts:
+                tracemalloc.start()
+                sessions = [open_session(model()) for _ in range(count)]
+                current, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                for recognizer, _ in sessions:
+                    recognizer.bus.close()
+                rows.append({
+                    "model": strategy,
+                    "sessions": count,
+                    "memory_kb": current / 1024,
+                    "per_session_kb": current / 1024 / count,
+                    "model_kb": shared.nbytes / 1024,
+                })
+                del sessions
+    finally:
+        os.unlink(model_path)
+    return rows
+
+# ==================== INFERENCE POOL ====================
+class ImageWorkload:
+    """CPU stand-in for landmark extraction when MediaPipe is not installed
+
+    Thresholds a skin-tone mask over the image and fits the template hand
+    into the mask's bounding box, costing milliseconds per camera frame
+    (in proportion to pixels processed) like MediaPipe's lite model.
+    """
+
+    def __init__(self):
+        from signlink.features import template_landmarks
+        hand = template_landmarks("B")[0]
+        low, high = hand.min(axis=0), hand.max(axis=0)
+        self._hand = (hand - low) / np.maximum(high - low, 1e-6)
+
+    def process(self, image):
+        pixels = image.astype(np.float32)
+        red, green, blue = pixels[..., 2], pixels[..., 1], pixels[..., 0]
+        mask = (red > 95) & (green > 40) & (blue > 20) & (red - np.minimum(green, blue) > 15)
+        rows, cols = np.nonzero(mask)
+        if len(rows) < 20:
+            return None
+        height, width = mask.shape
+        low = np.array([cols.min() / width, rows.min() / height, 0.0])
+        size = np.array([(cols.max() + 1) / width, (rows.max() + 1) / height, 0.0]) - low
+        size[2] = 0.05
+        return (self._hand * size + low).astype(np.float32)
+
+
+def _landmarker_factory():
+    """MediaPipe Hands if installed, otherwise the ImageWorkload stand-in"""
+    try:
+        import mediapipe  # noqa: F401
+    except ImportError:
+        return ImageWorkload, "image_workload"
+    from signlink.capture import MediaPipeHands
+    return MediaPipeHands, "mediapipe"
+
+
+def bench_pool(worker_counts=(1, 2, 4, 8), streams=8, seconds=3.0, size=(480, 640)):
+    """Frames per second through the process pool for 1..8 workers vs inline inference
+
+    ``streams`` sessions submit camera-sized frames as fast as slots free up;
+    the ``inline`` row runs the same work on the calling thread.
+    """
+    import os
+
+    from signlink.capture import Frame
+    from signlink.features import default_classifier
+    from signlink.procpool import InferencePool
+
+    factory, workload = _landmarker_factory()
+    image = np.random.default_rng(6).integers(0, 256, size + (3,), dtype=np.uint8)
+    cpus = os.cpu_count()
+    rows = []
+
+    landmarker, classifier = factory(), default_classifier()
+    def inline():
+        landmarks = landmarker.process(image)
+        if landmarks is not None:
+            classifier.predict_proba(landmarks)
+    per_frame = _time_per_call(inline, 3)
+    rows.append({"workers": "inline", "workload": workload, "cpus": cpus, "frames_per_second": 1 / per_frame,
+                 "latency_ms": per_frame * 1000, "submit_us": 0.0})
+
+    for workers in worker_counts:
+        with InferencePool(workers, landmarker_factory=factory) as pool:
+            sessions = [pool.open_stream() for _ in range(streams)]
+            index = 0
+            # Warm up until every stream has a result, so worker start-up is not timed
+            while any(stream.completed == 0 for stream in sessions):
+                for stream in sessions:
+                    if not stream.in_flight:
+                        stream.submit(Frame(index, 0.0, image, None))
+                        index += 1
+                time.sleep(0.001)
+            completed = sum(stream.completed for stream in sessions)
+            submit_ns = []
+            start = time.perf_counter()
+            while time.perf_counter() - start < seconds:
+                submitted = False
+                for stream in sessions:
+                    before = time.perf_counter_ns()
+                    if stream.submit(Frame(index, 0.0, image, None)):
+                        submit_ns.append(time.perf_counter_ns() - before)
+                        submitted = True
+                    index += 1
+                if not submitted:
+                    time.sleep(0.0005)
+            elapsed = time.perf_counter() - start
+            done = sum(stream.completed for stream in sessions) - completed
+            latencies = [result.latency for stream in sessions
+                         for result in iter(lambda: stream.results.get(timeout=0), None)]
+            rows.append({
+                "workers": workers,
+                "workload": workload,
+                "cpus": cpus,
+                "frames_per_second": done / elapsed,
+                "latency_ms": float(np.mean(latencies)) * 1000 if latencies else 0.0,
+                "submit_us": float(np.median(submit_ns)) / 1000 if submit_ns else 0.0,
+            })
+    return rows
+
+# ==================== HAND ROI TRACKING ====================
+def _hand_video(frames, size=(480, 640), hand=(160, 120), seed=7):
+    """Frames with a skin-coloured hand drifting across a cluttered background
+
+    Every 60th frame block of 10 frames has no hand, forcing re-detection.
+    """
+    rng = np.random.default_rng(seed)
+    height, width = size
+    background = rng.integers(0, 90, size + (3,), dtype=np.uint8)
+    video, boxes = [], []
+    x, y = width / 2, height / 2
+    for i in range(frames):
+        image = background.copy()
+        if i % 60 < 50:
+            x = float(np.clip(x + rng.normal(0, 4), hand[1], width - hand[1]))
+            y = float(np.clip(y + rng.normal(0, 3), hand[0], height - hand[0]))
+            top, left = int(y - hand[0] / 2), int(x - hand[1] / 2)
+            image[top:top + hand[0], left:left + hand[1]] = (110, 140, 210)
+        video.append(image)
+    return video
+
+
+def bench_roi(frames=600):
+    """Per-frame landmark cost, pixels processed and hit rate with and without ROI tracking"""
+    from signlink.capture import MediaPipeHands, RoiTracker
+
+    factory, workload = _landmarker_factory()
+    video = _hand_video(frames)
+    full = factory() if workload != "mediapipe" else MediaPipeHands()
+    tracker = RoiTracker(factory() if workload != "mediapipe" else MediaPipeHands(static_image_mode=True))
+
+    rows, outputs = [], {}
+    for mode, landmarker in (("full_frame", full), ("roi", tracker)):
+        timings, points = [], []
+        for image in video:
+            start = time.perf_counter_ns()
+            points.append(landmarker.process(image))
+            timings.append(time.perf_counter_ns() - start)
+        outputs[mode] = points
+        row = {"mode": mode, "workload": workload, "frames": frames, **_percentiles(timings)}
+        row.pop("mean_ms")
+        row.update(tracker.stats() if mode == "roi" else
+                   {"roi_hit_rate": 0.0, "roi_pixel_fraction": 1.0,
+                    "landmark_ms": float(np.mean(timings)) / 1e6})
+        rows.append(row)
+    # Agreement between the two modes on frames where both found the hand
+    both = [(a, b) for a, b in zip(outputs["full_frame"], outputs["roi"]) if a is not None and b is not None]
+    rows[1]["max_landmark_error"] = max(float(np.abs(a - b).max()) for a, b in both) if both else 0.0
+    full.close() if hasattr(full, "close") else None
+    tracker.close()
+    return rows
+
+# ==================== ADAPTIVE RATE ====================
+def _burn(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class _VideoLoop:
+    """Camera-like source replaying frames in a loop at a fixed rate"""
+
+    def __init__(self, video, fps=30):
+        from signlink.capture import SyntheticSource
+        self._pacer = SyntheticSource(fps=fps, size=(1, 1), realtime=True)
+        self._video = video
+
+    def read(self):
+        frame = self._pacer.read()
+        return frame._replace(image=self._video[frame.index % len(self._video)], timestamp=time.monotonic())
+
+    def close(self):
+        pass
+
+
+def bench_scheduler(phase_seconds=4.0, hogs=4, size=(720, 1280), target_ms=120.0):
+    """Latency and processed rate, fixed vs adaptive, before/during/after competing CPU load
+
+    A 30 fps camera-like source feeds the pipeline; during the two middle
+    phases ``hogs`` busy processes compete for the CPU, as on a shared kiosk.
+    """
+    import multiprocessing
+
+    from signlink.capture import RecognitionPipeline
+    from signlink.scheduler import AdaptiveScheduler
+
+    factory, workload = _landmarker_factory()
+    video = _hand_video(30, size=size, hand=(240, 180))
+    context = multiprocessing.get_context("spawn")
+    rows = []
+    for mode in ("fixed", "adaptive"):
+        scheduler = AdaptiveScheduler(target_latency=target_ms / 1000) if mode == "adaptive" else None
+        pipeline = RecognitionPipeline(_VideoLoop(video), landmarker=factory(), scheduler=scheduler).start()
+        workers = []
+        # The load spans two phases: adaptation at onset, then the settled rate
+        for phase in ("idle", "load_onset", "loaded", "recovered"):
+            if phase == "load_onset":
+                workers = [context.Process(target=_burn, args=(2 * phase_seconds,), daemon=True)
+                           for _ in range(hogs)]
+                for worker in workers:
+                    worker.start()
+            pipeline.drain()
+            before = pipeline.frames_processed
+            time.sleep(phase_seconds)
+            latencies = [result.latency * 1e9 for result in pipeline.drain()]
+            if phase == "loaded":
+                for worker in workers:
+                    worker.join()
+            row = {"mode": mode, "phase": phase, "workload": workload,
+                   "processed_fps": (pipeline.frames_processed - before) / phase_seconds,
+                   **_percentiles(latencies)}
+            row.pop("mean_ms")
+            stats = pipeline.stats()
+            row["target_fps"] = stats.get("target_fps", 30.0)
+            row["scale"] = stats.get("scale", 1.0)
+            row["dropped"] = stats["frames_dropped"]
+            rows.append(row)
+        if scheduler is not None:
+            for when, fps, scale, reason in scheduler.changes:
+                print(f"  change: {fps:.1f} fps at {scale:.0%} - {reason}")
+        pipeline.stop()
+    return rows
+
+# ==================== TYPED TRIGGERS ====================
+def bench_triggers(trigger_counts=(1, 100, 10_000), buffer_lengths=(100, 10_000, 100_000)):
+    """Per-keystroke cost of trigger matching: rescanning the text vs the incremental automaton"""
+    from signlink.triggers import TriggerAutomaton, TriggerMatcher
+
+    rng = np.random.default_rng(8)
+    letters = np.array(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+    rows = []
+    for count in trigger_counts:
+        words = {"".join(rng.choice(letters, rng.integers(5, 11))): {"name": str(i)} for i in range(count)}
+        start = time.perf_counter()
+        automaton = TriggerAutomaton(words)
+        compile_ms = (time.perf_counter() - start) * 1000
+        lowered = [word.lower() for word in words]
+        for length in buffer_lengths:
+            text = "".join(rng.choice(letters, length))
+            matcher = TriggerMatcher(automaton)
+            matcher.push(text)
+
+            def incremental():
+                matcher.push("Q")
+                matcher.pop()
+
+            def rescan():
+                current = (text + "Q").lower()
+                return [word for word in lowered if word in current]
+
+            rows.append({
+                "triggers": count,
+                "buffer": length,
+                "states": automaton.states,
+                "compile_ms": compile_ms,
+                "rescan_us": _time_per_call(rescan, 3, 0.05) * 1e6,
+                "automaton_us": _time_per_call(incremental, 3, 0.05) * 1e6,
+            })
+    return rows
+
+# ==================== WORD COMPLETION ====================
+COMPLETION_SENTENCES = {
+    "healthcare": [
+        "please call the nurse i need help",
+        "my head and chest pain is worse today",
+        "can i have water and my medication",
+        "i feel dizzy and tired after breakfast",
+        "when is my doctor appointment tomorrow",
+    ],
+    "enterprise": [
+        "open the dashboard and share my screen",
+        "next slide please",
+        "the quarterly report is ready for review",
+        "schedule a meeting with the manufacturing team",
+        "update the project deadline on the calendar",
+    ],
+    "education": [
+        "can you repeat the question please",
+        "open the whiteboard for the math lesson",
+        "i need more time to understand this chapter",
+        "my homework assignment is about science",
+        "the teacher will explain the reading test",
+    ],
+}
+
+
+def _spell_with_completion(completer, sector, word):
+    """Gestures to enter ``word`` and a space: letters until the top completion is right, then ENTER"""
+    word = word.upper()
+    text = ""
+    for char in word:
+        text += char
+        if len(text) < len(word) and completer.best(sector, text) == word:
+            return len(text) + 1
+    return len(word) + 1
+
+
+def bench_completion(sentences=None, vocabulary_size=50_000, cooldown=None):
+    """Gestures saved per word by completing fingerspelled words, plus lookup cost
+
+    Replays typed sentences per sector.  Without completion every letter and
+    the space is a gesture; with it the signer stops as soon as the top
+    suggestion is the intended word and accepts it with one ENTER gesture.
+    """
+    from signlink.completion import PrefixTrie
+    from signlink.recognizer import GESTURE_COOLDOWN, default_completions
+    from signlink.vocabulary import sector_vocabulary
+
+    cooldown = GESTURE_COOLDOWN if cooldown is None else cooldown
+    completer = default_completions()
+    rows = []
+    for sector, texts in (sentences or COMPLETION_SENTENCES).items():
+        words = [word for text in texts for word in text.split()]
+        plain = sum(len(word) + 1 for word in words)
+        completed = sum(_spell_with_completion(completer, sector, word) for word in words)
+        rows.append({
+            "sector": sector,
+            "words": len(words),
+            "gestures_plain": plain,
+            "gestures_completed": completed,
+            "saved_per_word": (plain - completed) / len(words),
+            "saved_fraction": (plain - completed) / plain,
+            "seconds_saved_per_word": (plain - completed) / len(words) * cooldown,
+        })
+
+    # Lookup cost against the built-in vocabulary and a large synthetic one
+    rng = np.random.default_rng(9)
+    letters = np.array(list("ETAOINSHRDLCUMWFGYPBVKJXQZ"))
+    weights = np.array([12.7, 9.1, 8.2, 7.5, 7.0, 6.7, 6.3, 6.1, 6.0, 4.3, 4.0, 2.8, 2.8, 2.4, 2.4, 2.2,
+                        2.0, 2.0, 1.9, 1.5, 1.0, 0.8, 0.2, 0.2, 0.1, 0.1])
+    synthetic = {"".join(rng.choice(letters, rng.integers(2, 12), p=weights / weights.sum())): int(count)
+                 for count in rng.zipf(1.3, vocabulary_size)}
+    for name, vocabulary in (("builtin", sector_vocabulary("education")), ("synthetic", synthetic)):
+        start = time.perf_counter()
+        trie = PrefixTrie(vocabulary)
+        build_ms = (time.perf_counter() - start) * 1000
+        prefixes = [word[:n] for word in list(trie.frequencies)[:200] for n in range(1, len(word) + 1)]
+        lookup = _time_per_call(lambda: [trie.complete(prefix, 3) for prefix in prefixes], 3, 0.1)
+        rows.append({
+            "vocabulary": name,
+            "words": len(trie),
+            "nodes": trie.nodes,
+            "build_ms": build_ms,
+            "lookup_us": lookup / len(prefixes) * 1e6,
+        })
+    return rows
+
+# ==================== ASSISTANT ====================
+def bench_assistant(keyword_counts=(7, 1_000, 5_000), queries=2_000, distinct=300, cache_size=1024):
+    """Per-query cost of matching sector keywords: the old substring scan vs the compiled index
+
+    Queries are drawn Zipf-style from ``distinct`` chat messages, about half
+    mentioning a keyword, so repeated questions exercise the LRU cache.
+    """
+    from signlink.assistant import KnowledgeIndex, normalize_query
+
+    rng = np.random.default_rng(11)
+    letters = np.array(list("abcdefghijklmnopqrstuvwxyz"))
+    filler = ["how", "do", "i", "use", "the", "please", "show", "me", "can", "you", "open", "my", "with", "for"]
+    rows = []
+    for count in keyword_counts:
+        keywords = list({"".join(rng.choice(letters, rng.integers(5, 11))) for _ in range(count)})
+        knowledge = {"enterprise": {"keywords": keywords, "responses": ["ok"]}}
+        start = time.perf_counter()
+        index = KnowledgeIndex(knowledge, cache_size=cache_size)
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        messages = []
+        for i in range(distinct):
+            words = list(rng.choice(filler, rng.integers(5, 12)))
+            if i % 2:
+                words.insert(int(rng.integers(0, len(words))), keywords[int(rng.integers(0, len(keywords)))])
+            messages.append(" ".join(words).capitalize() + "?")
+        stream = [messages[int(i) % distinct] for i in rng.zipf(1.2, queries)]
+
+        def scan():
+            for message in stream:
+                lowered = message.lower()
+                any(keyword in lowered for keyword in keywords)
+
+        def uncached():
+            for message in stream:
+                index._match("enterprise", normalize_query(message))
+
+        def cached():
+            for message in stream:
+                index.responses("enterprise", message)
+
+        index.match.cache_clear()
+        cached()
+        info = index.cache_info()
+        for message in messages:
+            lowered = message.lower()
+            expected = any(keyword in lowered for keyword in keywords)
+            assert bool(index.responses("enterprise", message)) == expected
+        rows.append({
+            "keywords": len(keywords),
+            "compile_ms": compile_ms,
+            "scan_us": _time_per_call(scan, 3, 0.1) / queries * 1e6,
+            "index_us": _time_per_call(uncached, 3, 0.1) / queries * 1e6,
+            "cached_us": _time_per_call(cached, 3, 0.1) / queries * 1e6,
+            "cache_hit_rate": info.hits / (info.hits + info.misses),
+        })
+    return rows
+
+# ==================== GESTURE DISPATCH ====================
+def bench_dispatch(gestures=20_000, action_counts=(5, 100, 1_000)):
+    """Per-gesture cost of resolving what a gesture does, and of running it
+
+    ``chain_ns`` walks the branch order of the old ``if/elif`` chain in
+    ``process_gesture``; ``table_ns`` is the compiled ``(sector, mode,
+    gesture)`` lookup that replaced it and ``process_us`` a full dispatch
+    including the handler.  ``check_us`` is the file stat made when a reload
+    check is due and ``reload_ms`` recompiling after an edit.  The
+    quick-action rows compare the old linear scan by name with the compiled
+    lookup for sectors with ``count`` actions.
+    """
+    import os
+    import tempfile
+
+    from signlink.bindings import GESTURE_CONFIG, GESTURES, BindingsFile, GestureBindings, load_bindings
+    from signlink.recognizer import GestureRecognitionSimulator, RecognizerState
+
+    rng = np.random.default_rng(12)
+    bindings = load_bindings()
+    sectors = list(bindings.sectors)
+    # A signer stays in one sector for a while; switching resyncs the trigger matcher
+    stream = [(sectors[i * len(sectors) // gestures], "type", GESTURES[int(g)])
+              for i, g in enumerate(rng.integers(0, len(GESTURES), gestures))]
+
+    def chain():
+        for sector, mode, gesture in stream:
+            if gesture in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
+                action = "request" if sector == "healthcare" else "type"
+            elif gesture == "SPACE":
+                action = "type"
+            elif gesture == "BACKSPACE":
+                action = "delete"
+            elif gesture == "ENTER":
+                action = "complete"
+            elif gesture == "SWIPE_LEFT" and sector == "enterprise":
+                action = "slide"
+            elif gesture == "SWIPE_RIGHT" and sector == "enterprise":
+                action = "slide"
+            elif gesture in ("SWIPE_LEFT", "SWIPE_RIGHT"):
+                action = "move_cursor"
+
+    def table():
+        get = bindings.table.get
+        for key in stream:
+            get(key)
+
+    state = RecognizerState()
+    recognizer = GestureRecognitionSimulator(state, open_url=lambda url: None, bindings=bindings)
+    recognizer.send_healthcare_notification = lambda notification: True
+
+    def process():
+        for sector, mode, gesture in stream:
+            state.current_sector = sector
+            if len(recognizer.buffer) > 256:
+                state.text_buffers.clear()
+            recognizer.process_gesture(gesture)
+        state.email_notifications.clear()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "gestures.json")
+        with open(GESTURE_CONFIG, encoding="utf-8") as handle:
+            text = handle.read()
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        watched = BindingsFile(path, refresh_interval=0.0)
+        watched.current()
+        check = _time_per_call(watched.current, 3, 0.05)
+
+        def reload():
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write(text + " " * (watched.reloads % 2))
+            assert watched.refresh()
+        reload_time = _time_per_call(reload, 3, 0.1)
+
+    rows = [{
+        "bindings": len(bindings.table),
+        "compile_ms": _time_per_call(load_bindings, 3, 0.1) * 1000,
+        "reload_ms": reload_time * 1000,
+        "check_us": check * 1e6,
+        "chain_ns": _time_per_call(chain, 3, 0.1) / gestures * 1e9,
+        "table_ns": _time_per_call(table, 3, 0.1) / gestures * 1e9,
+        "process_us": _time_per_call(process, 3, 0.2) / gestures * 1e6,
+    }]
+    recognizer.bus.close()
+
+    config = {"sectors": {"enterprise": {}}, "modes": {"type": {}}}
+    for count in action_counts:
+        actions = [{"name": f"Action {i}", "url": ""} for i in range(count)]
+        config["quick_actions"] = {"enterprise": actions}
+        compiled = GestureBindings(config)
+        names = [actions[int(i)]["name"] for i in rng.integers(0, count, 2_000)]
+
+        def scan():
+            for name in names:
+                for action in actions:
+                    if action["name"] == name:
+                        break
+
+        def lookup():
+            for name in names:
+                compiled.quick_action("enterprise", name)
+
+        rows.append({
+            "quick_actions": count,
+            "scan_ns": _time_per_call(scan, 3, 0.1) / len(names) * 1e9,
+            "lookup_ns": _time_per_call(lookup, 3, 0.1) / len(names) * 1e9,
+        })
+    return rows
+
+# ==================== HEADLESS CORE ====================
+def bench_headless(texts=("SIGNLINK", "THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG"), sectors=("enterprise", "healthcare")):
+    """Frames per second of the UI-free core: classify, smooth and dispatch on a plain state
+
+    Runs synthetic signers through ``signlink.run.run_offline`` on this
+    thread, as ``python -m signlink.run synthetic`` does.  ``realtime_factor``
+    is how many 30 fps cameras one core could keep up with.
+    """
+    from signlink.capture import SyntheticSource
+    from signlink.features import default_classifier
+    from signlink.recognizer import GestureRecognizer, RecognizerState
+    from signlink.replay import VirtualClock
+    from signlink.run import run_offline, synthetic_landmarks
+
+    classifier = default_classifier()
+    rows = []
+    for text in texts:
+        landmarks = synthetic_landmarks(text)
+        for sector in sectors:
+            best = None
+            for _ in range(3):
+                state = RecognizerState(current_sector=sector)
+                recognizer = GestureRecognizer(state, clock=VirtualClock(time.time()), open_url=lambda url: None)
+                recognizer.send_healthcare_notification = lambda notification: True
+                stats = run_offline(recognizer, SyntheticSource(landmarks, realtime=False), classifier,
+                                    lambda result, gesture: None)
+                recognizer.bus.close()
+                if best is None or stats["seconds"] < best["seconds"]:
+                    best = stats
+            rows.append({
+                "text": text[:12],
+                "sector": sector,
+                "frames": best["frames"],
+                "commits": best["commits"],
+                "frames_per_second": best["frames_per_second"],
+                "us_per_frame": best["seconds"] / best["frames"] * 1e6,
+                "realtime_factor": best["frames_per_second"] / 30.0,
+            })
+    return rows
+
+# ==================== EVENT BUS ====================
+def bench_bus(rate=10_000.0, seconds=2.0, slow_ms=(5.0, 20.0), burst=100_000):
+    """Event bus throughput at ``rate`` events/s with fast and slow consumers
+
+    Consumers stand in for the recognizer's: an inline state update (text
+    buffer), lossless "block" slides and log, a "drop_oldest" JSON encoder
+    (the event server) and two "drop_newest" consumers sleeping ``slow_ms``
+    per event (browser launch, SMTP send).  The ``synchronous`` row calls all
+    of them in turn, as gesture dispatch did before the bus.  ``lag``
+    percentiles are publish to handling for the JSON consumer; the last row
+    publishes ``burst`` events as fast as possible.
+    """
+    import json
+
+    from signlink.bindings import Binding
+    from signlink.events import EventBus, GestureCommitted
+
+    binding = Binding("type", {}, None)
+
+    def consumers():
+        counts = {"text": [], "slides": 0, "log": [], "lag": []}
+
+        def text(event):
+            counts["text"].append(event.gesture)
+
+        def slides(event):
+            counts["slides"] += 1
+
+        def log(event):
+            counts["log"].append(event)
+
+        def encode(event):
+            json.dumps(event.payload())
+            counts["lag"].append(time.perf_counter() - event.time)
+
+        def sleeper(delay):
+            return lambda event: time.sleep(delay / 1000)
+
+        handlers = [("text", text, "inline"), ("slides", slides, "block"), ("log", log, "block"),
+                    ("eventserver", encode, "drop_oldest")]
+        handlers += [(f"slow_{delay:g}ms", sleeper(delay), "drop_newest") for delay in slow_ms]
+        return counts, handlers
+
+    def summary(name, events, elapsed, publish_ns, counts, bus=None):
+        row = {"mode": name, "events": events, "events_per_second": events / elapsed,
+               "publish_p50_us": float(np.percentile(publish_ns, 50)) / 1000,
+               "publish_p99_us": float(np.percentile(publish_ns, 99)) / 1000,
+               "text_pct": 100 * len(counts["text"]) / events, "log_pct": 100 * len(counts["log"]) / events}
+        if counts["lag"]:
+            lag = np.array(counts["lag"]) * 1000
+            row.update(lag_p50_ms=float(np.percentile(lag, 50)), lag_p99_ms=float(np.percentile(lag, 99)))
+        if bus is not None:
+            for stats in bus.stats():
+                if stats["dropped"]:
+                    row[f"{stats['name']}_dropped"] = stats["dropped"]
+        return row
+
+    rows = []
+
+    # Before: every consumer in the recognizer's thread, so the slowest sets the pace
+    counts, handlers = consumers()
+    events = 50
+    publish_ns = np.empty(events, dtype=np.int64)
+    start = time.perf_counter()
+    for i in range(events):
+        begin = time.perf_counter_ns()
+        event = GestureCommitted("A", "enterprise", "type", binding, time.perf_counter())
+        for _, handler, _ in handlers:
+            handler(event)
+        publish_ns[i] = time.perf_counter_ns() - begin
+    rows.append(summary("synchronous", events, time.perf_counter() - start, publish_ns, counts))
+
+    for name, count, interval in (("paced", int(rate * seconds), 1 / rate), ("burst", burst, 0.0)):
+        counts, handlers = consumers()
+        bus = EventBus()
+        for consumer, handler, policy in handlers:
+            bus.subscribe(GestureCommitted, handler, policy=policy, maxsize=1024, name=consumer)
+        publish_ns = np.empty(count, dtype=np.int64)
+        start = time.perf_counter()
+        for i in range(count):
+            if interval and i % 10 == 0:
+                delay = start + i * interval - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            begin = time.perf_counter_ns()
+            bus.publish(GestureCommitted("A", "enterprise", "type", binding, time.perf_counter()))
+            publish_ns[i] = time.perf_counter_ns() - begin
+        elapsed = time.perf_counter() - start
+        bus.flush(30.0)
+        rows.append(summary(name, count, elapsed, publish_ns, counts, bus))
+        bus.close()
+    return rows
+
+# ==================== EVENT STREAM ====================
+async def _stream_client(port, protocol, latencies):
+    """Read events from the server until the "end" event, recording publish-to-receive latency"""
+    import asyncio
+    import base64
+    import json
+    import os
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    if protocol == "sse":
+        writer.write(b"GET /events HTTP/1.1\r\nHost: localhost\r\n\r\n")
+    else:
+        key = base64.b64encode(os.urandom(16))
+        writer.write(b"GET /ws HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                     b"Sec-WebSocket-Version: 13\r\nSec-WebSocket-Key: " + key + b"\r\n\r\n")
+    await reader.readuntil(b"\r\n\r\n")
+    try:
+        while True:
+            if protocol == "sse":
+                line = await reader.readline()
+                if not line:
+                    return
+                if not line.startswith(b"data: "):
+                    continue
+                payload = line[6:]
+            else:
+                first, second = await reader.readexactly(2)
+                length = second & 0x7F
+                if length == 126:
+                    length = int.from_bytes(await reader.readexactly(2), "big")
+                elif length == 127:
+                    length = int.from_bytes(await reader.readexactly(8), "big")
+                payload = await reader.readexactly(length)
+                if first & 0x0F != 0x1:
+                    continue
+            event = json.loads(payload)
+            if event["type"] == "end":
+                return
+            latencies.append(time.perf_counter() - event["sent"])
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def bench_eventserver(client_counts=(1, 10, 100), events=1_000, rate=500.0, slow_events=10_000, slow_rate=2_000.0):
+    """Publish-to-receive latency with many SSE and WebSocket clients, and a stalled client
+
+    Half the clients use SSE and half WebSocket, all in one asyncio loop on
+    this thread while a second thread publishes at ``rate`` events per second.
+    ``fanout`` percentiles are publish to socket write on the server,
+    ``receive`` ones include the clients' own parsing.  The last row adds a
+    client that never reads while ``slow_events`` are published at
+    ``slow_rate``: it is evicted while the others keep receiving.
+    """
+    import asyncio
+    import socket
+    import threading
+
+    from signlink.eventserver import EventServer
+
+    def publisher(server, count, interval):
+        start = time.perf_counter()
+        for i in range(count):
+            if interval:
+                delay = start + i * interval - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            server.publish("gesture", {"gesture": "A", "sent": time.perf_counter()})
+        server.publish("end", {})
+
+    async def scenario(server, clients, count, interval, slow=False):
+        received = [[] for _ in range(clients)]
+        tasks = [asyncio.ensure_future(_stream_client(server.port, "sse" if i % 2 else "ws", received[i]))
+                 for i in range(clients)]
+        stalled = None
+        if slow:
+            sock = socket.socket()
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+            sock.setblocking(False)
+            await asyncio.get_running_loop().sock_connect(sock, ("127.0.0.1", server.port))
+            sock.send(b"GET /events HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            stalled = sock
+        while server.stats()["clients"] < clients + bool(slow):
+            await asyncio.sleep(0.01)
+        thread = threading.Thread(target=publisher, args=(server, count, interval))
+        started = time.perf_counter()
+        thread.start()
+        await asyncio.wait_for(asyncio.gather(*tasks), 60)
+        elapsed = time.perf_counter() - started
+        thread.join()
+        if stalled is not None:
+            stalled.close()
+        return received, elapsed
+
+    rows = []
+    scenarios = [(clients, events, 1 / rate, False) for clients in client_counts]
+    scenarios.append((max(client_counts[0], 10), slow_events, 1 / slow_rate, True))
+    for clients, count, interval, slow in scenarios:
+        with EventServer(port=0, buffer_size=256, evict_after=1024) as server:
+            received, elapsed = asyncio.run(scenario(server, clients, count, interval, slow))
+            stats = server.stats()
+        latencies = np.array([value for client in received for value in client]) * 1000
+        rows.append({
+            "clients": clients,
+            "slow_client": slow,
+            "events": count,
+            "events_per_second": count / elapsed,
+            "delivered_pct": 100 * len(latencies) / (clients * count),
+            "fanout_p50_ms": stats["fanout_p50_ms"],
+            "fanout_p99_ms": stats["fanout_p99_ms"],
+            "receive_p50_ms": float(np.percentile(latencies, 50)) if len(latencies) else None,
+            "receive_p99_ms": float(np.percentile(latencies, 99)) if len(latencies) else None,
+            "dropped": stats["dropped"],
+            "evicted": stats["evicted"],
+        })
+    return rows
+
+# ==================== FAQ RETRIEVAL ====================
+def bench_retrieval(document_counts=(100, 1_000, 10_000), files=10, queries=1_000):
+    """Build, rebuild, reopen and top-3 query cost of the FAQ index
+
+    Each corpus is split over ``files`` markdown files of synthetic Zipf-worded
+    documents.  The rebuild follows a one-document edit: the whole matrix is
+    recomputed but only that document is re-tokenized.  ``open_ms`` is a
+    fresh retriever mapping the saved generation.
+    """
+    import os
+    import shutil
+    import tempfile
+
+    from signlink.retrieval import FaqRetriever
+
+    rng = np.random.default_rng(12)
+    vocabulary = ["".join(rng.choice(list("abcdefghijklmnopqrstuvwxyz"), rng.integers(4, 10))) for _ in range(5000)]
+
+    def sentence(words):
+        return " ".join(vocabulary[min(int(i), len(vocabulary)) - 1] for i in rng.zipf(1.3, words))
+
+    rows = []
+    for count in document_counts:
+        root = tempfile.mkdtemp()
+        corpus = os.path.join(root, "faq", "enterprise")
+        os.makedirs(corpus)
+        per_file = count // files
+        for number in range(files):
+            with open(os.path.join(corpus, f"part{number}.md"), "w") as handle:
+                for _ in range(per_file):
+                    handle.write(f"## {sentence(8)}?\n{sentence(60)}\n\n")
+
+        retriever = FaqRetriever(os.path.join(root, "faq"), os.path.join(root, "index"), refresh_interval=0.0)
+        start = time.perf_counter()
+        retriever.refresh("enterprise")
+        build_ms = (time.perf_counter() - start) * 1000
+
+        with open(os.path.join(corpus, "part0.md"), "a") as handle:
+            handle.write(f"## {sentence(8)}?\n{sentence(60)}\n")
+        tokenized = retriever.tokenized
+        start = time.perf_counter()
+        retriever.refresh("enterprise")
+        rebuild_ms = (time.perf_counter() - start) * 1000
+        retokenized = retriever.tokenized - tokenized
+
+        reopened = FaqRetriever(os.path.join(root, "faq"), os.path.join(root, "index"))
+        start = time.perf_counter()
+        reopened.refresh("enterprise")
+        open_ms = (time.perf_counter() - start) * 1000
+
+        index = reopened.index("enterprise")
+        texts = [sentence(int(rng.integers(3, 9))) for _ in range(queries)]
+        timings = _sample(lambda i: index.search(texts[i], 3), queries)
+        p50, p99 = np.percentile(timings / 1000, [50, 99])
+        rows.append({
+            "documents": len(index.documents),
+            "terms": len(index.terms),
+            "build_ms": build_ms,
+            "rebuild_ms": rebuild_ms,
+            "retokenized": retokenized,
+            "open_ms": open_ms,
+            "query_p50_us": p50,
+            "query_p99_us": p99,
+        })
+        shutil.rmtree(root, ignore_errors=True)
+    return rows
+
+# ==================== STREAMED REPLIES ====================
+def bench_streaming(words=40, token_delays_ms=(0.0, 5.0, 20.0), replies=5):
+    """Time to first token and total time, blocking vs streamed, plus cancellation latency
+
+    The engine stands in for a heavier local model producing one word every
+    ``token_delay`` ms.  A blocking reply shows nothing until the last word;
+    a streamed one shows the first word as soon as it exists.
+    """
+    import threading
+
+    from signlink.streaming import ResponseStream, StreamMetrics, word_chunks
+
+    text = " ".join(f"word{i}" for i in range(words))
+
+    def engine(delay):
+        for chunk in word_chunks(text):
+            if delay:
+                time.sleep(delay)
+            yield chunk
+
+    rows = []
+    for delay_ms in token_delays_ms:
+        delay = delay_ms / 1000
+        blocking = []
+        for _ in range(replies):
+            start = time.perf_counter()
+            "".join(engine(delay))
+            blocking.append(time.perf_counter() - start)
+
+        metrics = StreamMetrics()
+        for _ in range(replies):
+            for _ in ResponseStream(engine(delay), metrics=metrics):
+                pass
+        stats = metrics.stats()
+
+        # Cancel from another thread halfway through and time until iteration stops
+        stream = ResponseStream(engine(delay))
+        cancelled_at = []
+        timer = threading.Timer(words * delay / 2, lambda: (cancelled_at.append(time.perf_counter()), stream.cancel()))
+        timer.start()
+        for _ in stream:
+            pass
+        timer.join()
+        rows.append({
+            "token_delay_ms": delay_ms,
+            "blocking_first_ms": float(np.median(blocking)) * 1000,
+            "streamed_first_ms": stats["ttft_p50_ms"],
+            "streamed_total_ms": stats["total_p50_ms"],
+            "words_before_cancel": len(stream.parts),
+            "cancel_latency_ms": (stream.finished_at - cancelled_at[0]) * 1000 if cancelled_at else None,
+        })
+    plain = list(word_chunks(text * 25))
+    wrapped = _time_per_call(lambda: list(ResponseStream(plain)), 3, 0.1)
+    bare = _time_per_call(lambda: list(iter(plain)), 3, 0.1)
+    rows.append({"chunks": len(plain), "wrapper_us_per_chunk": (wrapped - bare) / len(plain) * 1e6})
+    return rows
+
+# ==================== TEXT BUFFER ====================
+def bench_textbuffer(lengths=(1_000, 10_000, 100_000), edits=5_000, backspace_rate=0.1):
+    """Per-edit and per-render cost of typed text: a str in session state vs TextBuffer
+
+    Starts from a session of each length and applies ``edits`` typed letters
+    with some backspaces.  The str lives on a state object, as ``typed_text``
+    did, so every edit copies it.  ``render_after_edit_us`` is one edit plus
+    serializing for display; ``render_unchanged_us`` is a rerun with no edit.
+    """
+    from types import SimpleNamespace
+
+    from signlink.textbuffer import TextBuffer
+
+    rng = np.random.default_rng(10)
+    rows = []
+    for length in lengths:
+        initial = "".join(rng.choice(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ "), length))
+        backspaces = rng.random(edits) < backspace_rate
+
+        state = SimpleNamespace(typed_text=initial)
+        start = time.perf_counter()
+        for backspace in backspaces:
+            if backspace:
+                state.typed_text = state.typed_text[:-1]
+            else:
+                state.typed_text += "A"
+        text = state.typed_text
+        str_us = (time.perf_counter() - start) / edits * 1e6
+
+        buffer = TextBuffer(initial)
+        start = time.perf_counter()
+        for backspace in backspaces:
+            if backspace:
+                buffer.delete()
+            else:
+                buffer.insert("A")
+        edit_us = (time.perf_counter() - start) / edits * 1e6
+        assert buffer.text == text
+        render_changed = _time_per_call(lambda: (buffer.insert("A"), buffer.text, buffer.delete()), 3, 0.05) / 2
+        render_unchanged = _time_per_call(lambda: buffer.text, 3, 0.05)
+        undo = _time_per_call(lambda: (buffer.undo(), buffer.redo()), 3, 0.05) / 2
+        rows.append({
+            "length": length,
+            "str_edit_us": str_us,
+            "buffer_edit_us": edit_us,
+            "render_after_edit_us": render_changed * 1e6,
+            "render_unchanged_us": render_unchanged * 1e6,
+            "undo_us": undo * 1e6,
+        })
+    return rows
+
+# ==================== NOTIFICATIONS ====================
+def bench_notify(messages=2000, pool_sizes=(1, 2, 4), server_delay=0.0):
+    """SMTP dispatcher throughput and enqueue-to-send latency against a local server"""
+    from datetime import datetime
+
+    from signlink.localsmtp import LocalSMTPServer
+    from signlink.notify import NotificationDispatcher
+
+    notification = {"gesture": "H", "name": "Help", "description": "Request assistance",
+                    "timestamp": datetime.now(), "emergency": True, "hold_duration": 0.0}
+    rows = []
+    for workers in pool_sizes:
+        with LocalSMTPServer(delay=server_delay) as server:
+            dispatcher = NotificationDispatcher(server.config(), workers=workers, max_queue=messages)
+            start = time.perf_counter()
+            enqueue = _sample(lambda i: dispatcher.submit(notification), messages, warmup=0)
+            dispatcher.flush()
+            elapsed = time.perf_counter() - start
+            stats = dispatcher.stats()
+            dispatcher.close()
+            rows.append({
+                "workers": workers,
+                "messages_per_second": stats["sent"] / elapsed,
+                "enqueue_p99_us": float(np.percentile(enqueue, 99)) / 1000,
+                "latency_p50_ms": stats["latency_p50_ms"],
+                "latency_p95_ms": stats["latency_p95_ms"],
+                "connections": server.connections,
+            })
+    return rows
+
+# ==================== HISTORY BUFFERS ====================
+def bench_history(notifications=1_000_000, capacity=1000, emergency_rate=0.05):
+    """Memory and query cost of a bounded notification history vs an unbounded list"""
+    import tracemalloc
+    from datetime import datetime
+
+    from signlink.recognizer import is_emergency
+    from signlink.ringbuffer import RingBuffer
+
+    timestamp = datetime.now()
+    emergencies = np.random.default_rng(4).random(notifications) < emergency_rate
+
+    def fill(store, count):
+        for i in range(count):
+            store.append({"gesture": "W", "name": "Water", "description": "Request water",
+                          "timestamp": timestamp, "emergency": bool(emergencies[i]),
+                          "hold_duration": 0.0, "count": 1})
+
+    rows = []
+    for name, store, count in (("ring", RingBuffer(capacity, flag=is_emergency), notifications),
+                               ("list", [], notifications // 10)):
+        tracemalloc.start()
+        start = time.perf_counter()
+        fill(store, count)
+        append_us = (time.perf_counter() - start) / count * 1e6
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        if name == "ring":
+            last = _time_per_call(lambda: store.last(5), 3, 0.05)
+            last_emergency = _time_per_call(lambda: store.last_flagged(3), 3, 0.05)
+        else:
+            last = _time_per_call(lambda: store[-5:], 3, 0.05)
+            last_emergency = _time_per_call(lambda: [n for n in store if n["emergency"]][-3:], 3, 0.05)
+        rows.append({
+            "store": name,
+            "appended": count,
+            "retained": len(store),
+            "memory_mb": current / 2**20,
+            "peak_mb": peak / 2**20,
+            "append_us": append_us,
+            "last5_us": last * 1e6,
+            "last3_emergency_us": last_emergency * 1e6,
+        })
+    return rows
+
+# ==================== NOTIFICATION LOG ====================
+def bench_notifylog(events=1_000_000, patients=30, days=365, emergency_rate=0.05, path=None):
+    """Write throughput and query latency of the durable log over a year of ward history"""
+    import os
+    import tempfile
+
+    from signlink.notifylog import NotificationLog
+
+    rng = np.random.default_rng(5)
+    end = time.time()
+    start = end - days * 86400
+    timestamps = np.sort(rng.uniform(start, end, events))
+    emergency = rng.random(events) < emergency_rate
+    patient_ids = rng.integers(0, patients, events)
+    directory = tempfile.mkdtemp() if path is None else None
+    log = NotificationLog(path or os.path.join(directory, "notifications.db"))
+
+    begin = time.perf_counter()
+    for i in range(events):
+        log.append({"timestamp": float(timestamps[i]), "patient": f"bed-{patient_ids[i]}", "gesture": "W",
+                    "name": "Water", "description": "Request water", "emergency": bool(emergency[i]),
+                    "hold_duration": 0.0})
+    enqueued = time.perf_counter() - begin
+    log.flush(None)  # a million rows can take longer than the default timeout
+    written = time.perf_counter() - begin
+    # Staff acknowledged every emergency except those in the last six hours
+    acked = np.flatnonzero(emergency & (timestamps < end - 6 * 3600)) + 1
+    log.acknowledge(acked.tolist())
+    log.flush(None)
+
+    queries = {
+        "last_hour": lambda: log.between(end - 3600, end),
+        "patient_day": lambda: log.between(end - 86400, end, patient="bed-7"),
+        "emergencies_week": lambda: log.emergencies(end - 7 * 86400, end),
+        "open_emergencies": lambda: log.open_emergencies(),
+    }
+    rows = [{"operation": "append", "events": events, "enqueue_us": enqueued / events * 1e6,
+             "events_per_second": events / written}]
+    for name, query in queries.items():
+        rows.append({"operation": name, "rows": len(query()), "ms": _time_per_call(query, 3, 0.1) * 1000})
+    log.close()
+    return rows
+
+# ==================== STAGE SUITE ====================
+def _percentiles(samples_ns):
+    samples = np.asarray(samples_ns, dtype=np.float64) / 1e6
+    p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+    return {"samples": len(samples), "p50_ms": p50, "p95_ms": p95, "p99_ms": p99,
+            "mean_ms": float(samples.mean())}
+
+
+def _sample(func, samples, warmup=20):
+    """Per-call latencies in nanoseconds; ``func`` receives the iteration index"""
+    for i in range(warmup):
+        func(i)
+    timings = np.empty(samples, dtype=np.int64)
+    for i in range(samples):
+        start = time.perf_counter_ns()
+        func(i)
+        timings[i] = time.perf_counter_ns() - start
+    return timings
+
+
+def _stage_inputs(samples):
+    from signlink.features import LETTERS, template_landmarks
+
+    rng = np.random.default_rng(1)
+    letters = [LETTERS[i % len(LETTERS)] for i in range(samples)]
+    landmarks = np.concatenate([template_landmarks(letter, 1, 0.004, rng) for letter in letters])
+    return letters, landmarks
+
+
+def _frame_codec():
+    """JPEG bytes of a camera-sized frame and a decoder, or None without OpenCV"""
+    try:
+        import cv2
+    except ImportError:
+        return None
+    rng = np.random.default_rng(2)
+    image = rng.integers(0, 255, (480, 640, 3), dtype=np.uint8)
+    image[::8] = 0
+    ok, encoded = cv2.imencode(".jpg", image)
+    return encoded, lambda: cv2.imdecode(encoded, cv2.IMREAD_COLOR)
+
+
+def _landmarker():
+    try:
+        from signlink.capture import MediaPipeHands
+        return MediaPipeHands()
+    except ImportError:
+        return None
+
+
+def bench_stages(samples=2000):
+    """Latency percentiles for each stage of the recognition and dispatch path"""
+    from signlink.features import default_classifier
+    from signlink.recognizer import GestureRecognizer, RecognizerState
+
+    classifier = default_classifier()
+    letters, landmarks = _stage_inputs(samples)
+    state = RecognizerState()
+    recognizer = GestureRecognizer(state, clock=time.time, open_url=lambda url: None)
+    recognizer.use_labels(classifier.labels)
+    probabilities = classifier.predict_proba(landmarks)
+    codec = _frame_codec()
+    landmarker = _landmarker()
+    stages = {}
+
+    if codec is not None:
+        decode = codec[1]
+        stages["decode"] = _sample(lambda i: decode(), min(samples, 500))
+        if landmarker is not None:
+            image = decode()
+            stages["landmarks"] = _sample(lambda i: landmarker.process(image), min(samples, 200))
+    stages["classify"] = _sample(lambda i: classifier(landmarks[i]), samples)
+
+    # Smoothing alone: hold the cooldown open so nothing commits
+    def smooth(i):
+        state.last_gesture_time = time.time()
+        recognizer.observe(i, probabilities[i])
+    stages["smoothing"] = _sample(smooth, samples)
+
+    def dispatch(i):
+        if len(recognizer.buffer) > 256:
+            state.text_buffers.clear()
+        recognizer.process_gesture(letters[i])
+    stages["dispatch"] = _sample(dispatch, samples)
+
+    # Emergency gesture through to the event bus's email queue (enqueue only)
+    from signlink.localsmtp import LocalSMTPServer
+    from signlink.notify import NotificationDispatcher
+
+    with LocalSMTPServer() as server:
+        dispatcher = NotificationDispatcher(server.config(), max_queue=samples + 100)
+        healthcare = RecognizerState(current_sector="healthcare")
+        notifier = GestureRecognizer(healthcare, clock=time.time, open_url=lambda url: None,
+                                     notifier=dispatcher)
+        def notify(i):
+            if len(healthcare.email_notifications) > 256:
+                healthcare.email_notifications.clear()
+            notifier.process_healthcare_gesture("H")
+        stages["notify"] = _sample(notify, samples)
+        notifier.bus.close(10.0)
+        dispatcher.close()
+
+    def end_to_end(i):
+        if codec is not None:
+            image = codec[1]()
+            if landmarker is not None:
+                landmarker.process(image)
+        proba = classifier.predict_proba(landmarks[i])[0]
+        state.last_gesture_time = 0
+        if recognizer.observe(i, proba) and len(recognizer.buffer) > 256:
+            state.text_buffers.clear()
+    stages["end_to_end"] = _sample(end_to_end, min(samples, 200 if landmarker else 500))
+
+    recognizer.bus.close()
+    if landmarker is not None:
+        landmarker.close()
+    results = {name: _percentiles(timings) for name, timings in stages.items()}
+    # Without a codec or MediaPipe, end_to_end skipped decoding or landmark extraction
+    results["end_to_end"]["full_pipeline"] = codec is not None and landmarker is not None
+    return results
+
+
+def measure_accuracy(datasets=(), sessions=20, frames_per_letter=60, seed=3):
+    """Frame and commit accuracy from labelled replays
+
+    Uses labelled ``.npz`` dumps when given, otherwise noisy renderings of
+    the built-in letter templates the default classifier was fitted on; the
+    result's ``source`` says which.
+    """
+    from signlink.features import LETTERS, template_landmarks
+    from signlink.replay import load_landmarks, merge_reports, replay_session
+
+    reports = []
+    if datasets:
+        for path in datasets:
+            landmarks, timestamps, labels = load_landmarks(path)
+            reports.append(replay_session(landmarks, timestamps, frame_labels=labels))
+    else:
+        rng = np.random.default_rng(seed)
+        gap = np.full((frames_per_letter // 2, 21, 3), np.nan, np.float32)
+        for _ in range(sessions):
+            order = rng.permutation(LETTERS)
+            chunks, labels = [], []
+            for letter in order:
+                chunks += [template_landmarks(letter, frames_per_letter, 0.006, rng), gap]
+                labels += [letter] * frames_per_letter + [""] * len(gap)
+            landmarks = np.concatenate(chunks)
+            timestamps = np.arange(len(landmarks)) / 30.0
+            reports.append(replay_session(landmarks, timestamps, frame_labels=np.array(labels)))
+    summary = merge_reports(reports)
+    letters = summary["letters"].values()
+    frames = sum(entry["frames"] for entry in letters)
+    segments = sum(entry["segments"] for entry in letters)
+    return {
+        "source": "datasets" if datasets else "synthetic",
+        "sessions": summary["sessions"],
+        "frames": frames,
+        "frame_accuracy": sum(entry["frame_correct"] for entry in letters) / frames if frames else 0.0,
+        "commit_accuracy": sum(entry["segments_committed"] for entry in letters) / segments if segments else 0.0,
+        "false_commits": summary["false_commits"],
+        "mean_time_to_commit_ms": summary["mean_time_to_commit"] * 1000,
+        "replay_frames_per_second": summary["frames_per_second"],
+    }
+
+
+def run_suite(output=None, datasets=(), samples=2000):
+    """Run every stage benchmark plus accuracy and write the results file"""
+    from signlink.metrics import save_results
+
+    results = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "stages": bench_stages(samples),
+        "accuracy": measure_accuracy(datasets),
+    }
+    save_results(results, output)
+    return results
+
+
+def bench_suite(output=None, datasets=()):
+    results = run_suite(output, datasets)
+    rows = [dict(stage=name, **{k: v for k, v in stats.items() if k != "mean_ms"})
+            for name, stats in results["stages"].items()]
+    rows.append(dict(stage="accuracy", **{k: v for k, v in results["accuracy"].items()}))
+    return rows
+
+# ==================== CLI ====================
+BENCHMARKS = {
+    "assistant": bench_assistant,
+    "bus": bench_bus,
+    "classifier": bench_classifier,
+    "completion": bench_completion,
+    "dispatch": bench_dispatch,
+    "eventserver": bench_eventserver,
+    "headless": bench_headless,
+    "history": bench_history,
+    "notify": bench_notify,
+    "notifylog": bench_notifylog,
+    "pool": bench_pool,
+    "retrieval": bench_retrieval,
+    "roi": bench_roi,
+    "scheduler": bench_scheduler,
+    "sessions": bench_sessions,
+    "streaming": bench_streaming,
+    "suite": bench_suite,
+    "textbuffer": bench_textbuffer,
+    "triggers": bench_triggers,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SignLink recognition benchmarks")
+    parser.add_argument("names", nargs="*", metavar="name",
+                        help=f"benchmarks to run: {', '.join(sorted(BENCHMARKS))} (default: all)")
+    parser.add_argument("--output", help="results file written by the suite benchmark")
+    parser.add_argument("--dataset", action="append", default=[],
+                        help="labelled .npz landmark dump used for suite accuracy (repeatable)")
+    args = parser.parse_args(argv)
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmark: {', '.join(sorted(unknown))}")
+    for name in args.names or sorted(BENCHMARKS):
+        print(f"== {name}")
+        rows = bench_suite(args.output, args.dataset) if name == "suite" else BENCHMARKS[name]()
+        for row in rows:
+            print("  " + "  ".join(f"{key}={value:.4g}" if isinstance(value, float) else f"{key}={value}"
+                                   for key, value in row.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""Declarative gesture bindings compiled into a constant-time dispatch table.
+
+One JSON file (``gestures.json`` next to this module, or ``SIGNLINK_GESTURES``)
+describes the sectors, their quick actions and patient requests, the input
+modes, and which action every gesture runs.  Bindings are grouped by sector
+("*" applies to every sector) and mode, and a key is one gesture or a letter
+range such as ``A-Z``; sector entries override "*" and single gestures
+override ranges.  Compiling flattens all of it into one
+``(sector, mode, gesture) -> Binding`` dict, so dispatching a recognized
+gesture is a single lookup however many bindings there are.
+
+``quick_action`` and ``request`` bindings without an explicit target are
+resolved at compile time to the sector's quick action or request signed
+with that letter; letters with none stay unbound.
+
+``BindingsFile`` recompiles the file when it changes, so edits take effect
+without restarting the app.  Its ``overrides`` (bindings in the file's
+format) replace the file's entries with the same sector, mode and key, so an
+app can change a few gestures and still follow edits to the rest.  A change that fails to load keeps the previous
+bindings in effect.
+"""
+import functools
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import namedtuple
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+GESTURE_CONFIG = os.environ.get("SIGNLINK_GESTURES", os.path.join(_HERE, "gestures.json"))
+
+LETTERS = tuple("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+GESTURES = LETTERS + ("SPACE", "ENTER", "BACKSPACE", "SWIPE_LEFT", "SWIPE_RIGHT")
+
+# Handler name -> (required parameters, optional parameters)
+ACTIONS = {
+    "type": ((), ("text",)),
+    "delete": ((), ("count",)),
+    "complete": ((), ("fallback_mode",)),
+    "move_cursor": (("offset",), ()),
+    "slide": (("step",), ()),
+    "request": ((), ()),
+    "quick_action": ((), ("name",)),
+    "set_mode": (("mode",), ()),
+}
+
+Binding = namedtuple("Binding", "action params feedback")
+
+
+class ConfigError(ValueError):
+    """The gesture configuration is malformed"""
+
+
+def expand(key):
+    """The gestures a binding key names: one gesture or a letter range like ``A-Z``"""
+    if key in GESTURES:
+        return (key,)
+    first, dash, last = key.partition("-")
+    if dash and first in LETTERS and last in LETTERS and first <= last:
+        return LETTERS[LETTERS.index(first):LETTERS.index(last) + 1]
+    raise ConfigError(f"unknown gesture {key!r}")
+
+
+class GestureBindings:
+    """A compiled gesture configuration, shared read-only by all sessions"""
+
+    def __init__(self, config, signature=""):
+        self.signature = signature
+        self.sectors = config["sectors"]
+        self.modes = config["modes"]
+        self.default_mode = config.get("default_mode", "type")
+        self.quick_actions = {sector: config.get("quick_actions", {}).get(sector, []) for sector in self.sectors}
+        self.requests = {sector: config.get("requests", {}).get(sector, {}) for sector in self.sectors}
+        if self.default_mode not in self.modes:
+            raise ConfigError(f"default mode {self.default_mode!r} is not in modes")
+
+        self._quick_by_name = {}
+        self._quick_by_gesture = {}
+        for sector, actions in self.quick_actions.items():
+            for action in actions:
+                self._quick_by_name[sector, action["name"]] = action
+                if action.get("gesture"):
+                    for gesture in expand(action["gesture"]):
+                        self._quick_by_gesture[sector, gesture] = action
+        self._one_shot = frozenset(mode for mode, info in self.modes.items() if info.get("one_shot"))
+        self.table = self._compile(config.get("bindings", {}))
+
+    def _compile(self, bindings):
+        unknown = set(bindings) - set(self.sectors) - {"*"}
+        if unknown:
+            raise ConfigError(f"bindings for unknown sectors: {', '.join(sorted(unknown))}")
+        table = {}
+        for sector in self.sectors:
+            for layer in (bindings.get("*", {}), bindings.get(sector, {})):
+                for mode, entries in layer.items():
+                    if mode not in self.modes:
+                        raise ConfigError(f"bindings for unknown mode {mode!r}")
+                    # Ranges first, so single gestures override them
+                    for key in sorted(entries, key=lambda key: key in GESTURES):
+                        for gesture in expand(key):
+                            binding = self._binding(sector, gesture, entries[key])
+                            if binding is None:
+                                table.pop((sector, mode, gesture), None)
+                            else:
+                                table[sector, mode, gesture] = binding
+        return table
+
+    def _binding(self, sector, gesture, entry):
+        """The Binding for one gesture, or None if its target does not exist in the sector"""
+        entry = dict(entry)
+        action = entry.pop("action", None)
+        feedback = entry.pop("feedback", None)
+        if action not in ACTIONS:
+            raise ConfigError(f"unknown action {action!r} for {gesture}")
+        required, optional = ACTIONS[action]
+        missing = set(required) - set(entry)
+        extra = set(entry) - set(required) - set(optional)
+        if missing or extra:
+            raise ConfigError(f"{action} for {gesture}: missing {sorted(missing)}, unexpected {sorted(extra)}")
+        for key in ("mode", "fallback_mode"):
+            if key in entry and entry[key] not in self.modes:
+                raise ConfigError(f"{action} for {gesture}: unknown mode {entry[key]!r}")
+
+        if action == "quick_action":
+            found = (self._quick_by_name.get((sector, entry["name"])) if "name" in entry
+                     else self._quick_by_gesture.get((sector, gesture)))
+            if found is None:
+                return None
+            entry["name"] = found["name"]
+        elif action == "request" and gesture not in self.requests[sector]:
+            return None
+        return Binding(action, entry, feedback)
+
+    def current(self):
+        return self
+
+    def lookup(self, sector, mode, gesture):
+        """The Binding for a gesture in a sector and mode, or None if it is unbound"""
+        return self.table.get((sector, mode, gesture))
+
+    def one_shot(self, mode):
+        """True if the mode reverts to the default after one gesture"""
+        return mode in self._one_shot
+
+    def quick_action(self, sector, name):
+        return self._quick_by_name.get((sector, name))
+
+    def request(self, sector, gesture):
+        return self.requests.get(sector, {}).get(gesture)
+
+
+def load_bindings(path=GESTURE_CONFIG, overrides=None):
+    """Read and compile a gesture configuration file, with ``overrides`` layered over its bindings"""
+    with open(path, "rb") as handle:
+        data = handle.read()
+    try:
+        config = json.loads(data)
+        signature = hashlib.sha1(data).hexdigest()[:12]
+        if overrides:
+            bindings = config.setdefault("bindings", {})
+            for sector, modes in overrides.items():
+                for mode, entries in modes.items():
+                    bindings.setdefault(sector, {}).setdefault(mode, {}).update(entries)
+            signature += "+" + hashlib.sha1(json.dumps(overrides, sort_keys=True).encode()).hexdigest()[:6]
+        return GestureBindings(config, signature)
+    except (KeyError, TypeError, AttributeError) as exc:
+        raise ConfigError(f"malformed gesture configuration: {exc!r}") from exc
+
+
+class BindingsFile:
+    """The compiled bindings of a config file, recompiled when the file changes
+
+    The file is checked at most every ``refresh_interval`` seconds, when the
+    bindings are asked for.
+    """
+
+    def __init__(self, path=GESTURE_CONFIG, refresh_interval=1.0, clock=time.monotonic, overrides=None):
+        self.path = path
+        self.overrides = overrides
+        self.refresh_interval = refresh_interval
+        self.clock = clock
+        self._bindings = None
+        self._key = None
+        self._checked = None
+        self._lock = threading.Lock()
+        self.reloads = 0
+        self.error = None
+
+    def current(self):
+        """The latest bindings that compiled, refreshed first if the check is due"""
+        if self._bindings is None or self.clock() - self._checked >= self.refresh_interval:
+            self.refresh()
+        return self._bindings
+
+    def refresh(self):
+        """Recompile if the file changed; True if new bindings took effect
+
+        The first load raises if the file is missing or invalid; later
+        failures are reported in ``error`` and the old bindings stay.
+        """
+        with self._lock:
+            self._checked = self.clock()
+            try:
+                stat = os.stat(self.path)
+                key = (stat.st_mtime_ns, stat.st_size)
+                if key == self._key:
+                    return False
+                bindings = load_bindings(self.path, self.overrides)
+            except (OSError, ValueError) as exc:
+                if self._bindings is None:
+                    raise
+                if self.error != str(exc):
+                    print(f"Gesture config {self.path} not reloaded: {exc}", file=sys.stderr)
+                self.error = str(exc)
+                return False
+            self._key = key
+            self._bindings = bindings
+            self.error = None
+            self.reloads += 1
+            return True
+
+
+@functools.lru_cache(maxsize=1)
+def default_bindings():
+    """Process-wide bindings of GESTURE_CONFIG, reloaded when it changes"""
+    return BindingsFile()
@@ -0,0 +1,444 @@
+"""Frame capture and hand-landmark extraction running off the Streamlit thread."""
+import threading
+import time
+from collections import deque, namedtuple
+
+import numpy as np
+
+Frame = namedtuple("Frame", "index timestamp image landmarks")
+Result = namedtuple("Result", "index timestamp landmarks gesture confidence proba latency")
+
+# ==================== FRAME QUEUE ====================
+class LatestQueue:
+    """Bounded queue that drops the oldest frame instead of blocking the producer"""
+
+    def __init__(self, maxsize=2):
+        self._items = deque(maxlen=maxsize)
+        self._cond = threading.Condition()
+        self.dropped = 0
+
+    def put(self, item):
+        with self._cond:
+            if len(self._items) == self._items.maxlen:
+                self.dropped += 1
+            self._items.append(item)
+            self._cond.notify()
+
+    def get(self, timeout=None):
+        """Return the oldest queued item, or None on timeout"""
+        with self._cond:
+            if not self._items and not self._cond.wait_for(lambda: self._items, timeout):
+                return None
+            return self._items.popleft()
+
+    def __len__(self):
+        return len(self._items)
+
+# ==================== FRAME SOURCES ====================
+class CameraSource:
+    """Live webcam frames via OpenCV"""
+
+    def __init__(self, device=0, width=640, height=480, fps=30):
+        import cv2
+        self._capture = cv2.VideoCapture(device)
+        self._capture.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self._capture.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        self._capture.set(cv2.CAP_PROP_FPS, fps)
+        self._capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        if not self._capture.isOpened():
+            raise RuntimeError(f"Cannot open camera {device}")
+        self.fps = fps
+        self._index = 0
+
+    def read(self):
+        ok, image = self._capture.read()
+        if not ok:
+            return None
+        frame = Frame(self._index, time.monotonic(), image, None)
+        self._index += 1
+        return frame
+
+    def close(self):
+        self._capture.release()
+
+
+class VideoFileSource:
+    """Frames decoded from a recorded clip, optionally paced at the clip frame rate"""
+
+    def __init__(self, path, realtime=True, loop=False):
+        import cv2
+        self._cv2 = cv2
+        self.path = path
+        self._capture = cv2.VideoCapture(str(path))
+        if not self._capture.isOpened():
+            raise RuntimeError(f"Cannot open video file {path}")
+        self.fps = self._capture.get(cv2.CAP_PROP_FPS) or 30.0
+        self.realtime = realtime
+        self.loop = loop
+        self._index = 0
+        self._next_due = None
+
+    def read(self):
+        ok, image = self._capture.read()
+        if not ok and self.loop:
+            self._capture.set(self._cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, image = self._capture.read()
+        if not ok:
+            return None
+        self._next_due = _pace(self._next_due, self.fps, self.realtime)
+        frame = Frame(self._index, self._index / self.fps, image, None)
+        self._index += 1
+        return frame
+
+    def close(self):
+        self._capture.release()
+
+
+class SyntheticSource:
+    """Blank frames carrying precomputed landmarks, for running without a camera
+
+    ``landmarks`` is an array of shape (n, 21, 3); rows filled with NaN mean
+    "no hand in view".  Such frames carry no image, so no landmark model is
+    needed.  Without landmarks the source emits blank images forever.
+    """
+
+    def __init__(self, landmarks=None, fps=30, size=(480, 640), realtime=True, loop=False):
+        self.landmarks = None if landmarks is None else np.asarray(landmarks, dtype=np.float32)
+        self.fps = fps
+        self.realtime = realtime
+        self.loop = loop
+        self._image = np.zeros(size + (3,), dtype=np.uint8)
+        self._index = 0
+        self._next_due = None
+
+    def read(self):
+        points = None
+        if self.landmarks is not None:
+            position = self._index
+            if position >= len(self.landmarks):
+                if not self.loop or not len(self.landmarks):
+                    return None
+                position %= len(self.landmarks)
+            points = self.landmarks[position]
+            if np.isnan(points).any():
+                points = None
+        self._next_due = _pace(self._next_due, self.fps, self.realtime)
+        image = self._image if self.landmarks is None else None
+        frame = Frame(self._index, self._index / self.fps, image, points)
+        self._index += 1
+        return frame
+
+    def close(self):
+        pass
+
+
+def _pace(next_due, fps, realtime):
+    """Sleep until the next frame is due and return the following deadline"""
+    if not realtime:
+        return None
+    now = time.monotonic()
+    if next_due is None:
+        return now + 1.0 / fps
+    if next_due > now:
+        time.sleep(next_due - now)
+    return max(next_due, now) + 1.0 / fps
+
+def _scaled(frame, scale):
+    """Frame with its image downscaled by ``scale`` (landmarks are resolution-free)"""
+    if scale >= 1.0 or frame.image is None:
+        return frame
+    try:
+        import cv2
+    except ImportError:
+        step = max(1, round(1 / scale))
+        return frame._replace(image=frame.image[::step, ::step])
+    height, width = frame.image.shape[:2]
+    size = (max(1, int(width * scale)), max(1, int(height * scale)))
+    return frame._replace(image=cv2.resize(frame.image, size, interpolation=cv2.INTER_AREA))
+
+# ==================== LANDMARK EXTRACTION ====================
+class MediaPipeHands:
+    """Single-hand 21-point landmark extractor backed by MediaPipe Hands"""
+
+    def __init__(self, model_complexity=0, min_detection_confidence=0.5, min_tracking_confidence=0.5,
+                 static_image_mode=False):
+        import cv2
+        import mediapipe as mp
+        self._cv2 = cv2
+        self._hands = mp.solutions.hands.Hands(
+            static_image_mode=static_image_mode,
+            max_num_hands=1,
+            model_complexity=model_complexity,
+            min_detection_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence,
+        )
+
+    def process(self, image):
+        """Return a (21, 3) float32 array of normalized landmarks, or None"""
+        rgb = self._cv2.cvtColor(image, self._cv2.COLOR_BGR2RGB)
+        rgb.flags.writeable = False
+        results = self._hands.process(rgb)
+        if not results.multi_hand_landmarks:
+            return None
+        hand = results.multi_hand_landmarks[0].landmark
+        return np.array([(p.x, p.y, p.z) for p in hand], dtype=np.float32)
+
+    def close(self):
+        self._hands.close()
+
+
+class RoiTracker:
+    """Runs a landmarker on a padded crop around the last hand instead of the full frame
+
+    After a full-frame detection, each frame is cropped to a square around
+    the previous hand's bounding box grown by ``padding`` on every side.  If
+    the crop yields no hand, the same frame is re-detected on the full image
+    and tracking restarts from there.  The inner landmarker should not track
+    on its own (e.g. ``MediaPipeHands(static_image_mode=True)``), since the
+    crop moves under it.  The box is kept as fractions of the frame, so it
+    stays on the hand when the scheduler changes the frame resolution.
+    Counters report how often the crop was enough and what each frame cost.
+    """
+
+    def __init__(self, landmarker, padding=0.3, min_size=96):
+        self.landmarker = landmarker
+        self.padding = padding
+        self.min_size = min_size
+        self.box = None  # (x0, y0, x1, y1) as fractions of the frame size
+        self.frames = 0
+        self.tracked = 0
+        self.redetections = 0
+        self.pixels = 0
+        self.full_pixels = 0
+        self.seconds = 0.0
+
+    def process(self, image):
+        """Return (21, 3) landmarks normalized to the full frame, or None"""
+        started = time.perf_counter()
+        height, width = image.shape[:2]
+        self.frames += 1
+        self.full_pixels += height * width
+        landmarks = None
+        if self.box is not None:
+            x0, y0, x1, y1 = self._pixels(self.box, width, height)
+            self.pixels += (x1 - x0) * (y1 - y0)
+            landmarks = self.landmarker.process(image[y0:y1, x0:x1])
+            if landmarks is not None:
+                self.tracked += 1
+                scale = np.array([(x1 - x0) / width, (y1 - y0) / height, (x1 - x0) / width], np.float32)
+                offset = np.array([x0 / width, y0 / height, 0.0], np.float32)
+                landmarks = landmarks * scale + offset
+        if landmarks is None:
+            if self.box is not None:
+                self.redetections += 1
+            self.pixels += height * width
+            landmarks = self.landmarker.process(image)
+        self.box = None if landmarks is None else self._box(landmarks, width, height)
+        self.seconds += time.perf_counter() - started
+        return landmarks
+
+    def _box(self, landmarks, width, height):
+        """Square padded box around the landmarks, as fractions of a ``width`` x ``height`` frame"""
+        x = landmarks[:, 0] * width
+        y = landmarks[:, 1] * height
+        side = max(x.max() - x.min(), y.max() - y.min()) * (1 + 2 * self.padding)
+        side = int(min(max(side, self.min_size), width, height))
+        x0 = int(np.clip((x.min() + x.max() - side) / 2, 0, width - side))
+        y0 = int(np.clip((y.min() + y.max() - side) / 2, 0, height - side))
+        return x0 / width, y0 / height, (x0 + side) / width, (y0 + side) / height
+
+    @staticmethod
+    def _pixels(box, width, height):
+        """The box in pixels of a ``width`` x ``height`` frame, at least one pixel across"""
+        x0 = min(int(round(box[0] * width)), width - 1)
+        y0 = min(int(round(box[1] * height)), height - 1)
+        x1 = max(min(int(round(box[2] * width)), width), x0 + 1)
+        y1 = max(min(int(round(box[3] * height)), height), y0 + 1)
+        return x0, y0, x1, y1
+
+    def stats(self):
+        attempts = self.tracked + self.redetections
+        return {
+            "roi_hit_rate": self.tracked / attempts if attempts else 0.0,
+            "roi_pixel_fraction": self.pixels / self.full_pixels if self.full_pixels else 0.0,
+            "landmark_ms": self.seconds / self.frames * 1000 if self.frames else 0.0,
+        }
+
+    def close(self):
+        if hasattr(self.landmarker, "close"):
+            self.landmarker.close()
+
+
+def tracked_hands():
+    """MediaPipe Hands behind an RoiTracker; usable as an InferencePool landmarker factory"""
+    return RoiTracker(MediaPipeHands(static_image_mode=True))
+
+# ==================== RECOGNITION PIPELINE ====================
+class RecognitionPipeline:
+    """Capture and inference on background threads, exposing only the newest result
+
+    The capture thread reads the source as fast as it delivers and pushes into a
+    small drop-oldest queue, so a slow inference step never backs frames up.
+    The inference thread extracts landmarks, classifies them and publishes the
+    result with the full class probabilities for temporal smoothing; callers
+    on the UI thread only ever read ``latest()`` or ``drain()``.  With an ``InferencePool``,
+    frames go to a worker process instead and the second thread only
+    publishes what comes back.
+    """
+
+    def __init__(self, source, landmarker=None, classifier=None, queue_size=2, pool=None, roi_tracking=False,
+                 scheduler=None, backlog=64):
+        self.source = source
+        if roi_tracking and landmarker is not None and not isinstance(landmarker, RoiTracker):
+            landmarker = RoiTracker(landmarker)
+        self.landmarker = landmarker
+        self.roi_tracking = roi_tracking
+        self.scheduler = scheduler
+        self.classifier = classifier
+        self.pool = pool
+        self.stream = None
+        self.queue = LatestQueue(queue_size)
+        self._latest = None
+        self._recent = deque(maxlen=backlog)
+        self._lock = threading.Condition()  # notified on every published result
+        self._stop = threading.Event()
+        self._threads = []
+        self.frames_captured = 0
+        self.frames_processed = 0
+        self.source_exhausted = False
+        self._latency_total = 0.0
+        self._started_at = None
+
+    def start(self):
+        if self._threads:
+            return self
+        self._stop.clear()
+        self._started_at = time.monotonic()
+        if self.pool is not None:
+            self.stream = self.pool.open_stream()
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name="signlink-capture", daemon=True),
+            threading.Thread(target=self._inference_loop if self.stream is None else self._result_loop,
+                             name="signlink-inference", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self, timeout=2.0):
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+        self.source.close()
+        if self.landmarker is not None and hasattr(self.landmarker, "close"):
+            self.landmarker.close()
+
+    @property
+    def running(self):
+        return any(thread.is_alive() for thread in self._threads)
+
+    def latest(self):
+        """Newest recognition result, or None if nothing has been processed yet"""
+        with self._lock:
+            return self._latest
+
+    def drain(self, timeout=None):
+        """Results published since the last drain, oldest first (bounded by ``backlog``)
+
+        With a ``timeout``, waits up to that many seconds for a first result.
+        """
+        with self._lock:
+            if timeout and not self._recent:
+                self._lock.wait(timeout)
+            results = list(self._recent)
+            self._recent.clear()
+        return results
+
+    def stats(self):
+        elapsed = time.monotonic() - self._started_at if self._started_at else 0.0
+        processed = self.frames_processed
+        stats = {
+            "frames_captured": self.frames_captured,
+            "frames_processed": processed,
+            "frames_dropped": self.queue.dropped + (self.stream.dropped if self.stream is not None else 0),
+            "processed_fps": processed / elapsed if elapsed else 0.0,
+            "mean_latency_ms": self._latency_total / processed * 1000 if processed else 0.0,
+        }
+        if isinstance(self.landmarker, RoiTracker):
+            stats.update(self.landmarker.stats())
+        if self.scheduler is not None:
+            stats.update(self.scheduler.stats())
+        return stats
+
+    def _capture_loop(self):
+        while not self._stop.is_set():
+            frame = self.source.read()
+            if frame is None:
+                self.source_exhausted = True
+                break
+            self.frames_captured += 1
+            if self.scheduler is not None:
+                if not self.scheduler.admit():
+                    continue
+                frame = _scaled(frame, self.scheduler.scale)
+            if self.stream is not None:
+                self.stream.submit(frame)
+            else:
+                self.queue.put((frame, time.monotonic()))
+
+    def _inference_loop(self):
+        while not self._stop.is_set():
+            item = self.queue.get(timeout=0.1)
+            if item is None:
+                if self.source_exhausted and not len(self.queue):
+                    break
+                continue
+            frame, captured_at = item
+            self.publish(self.process_frame(frame, captured_at))
+
+    def _result_loop(self):
+        """Publish results coming back from an InferencePool stream"""
+        while not self._stop.is_set():
+            result = self.stream.results.get(timeout=0.1)
+            if result is None:
+                if self.source_exhausted and not self.stream.in_flight:
+                    break
+                continue
+            self.publish(result)
+
+    def process_frame(self, frame, captured_at=None):
+        """Run landmark extraction and classification for one frame"""
+        if captured_at is None:
+            captured_at = time.monotonic()
+        landmarks = frame.landmarks
+        if landmarks is None and frame.image is not None:
+            if self.landmarker is None:
+                self.landmarker = tracked_hands() if self.roi_tracking else MediaPipeHands()
+            landmarks = self.landmarker.process(frame.image)
+        gesture, confidence, proba = None, 0.0, None
+        if landmarks is not None and self.classifier is not None:
+            proba = self.classifier.predict_proba(landmarks)[0]
+            best = int(proba.argmax())
+            gesture, confidence = self.classifier.labels[best], float(proba[best])
+        return Result(frame.index, frame.timestamp, landmarks, gesture, confidence, proba,
+                      time.monotonic() - captured_at)
+
+    def publish(self, result):
+        with self._lock:
+            self._latest = result
+            self._recent.append(result)
+            self._lock.notify_all()
+        if self.scheduler is not None:
+            self.scheduler.observe(result.latency)
+        self.frames_processed += 1
+        self._latency_total += result.latency
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
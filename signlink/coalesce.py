@@ -0,0 +1,77 @@
+"""Coalescing and per-patient rate limiting of healthcare requests.
+
+Identical requests from one patient inside the merge window fold into the
+first notification as a repeat count.  New notifications draw from a
+per-patient token bucket; once it is empty, repeats fold into the patient's
+latest notification for that gesture or are suppressed.  Emergency
+notifications always pass straight through.
+"""
+NEW = "new"
+MERGED = "merged"
+LIMITED = "limited"
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously at ``rate`` tokens per second"""
+
+    def __init__(self, capacity, rate):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = float(capacity)
+        self.updated = None
+
+    def take(self, now, tokens=1):
+        if self.updated is not None:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+
+
+class NotificationCoalescer:
+    def __init__(self, window=60.0, burst=5, per_minute=2.0):
+        self.window = window
+        self.burst = burst
+        self.per_minute = per_minute
+        self._latest = {}   # (patient, gesture) -> (first_seen, notification)
+        self._buckets = {}  # patient -> TokenBucket
+        self.merged = 0
+        self.limited = 0
+
+    def offer(self, notification, now):
+        """Classify a notification as NEW, MERGED or LIMITED
+
+        Returns ``(outcome, notification)`` where the notification is the one
+        to show: the new one, or the earlier one it was folded into (with its
+        ``count`` incremented).  LIMITED with ``None`` means it was suppressed.
+        """
+        notification.setdefault("count", 1)
+        if notification["emergency"]:
+            return NEW, notification
+
+        patient = notification.get("patient")
+        key = (patient, notification["gesture"])
+        latest = self._latest.get(key)
+        if latest is not None and now - latest[0] <= self.window:
+            self.merged += 1
+            return MERGED, self._fold(latest[1], notification)
+
+        bucket = self._buckets.get(patient)
+        if bucket is None:
+            bucket = self._buckets[patient] = TokenBucket(self.burst, self.per_minute / 60.0)
+        if not bucket.take(now):
+            self.limited += 1
+            if latest is None:
+                return LIMITED, None
+            return LIMITED, self._fold(latest[1], notification)
+
+        self._latest[key] = (now, notification)
+        return NEW, notification
+
+    @staticmethod
+    def _fold(target, notification):
+        target["count"] += notification.get("count", 1)
+        target["last_timestamp"] = notification["timestamp"]
+        return target
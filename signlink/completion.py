@@ -0,0 +1,97 @@
+"""Completion of the word being fingerspelled from frequency-ranked vocabularies.
+
+Each sector's vocabulary is compiled into a prefix trie in which every node
+stores its ``max_k`` most frequent completions, ranked once at build time.
+Looking up a prefix walks one dict per typed letter and returns the stored
+list, so suggestions cost microseconds however large the vocabulary is.
+"""
+import heapq
+
+
+def current_word(text):
+    """The word being typed at the end of ``text`` ("" right after a space)"""
+    return text[text.rfind(" ") + 1:]
+
+
+class PrefixTrie:
+    """Top-k completions of a prefix from a ``{word: frequency}`` vocabulary"""
+
+    def __init__(self, vocabulary, max_k=5):
+        merged = {}
+        for word, frequency in vocabulary.items():
+            word = word.upper()
+            if word:
+                merged[word] = merged.get(word, 0) + frequency
+        self.max_k = max_k
+        self.frequencies = merged
+
+        children = [{}]
+        terminal = [None]
+        for word in merged:
+            node = 0
+            for char in word:
+                child = children[node].get(char)
+                if child is None:
+                    child = children[node][char] = len(children)
+                    children.append({})
+                    terminal.append(None)
+                node = child
+            terminal[node] = word
+
+        # Children are numbered after their parents, so reverse order visits them first
+        def rank(word):
+            return -merged[word], word
+
+        top = [()] * len(children)
+        for node in range(len(children) - 1, -1, -1):
+            candidates = [word for child in children[node].values() for word in top[child]]
+            if terminal[node] is not None:
+                candidates.append(terminal[node])
+            top[node] = tuple(heapq.nsmallest(max_k, candidates, key=rank))
+        self._children = children
+        self._top = top
+
+    @property
+    def nodes(self):
+        return len(self._children)
+
+    def __len__(self):
+        return len(self.frequencies)
+
+    def __contains__(self, word):
+        return word.upper() in self.frequencies
+
+    def complete(self, prefix, k=None):
+        """Up to ``k`` words starting with ``prefix``, most frequent first"""
+        node = 0
+        for char in prefix.upper():
+            node = self._children[node].get(char)
+            if node is None:
+                return ()
+        return self._top[node][:k]
+
+
+class WordCompleter:
+    """One compiled trie per sector, shared read-only by all sessions"""
+
+    def __init__(self, vocabularies_by_sector, max_k=5):
+        self._tries = {sector: PrefixTrie(vocabulary, max_k) for sector, vocabulary in vocabularies_by_sector.items()}
+        self._empty = PrefixTrie({}, max_k)
+
+    def trie(self, sector):
+        return self._tries.get(sector, self._empty)
+
+    def suggest(self, sector, text, k=3):
+        """Completions of the word at the end of ``text``, most frequent first"""
+        word = current_word(text)
+        if not word:
+            return ()
+        return self.trie(sector).complete(word, k)
+
+    def best(self, sector, text):
+        """The top completion if it would add letters to the current word, else None"""
+        word = current_word(text)
+        found = self.suggest(sector, text, 1)
+        if found and len(found[0]) > len(word):
+            return found[0]
+        return None
@@ -0,0 +1,241 @@
+"""Typed in-process event bus between the recognizer and its consumers.
+
+The recognizer publishes what happened (``GestureCommitted``,
+``StabilityChanged``) and the effects it wants (``AlertRaised``,
+``UrlRequested``); consumers subscribe to event types with a delivery policy:
+
+- ``inline``: called in the publisher's thread before ``publish`` returns.
+  For cheap state updates the next event depends on, such as the text
+  buffer.
+- ``block``: own bounded queue and worker thread; a full queue makes the
+  publisher wait.  Nothing is lost.
+- ``drop_oldest`` / ``drop_newest``: own bounded queue and worker thread; a
+  full queue discards the oldest queued event or the new one.
+
+Queued consumers run on their own threads, so a slow one (an SMTP send, a
+browser launch) only ever backs up its own queue.  Their threads start with
+the first event and exit after ``idle_timeout`` seconds without one, so idle
+sessions hold no threads.  A consumer that raises is counted and reported;
+it never stops delivery to the others.  ``on_thread`` is called with each
+worker thread before it starts, e.g. to attach Streamlit's script context so
+queued consumers can update session state.
+"""
+import sys
+import threading
+import time
+from collections import deque, namedtuple
+
+POLICIES = ("inline", "block", "drop_oldest", "drop_newest")
+
+# ==================== EVENTS ====================
+class GestureCommitted(namedtuple("GestureCommitted", "gesture sector mode binding time patient", defaults=(None,))):
+    """A stable gesture, before its binding runs; ``binding`` is None if nothing is bound
+
+    ``sector``, ``binding`` and ``patient`` are those in effect when it was
+    signed, so queued consumers act on them rather than on the current state.
+    """
+    __slots__ = ()
+    kind = "gesture"
+
+    def payload(self):
+        action = self.binding.action if self.binding is not None else None
+        return {"gesture": self.gesture, "sector": self.sector, "mode": self.mode, "action": action}
+
+
+class StabilityChanged(namedtuple("StabilityChanged", "stability frame time")):
+    """The smoothed confidence of the held gesture moved to a new hundredth"""
+    __slots__ = ()
+    kind = "stability"
+
+    def payload(self):
+        return {"stability": self.stability, "frame": self.frame}
+
+
+class AlertRaised(namedtuple("AlertRaised", "notification outcome sector")):
+    """A patient request went through the coalescer; ``outcome`` is its coalesce result"""
+    __slots__ = ()
+    kind = "notification"
+
+    def payload(self):
+        return dict(self.notification, outcome=self.outcome, sector=self.sector)
+
+
+class UrlRequested(namedtuple("UrlRequested", "url name time")):
+    """A quick action or typed trigger wants its URL opened"""
+    __slots__ = ()
+    kind = "open_url"
+
+    def payload(self):
+        return {"url": self.url, "name": self.name}
+
+# Events published to other applications by signlink.eventserver
+STREAMED_EVENTS = (GestureCommitted, StabilityChanged, AlertRaised)
+
+# ==================== SUBSCRIPTIONS ====================
+class Subscription:
+    """One consumer: its handler, policy, queue, worker thread and counters"""
+
+    def __init__(self, types, handler, policy="inline", maxsize=1024, name=None, idle_timeout=30.0,
+                 on_thread=None):
+        if policy not in POLICIES:
+            raise ValueError(f"unknown policy {policy!r}, expected one of {', '.join(POLICIES)}")
+        self.types = types
+        self.handler = handler
+        self.policy = policy
+        self.maxsize = maxsize
+        self.name = name or getattr(handler, "__name__", repr(handler))
+        self.idle_timeout = idle_timeout
+        self.on_thread = on_thread
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._busy = False
+        self._closed = False
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        self.max_queued = 0
+
+    def call(self, event):
+        try:
+            self.handler(event)
+        except Exception as exc:
+            self.errors += 1
+            print(f"Event consumer {self.name} failed on {type(event).__name__}: {exc!r}", file=sys.stderr)
+        self.delivered += 1
+
+    def offer(self, event):
+        """Queue an event under the subscription's policy; False if it was dropped"""
+        with self._cond:
+            if self._closed:
+                return False
+            if len(self._queue) >= self.maxsize:
+                if self.policy == "drop_newest":
+                    self.dropped += 1
+                    return False
+                if self.policy == "drop_oldest":
+                    self._queue.popleft()
+                    self.dropped += 1
+                else:
+                    while len(self._queue) >= self.maxsize and not self._closed:
+                        self._cond.wait()
+                    if self._closed:
+                        return False
+            self._queue.append(event)
+            self.max_queued = max(self.max_queued, len(self._queue))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f"signlink-bus-{self.name}", daemon=True)
+                if self.on_thread is not None:
+                    self.on_thread(self._thread)
+                self._thread.start()
+            elif len(self._queue) == 1:
+                self._cond.notify_all()  # the worker only waits on an empty queue
+        return True
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue:
+                    if self._closed or not self._cond.wait(self.idle_timeout) and not self._queue:
+                        self._thread = None
+                        self._cond.notify_all()
+                        return
+                event = self._queue.popleft()
+                self._busy = True
+                self._cond.notify_all()  # room for a blocked publisher
+            self.call(event)
+            with self._cond:
+                self._busy = False
+                if not self._queue:
+                    self._cond.notify_all()
+
+    def flush(self, timeout=None):
+        """Wait until every queued event was handled; False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._queue or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout=5.0):
+        """Handle what is queued, then stop the worker; later events are refused"""
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            thread = self._thread
+            self._cond.notify_all()
+        if thread is not None:
+            thread.join(timeout)
+
+    def stats(self):
+        return {"name": self.name, "policy": self.policy, "delivered": self.delivered, "dropped": self.dropped,
+                "errors": self.errors, "queued": len(self._queue), "max_queued": self.max_queued}
+
+# ==================== BUS ====================
+class EventBus:
+    """Routes each published event to the subscriptions for its exact type"""
+
+    def __init__(self, idle_timeout=30.0, on_thread=None):
+        self.idle_timeout = idle_timeout
+        self.on_thread = on_thread
+        self.subscriptions = []
+        self._routes = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, types, handler, policy="inline", maxsize=1024, name=None):
+        """Call ``handler(event)`` for events of ``types`` (a class or tuple of classes); returns the Subscription"""
+        types = types if isinstance(types, tuple) else (types,)
+        subscription = Subscription(types, handler, policy, maxsize, name, self.idle_timeout, self.on_thread)
+        with self._lock:
+            self.subscriptions.append(subscription)
+            self._reroute()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self.subscriptions.remove(subscription)
+            self._reroute()
+        subscription.close()
+
+    def _reroute(self):
+        # Queued consumers get each event before inline ones run, so events an
+        # inline consumer publishes in turn reach the queues after it
+        routes = {}
+        for subscription in self.subscriptions:
+            for event_type in subscription.types:
+                routes.setdefault(event_type, ([], []))[subscription.policy == "inline"].append(subscription)
+        self._routes = {event_type: (tuple(queued), tuple(inline)) for event_type, (queued, inline) in routes.items()}
+
+    def publish(self, event):
+        """Deliver an event: queue it for queued consumers, then call inline ones"""
+        route = self._routes.get(type(event))
+        if route is None:
+            return
+        queued, inline = route
+        for subscription in queued:
+            subscription.offer(event)
+        for subscription in inline:
+            subscription.call(event)
+
+    def flush(self, timeout=None):
+        """Wait until every queued consumer caught up; False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for subscription in list(self.subscriptions):
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not subscription.flush(remaining):
+                return False
+        return True
+
+    def close(self, timeout=5.0):
+        """Let queued consumers catch up, then unsubscribe everyone"""
+        with self._lock:
+            subscriptions, self.subscriptions = self.subscriptions, []
+            self._routes = {}
+        for subscription in subscriptions:
+            subscription.close(timeout)
+
+    def stats(self):
+        return [subscription.stats() for subscription in self.subscriptions]
@@ -0,0 +1,353 @@
+"""Local event stream of recognized gestures for other applications.
+
+An asyncio server on its own thread publishes recognizer events (committed
+gestures, stability updates, healthcare notifications) to any number of
+local clients, over Server-Sent Events or WebSocket, using only the standard
+library:
+
+    GET /events[?types=gesture,notification]   text/event-stream
+    GET /ws[?types=...]                        WebSocket, one JSON text frame per event
+    GET /stats                                 server counters and fan-out latency
+
+``attach`` subscribes the server to a recognizer's event bus.  ``publish``
+may be called from any thread; each event is serialized once.
+Every client has a bounded buffer drained by its own writer task, behind a
+fixed-size socket send buffer.  When a
+client cannot keep up, its oldest undelivered events are dropped (the ``seq``
+numbers show the gap), and a client that falls ``evict_after`` events behind
+without completing a write is disconnected, so one stalled reader never
+holds back the others or grows memory.
+
+The server binds to 127.0.0.1 by default: events can carry patient requests.
+Binding locally does not keep out web pages open in the kiosk's browser, so
+a request carrying an ``Origin`` header is refused with 403 (before any
+WebSocket upgrade) unless that origin is in ``allowed_origins``; local
+applications, which send no ``Origin``, are always served.  Client frames
+longer than ``max_frame`` bytes close the WebSocket with 1009.
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import socket
+import struct
+import threading
+import time
+from collections import deque
+from urllib.parse import parse_qs, urlsplit
+
+_WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_WS_TOO_BIG = struct.pack("!H", 1009)
+
+
+def _ws_frame(payload, opcode=0x1):
+    """An unmasked, unfragmented server-to-client WebSocket frame"""
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, length)
+    elif length < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+    return header + payload
+
+
+def _percentile(ordered, percent):
+    return ordered[int(percent / 100 * (len(ordered) - 1))] if ordered else None
+
+
+class Event:
+    """One published event, encoded once for each protocol"""
+    __slots__ = ("seq", "kind", "published", "sse", "ws")
+
+    def __init__(self, seq, kind, data):
+        self.seq = seq
+        self.kind = kind
+        self.published = time.perf_counter()
+        body = json.dumps({"seq": seq, "type": kind, "time": time.time(), **data},
+                          ensure_ascii=False, default=str, separators=(",", ":"))
+        self.sse = f"id: {seq}\nevent: {kind}\ndata: {body}\n\n".encode()
+        self.ws = _ws_frame(body.encode())
+
+
+class _Client:
+    def __init__(self, writer, protocol, kinds):
+        self.writer = writer
+        self.protocol = protocol
+        self.kinds = kinds  # None receives every kind
+        self.buffer = deque()
+        self.ready = asyncio.Event()
+        self.closed = False
+        self.behind = 0  # events dropped since the last completed write
+        self.dropped = 0
+        self.sent = 0
+
+
+class EventServer:
+    def __init__(self, host="127.0.0.1", port=8765, buffer_size=256, evict_after=1024, send_buffer=64 * 1024,
+                 heartbeat=15.0, latency_window=10_000, allowed_origins=(), max_frame=64 * 1024):
+        self.host = host
+        self.port = port
+        self.allowed_origins = frozenset(origin.rstrip("/") for origin in allowed_origins)
+        self.max_frame = max_frame
+        self.buffer_size = buffer_size
+        self.send_buffer = send_buffer
+        self.evict_after = evict_after
+        self.heartbeat = heartbeat
+        self._clients = set()
+        self._latencies = deque(maxlen=latency_window)
+        self._seq = 0
+        self._seq_lock = threading.Lock()
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._started = threading.Event()
+        self._error = None
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.evicted = 0
+        self.connections = 0
+
+    # ==================== LIFECYCLE ====================
+    def start(self, timeout=5.0):
+        """Listen on a background thread; returns once the port is bound, raises RuntimeError if it cannot"""
+        if self._thread is not None:
+            return self
+        self._thread = threading.Thread(target=self._run, name="signlink-events", daemon=True)
+        self._thread.start()
+        if not self._started.wait(timeout) or self._server is None:
+            self._thread = None
+            reason = f": {self._error}" if self._error is not None else ""
+            raise RuntimeError(f"event server did not start on {self.host}:{self.port}{reason}")
+        return self
+
+    def _run(self):
+        loop = self._loop = asyncio.new_event_loop()
+        try:
+            self._server = loop.run_until_complete(asyncio.start_server(self._handle, self.host, self.port))
+            self.port = self._server.sockets[0].getsockname()[1]
+        except OSError as exc:
+            self._error = exc
+            self._started.set()
+            loop.close()
+            return
+        self._started.set()
+        try:
+            loop.run_forever()
+        finally:
+            self._server.close()
+            for client in list(self._clients):
+                self._disconnect(client)
+            loop.run_until_complete(self._server.wait_closed())
+            loop.run_until_complete(asyncio.sleep(0))
+            loop.close()
+
+    def close(self, timeout=5.0):
+        if self._thread is None:
+            return
+        if self._loop is not None and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive() and self._server is not None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ==================== PUBLISHING ====================
+    def publish(self, kind, data):
+        """Send an event to every subscribed client; safe from any thread, never blocks on clients"""
+        loop = self._loop
+        if loop is None or not loop.is_running():
+            return None
+        with self._seq_lock:
+            self._seq += 1
+            seq = self._seq
+        event = Event(seq, kind, data)
+        try:
+            loop.call_soon_threadsafe(self._fan_out, event)
+        except RuntimeError:  # loop closed meanwhile
+            return None
+        return seq
+
+    def publish_event(self, event):
+        """Publish a typed bus event (see signlink.events) under its kind"""
+        return self.publish(event.kind, event.payload())
+
+    def attach(self, bus, maxsize=1024):
+        """Stream a recognizer's bus events; encoding runs on the subscription's own thread"""
+        from signlink.events import STREAMED_EVENTS
+        return bus.subscribe(STREAMED_EVENTS, self.publish_event, policy="drop_oldest", maxsize=maxsize,
+                             name="eventserver")
+
+    def _fan_out(self, event):
+        self.published += 1
+        for client in tuple(self._clients):
+            if client.kinds is not None and event.kind not in client.kinds:
+                continue
+            if len(client.buffer) >= self.buffer_size:
+                client.buffer.popleft()
+                client.dropped += 1
+                client.behind += 1
+                self.dropped += 1
+                if client.behind >= self.evict_after:
+                    self.evicted += 1
+                    self._disconnect(client)
+                    continue
+            client.buffer.append(event)
+            client.ready.set()
+
+    # ==================== CONNECTIONS ====================
+    async def _handle(self, reader, writer):
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), 10)
+            request_line, *lines = head.decode("latin-1").split("\r\n")
+            method, target, _ = request_line.split(" ", 2)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError, ValueError,
+                ConnectionError):
+            writer.close()
+            return
+        headers = {}
+        for line in lines:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        url = urlsplit(target)
+        types = parse_qs(url.query).get("types")
+        kinds = frozenset(kind for value in types for kind in value.split(",") if kind) if types else None
+        origin = headers.get("origin")
+        allow = b""
+        if origin is not None:
+            if origin.rstrip("/") not in self.allowed_origins:
+                await self._respond(writer, "403 Forbidden", "text/plain", b"origin not allowed\n")
+                return
+            allow = f"Access-Control-Allow-Origin: {origin}\r\nVary: Origin\r\n".encode("latin-1")
+
+        if method != "GET":
+            await self._respond(writer, "405 Method Not Allowed", "text/plain", b"GET only\n", allow)
+        elif url.path == "/stats":
+            body = json.dumps(self.stats()).encode()
+            await self._respond(writer, "200 OK", "application/json", body, allow)
+        elif url.path == "/events":
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n"
+                         b"Connection: keep-alive\r\n" + allow + b"\r\n: connected\n\n")
+            await self._serve(reader, writer, "sse", kinds)
+        elif url.path == "/ws" and headers.get("upgrade", "").lower() == "websocket" and "sec-websocket-key" in headers:
+            accept = base64.b64encode(hashlib.sha1((headers["sec-websocket-key"] + _WS_GUID).encode()).digest())
+            writer.write(b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                         b"Sec-WebSocket-Accept: " + accept + b"\r\n\r\n")
+            await self._serve(reader, writer, "ws", kinds)
+        else:
+            await self._respond(writer, "404 Not Found", "text/plain", b"GET /events, /ws or /stats\n", allow)
+
+    async def _respond(self, writer, status, content_type, body, extra_headers=b""):
+        writer.write(f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\nContent-Length: {len(body)}\r\n"
+                     f"Connection: close\r\n".encode() + extra_headers + b"\r\n" + body)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        writer.close()
+
+    async def _serve(self, reader, writer, protocol, kinds):
+        # A fixed kernel send buffer (instead of one autotuned up to megabytes)
+        # makes a stalled reader show up in its own bounded buffer quickly
+        sock = writer.get_extra_info("socket")
+        if sock is not None and self.send_buffer:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.send_buffer)
+        client = _Client(writer, protocol, kinds)
+        self._clients.add(client)
+        self.connections += 1
+        watcher = asyncio.ensure_future(self._watch(reader, client))
+        try:
+            await self._pump(client)
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            watcher.cancel()
+            self._disconnect(client)
+
+    async def _pump(self, client):
+        """Write the client's buffered events as they arrive, with heartbeats when idle"""
+        writer = client.writer
+        ping = b": ping\n\n" if client.protocol == "sse" else _ws_frame(b"", 0x9)
+        while not client.closed:
+            try:
+                await asyncio.wait_for(client.ready.wait(), self.heartbeat)
+            except asyncio.TimeoutError:
+                writer.write(ping)
+                await writer.drain()
+                continue
+            client.ready.clear()
+            while client.buffer and not client.closed:
+                batch = list(client.buffer)
+                client.buffer.clear()
+                attribute = client.protocol
+                writer.write(b"".join(getattr(event, attribute) for event in batch))
+                now = time.perf_counter()
+                self._latencies.extend(now - event.published for event in batch)
+                client.sent += len(batch)
+                self.delivered += len(batch)
+                await writer.drain()
+                client.behind = 0
+
+    async def _watch(self, reader, client):
+        """Notice disconnects, and answer WebSocket pings and closes"""
+        try:
+            while True:
+                if client.protocol == "sse":
+                    if not await reader.read(1024):
+                        break
+                    continue
+                first, second = await reader.readexactly(2)
+                length = second & 0x7F
+                if length == 126:
+                    length = struct.unpack("!H", await reader.readexactly(2))[0]
+                elif length == 127:
+                    length = struct.unpack("!Q", await reader.readexactly(8))[0]
+                if length > self.max_frame:
+                    client.writer.write(_ws_frame(_WS_TOO_BIG, 0x8))
+                    break
+                mask = await reader.readexactly(4) if second & 0x80 else b"\0\0\0\0"
+                payload = bytes(byte ^ mask[i % 4] for i, byte in enumerate(await reader.readexactly(length)))
+                opcode = first & 0x0F
+                if opcode == 0x8:
+                    client.writer.write(_ws_frame(payload[:2], 0x8))
+                    break
+                if opcode == 0x9:
+                    client.writer.write(_ws_frame(payload, 0xA))
+        except (asyncio.IncompleteReadError, ConnectionError, OSError):
+            pass
+        self._disconnect(client)
+
+    def _disconnect(self, client):
+        if client.closed:
+            return
+        client.closed = True
+        client.buffer.clear()
+        client.ready.set()
+        self._clients.discard(client)
+        client.writer.close()
+
+    # ==================== STATS ====================
+    def stats(self):
+        """Counters and publish-to-socket latency percentiles in milliseconds"""
+        ordered = sorted(self._latencies)
+        stats = {
+            "clients": len(self._clients),
+            "connections": self.connections,
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "evicted": self.evicted,
+        }
+        for percent in (50, 95, 99):
+            value = _percentile(ordered, percent)
+            stats[f"fanout_p{percent}_ms"] = None if value is None else value * 1000
+        return stats
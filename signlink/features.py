@@ -0,0 +1,240 @@
+"""Vectorized hand-landmark features and a batched A-Z letter classifier."""
+import functools
+import string
+
+import numpy as np
+
+LETTERS = tuple(string.ascii_uppercase)
+NUM_LANDMARKS = 21
+WRIST = 0
+MIDDLE_MCP = 9
+
+# Landmark indices of each finger from base to tip (MediaPipe Hands layout)
+FINGERS = (
+    (1, 2, 3, 4),      # thumb
+    (5, 6, 7, 8),      # index
+    (9, 10, 11, 12),   # middle
+    (13, 14, 15, 16),  # ring
+    (17, 18, 19, 20),  # pinky
+)
+
+# (a, b, c) triples whose angle at b is reported as a joint angle
+JOINT_TRIPLES = np.array([
+    (prev, joint, nxt)
+    for finger in FINGERS
+    for prev, joint, nxt in zip((WRIST,) + finger[:2], finger[:3], finger[1:])
+], dtype=np.intp)
+
+_PAIR_I, _PAIR_J = np.triu_indices(NUM_LANDMARKS, k=1)
+FEATURE_SIZE = NUM_LANDMARKS * 3 + len(_PAIR_I) + len(JOINT_TRIPLES)
+
+# ==================== FEATURE EXTRACTION ====================
+def as_batch(landmarks):
+    """Return landmarks as a float32 (batch, 21, 3) array"""
+    points = np.asarray(landmarks, dtype=np.float32)
+    if points.ndim == 2:
+        points = points[None]
+    if points.shape[1:] != (NUM_LANDMARKS, 3):
+        raise ValueError(f"Expected landmarks of shape (batch, 21, 3), got {points.shape}")
+    return points
+
+
+def normalize(landmarks):
+    """Translate to the wrist and scale by the wrist to middle-finger-base length"""
+    points = as_batch(landmarks)
+    centered = points - points[:, WRIST:WRIST + 1]
+    scale = np.linalg.norm(centered[:, MIDDLE_MCP], axis=-1)
+    return centered / np.maximum(scale, 1e-6)[:, None, None]
+
+
+def pairwise_distances(points):
+    """Upper-triangle Euclidean distances between all 21 points, shape (batch, 210)"""
+    diff = points[:, _PAIR_I] - points[:, _PAIR_J]
+    return np.sqrt(np.einsum("bpk,bpk->bp", diff, diff))
+
+
+def joint_angles(points):
+    """Flexion angle in radians at each finger joint, shape (batch, 15)"""
+    a = points[:, JOINT_TRIPLES[:, 0]] - points[:, JOINT_TRIPLES[:, 1]]
+    c = points[:, JOINT_TRIPLES[:, 2]] - points[:, JOINT_TRIPLES[:, 1]]
+    cosine = np.einsum("bjk,bjk->bj", a, c)
+    cosine /= np.maximum(np.linalg.norm(a, axis=-1) * np.linalg.norm(c, axis=-1), 1e-9)
+    return np.arccos(np.clip(cosine, -1.0, 1.0))
+
+
+def extract_features(landmarks):
+    """Concatenate normalized coordinates, pairwise distances and joint angles"""
+    points = normalize(landmarks)
+    return np.concatenate([
+        points.reshape(len(points), -1),
+        pairwise_distances(points),
+        joint_angles(points),
+    ], axis=1).astype(np.float32, copy=False)
+
+# ==================== LETTER CLASSIFIER ====================
+def _frozen(array):
+    array = np.array(array, dtype=np.float32)
+    array.setflags(write=False)
+    return array
+
+
+class LetterClassifier:
+    """Nearest-centroid classifier over standardized landmark features
+
+    All methods take batches; ``__call__`` wraps a single hand for use as a
+    RecognitionPipeline classifier and returns ``(letter, confidence)``.
+    Weights are read-only, so one instance is shared by every session and
+    inference thread in a process.
+    """
+
+    def __init__(self, labels, centroids, mean, scale, temperature=0.1):
+        self.labels = tuple(labels)
+        self.mean = _frozen(mean)
+        self.scale = _frozen(scale)
+        self.centroids = _frozen(centroids)
+        self.temperature = temperature
+        self._centroid_sq = _frozen(np.einsum("kd,kd->k", self.centroids, self.centroids))
+
+    @property
+    def nbytes(self):
+        return self.mean.nbytes + self.scale.nbytes + self.centroids.nbytes + self._centroid_sq.nbytes
+
+    @classmethod
+    def fit(cls, landmarks, labels, temperature=0.1):
+        """Fit class centroids from labelled landmark samples"""
+        features = extract_features(landmarks)
+        labels = np.asarray(labels)
+        mean = features.mean(axis=0)
+        scale = features.std(axis=0) + 1e-3
+        standardized = (features - mean) / scale
+        classes = sorted(set(labels.tolist()))
+        centroids = np.stack([standardized[labels == label].mean(axis=0) for label in classes])
+        return cls(classes, centroids, mean, scale, temperature)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data["labels"].tolist(), data["centroids"], data["mean"], data["scale"],
+                       float(data["temperature"]))
+
+    def save(self, path):
+        np.savez(path, labels=np.array(self.labels), centroids=self.centroids, mean=self.mean,
+                 scale=self.scale, temperature=self.temperature)
+
+    def predict_proba(self, landmarks):
+        """Class probabilities, shape (batch, num_classes)"""
+        return self.proba_from_features(extract_features(landmarks))
+
+    def proba_from_features(self, features):
+        x = (features - self.mean) / self.scale
+        # Squared distances to every centroid via ||x||^2 - 2 x.c + ||c||^2
+        sq = np.einsum("bd,bd->b", x, x)[:, None] - 2.0 * x @ self.centroids.T + self._centroid_sq
+        logits = -np.maximum(sq, 0.0) / (self.temperature * x.shape[1])
+        logits -= logits.max(axis=1, keepdims=True)
+        np.exp(logits, out=logits)
+        logits /= logits.sum(axis=1, keepdims=True)
+        return logits
+
+    def predict(self, landmarks):
+        """Return (letters, confidences) for a batch of hands"""
+        proba = self.predict_proba(landmarks)
+        best = proba.argmax(axis=1)
+        return [self.labels[i] for i in best], proba[np.arange(len(best)), best]
+
+    def __call__(self, landmarks):
+        letters, confidences = self.predict(landmarks)
+        return letters[0], float(confidences[0])
+
+# ==================== SYNTHETIC HAND TEMPLATES ====================
+# Per-letter pose: thumb..pinky curl (0 straight, 1 folded), finger spread,
+# thumb abduction (negative = across the palm) and in-plane roll in degrees.
+LETTER_POSES = {
+    "A": ((0.0, 1.0, 1.0, 1.0, 1.0), 0.0, 0.2, 0),
+    "B": ((1.0, 0.0, 0.0, 0.0, 0.0), 0.0, 0.0, 0),
+    "C": ((0.4, 0.5, 0.5, 0.5, 0.5), 0.1, 0.5, 0),
+    "D": ((0.6, 0.0, 0.8, 0.8, 0.8), 0.0, 0.3, 0),
+    "E": ((1.0, 0.9, 0.9, 0.9, 0.9), 0.0, 0.0, 0),
+    "F": ((0.7, 0.8, 0.0, 0.0, 0.0), 0.4, 0.3, 0),
+    "G": ((0.0, 0.0, 1.0, 1.0, 1.0), 0.0, 0.6, 90),
+    "H": ((0.8, 0.0, 0.0, 1.0, 1.0), 0.0, 0.2, 90),
+    "I": ((0.8, 1.0, 1.0, 1.0, 0.0), 0.0, 0.2, 0),
+    "J": ((0.8, 1.0, 1.0, 1.0, 0.0), 0.0, 0.2, 60),
+    "K": ((0.2, 0.0, 0.3, 1.0, 1.0), 0.5, 0.5, 0),
+    "L": ((0.0, 0.0, 1.0, 1.0, 1.0), 0.0, 1.0, 0),
+    "M": ((0.9, 1.0, 1.0, 1.0, 1.0), 0.0, -0.3, 0),
+    "N": ((0.7, 1.0, 1.0, 1.0, 1.0), 0.0, -0.2, 20),
+    "O": ((0.5, 0.7, 0.7, 0.7, 0.7), 0.0, 0.3, 0),
+    "P": ((0.2, 0.0, 0.3, 1.0, 1.0), 0.5, 0.5, 150),
+    "Q": ((0.0, 0.0, 1.0, 1.0, 1.0), 0.0, 0.6, 150),
+    "R": ((0.8, 0.0, 0.0, 1.0, 1.0), -0.3, 0.0, 0),
+    "S": ((0.8, 1.0, 1.0, 1.0, 1.0), 0.0, -0.5, 0),
+    "T": ((0.5, 1.0, 1.0, 1.0, 1.0), 0.0, -0.1, 0),
+    "U": ((0.8, 0.0, 0.0, 1.0, 1.0), 0.0, 0.0, 0),
+    "V": ((0.8, 0.0, 0.0, 1.0, 1.0), 0.6, 0.0, 0),
+    "W": ((0.8, 0.0, 0.0, 0.0, 1.0), 0.5, 0.0, 0),
+    "X": ((0.8, 0.5, 1.0, 1.0, 1.0), 0.0, 0.0, 0),
+    "Y": ((0.0, 1.0, 1.0, 1.0, 0.0), 0.4, 1.0, 0),
+    "Z": ((0.8, 0.0, 1.0, 1.0, 1.0), 0.0, 0.0, -30),
+}
+
+_BASES = np.array([(0.25, 0.25), (0.3, 1.0), (0.1, 1.05), (-0.1, 1.0), (-0.3, 0.9)])
+_SEGMENTS = np.array([(0.35, 0.3, 0.25), (0.45, 0.28, 0.22), (0.48, 0.3, 0.23),
+                      (0.45, 0.28, 0.22), (0.36, 0.22, 0.18)])
+_SPREAD_DEG = np.array([0.0, 20.0, 7.0, -7.0, -20.0])
+
+
+def _pose_landmarks(curls, spread, thumb_abduction, roll):
+    """Build one (21, 3) hand in image coordinates from pose parameters"""
+    points = np.zeros((NUM_LANDMARKS, 3))
+    for finger, (indices, base, lengths) in enumerate(zip(FINGERS, _BASES, _SEGMENTS)):
+        curl = curls[finger]
+        if finger == 0:
+            heading = np.radians(45 + 40 * thumb_abduction - 100 * curl)
+        else:
+            heading = np.radians(_SPREAD_DEG[finger] * spread)
+        position = np.array([base[0], base[1], 0.0])
+        points[indices[0]] = position
+        flexion = 0.0
+        for joint, length in zip(indices[1:], lengths):
+            flexion += np.radians(80 * curl)
+            direction = np.array([np.sin(heading) * np.cos(flexion),
+                                  np.cos(heading) * np.cos(flexion),
+                                  np.sin(flexion)])
+            position = position + length * direction
+            points[joint] = position
+    angle = np.radians(roll)
+    rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+    points[:, :2] = points[:, :2] @ rotation.T
+    image = np.empty_like(points)
+    image[:, 0] = 0.5 + 0.2 * points[:, 0]
+    image[:, 1] = 0.7 - 0.2 * points[:, 1]
+    image[:, 2] = 0.05 * points[:, 2]
+    return image.astype(np.float32)
+
+
+@functools.lru_cache(maxsize=None)
+def _template(letter):
+    return _pose_landmarks(*LETTER_POSES[letter])
+
+
+def template_landmarks(letter, count=1, noise=0.0, rng=None):
+    """Synthetic (count, 21, 3) landmarks for a letter with optional jitter"""
+    base = np.broadcast_to(_template(letter), (count, NUM_LANDMARKS, 3))
+    if not noise:
+        return base.copy()
+    rng = rng if rng is not None else np.random.default_rng()
+    shift = rng.normal(0.0, 0.05, size=(count, 1, 3)) * [1, 1, 0]
+    scale = 1.0 + rng.normal(0.0, 0.1, size=(count, 1, 1))
+    origin = base[:, WRIST:WRIST + 1]
+    jitter = rng.normal(0.0, noise, size=base.shape)
+    return ((base - origin) * scale + origin + shift + jitter).astype(np.float32)
+
+
+@functools.lru_cache(maxsize=1)
+def default_classifier(samples_per_letter=64, noise=0.004, seed=0):
+    """Classifier fitted on the built-in letter templates"""
+    rng = np.random.default_rng(seed)
+    landmarks = np.concatenate([template_landmarks(letter, samples_per_letter, noise, rng)
+                                for letter in LETTERS])
+    labels = np.repeat(LETTERS, samples_per_letter)
+    return LetterClassifier.fit(landmarks, labels)
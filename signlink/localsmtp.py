@@ -0,0 +1,101 @@
+"""Minimal in-process SMTP server for exercising the notification dispatcher.
+
+Speaks just enough SMTP for ``smtplib`` (EHLO/HELO, MAIL, RCPT, DATA, RSET,
+NOOP, QUIT), keeps received messages in memory and can inject per-message
+latency or dropped connections.
+"""
+import socketserver
+import threading
+import time
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def _reply(self, line):
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        server = self.server
+        self._reply("220 localhost SignLink test SMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode(errors="replace").strip()
+            verb = command[:4].upper()
+            if verb in ("EHLO", "HELO"):
+                self._reply("250 localhost")
+            elif verb in ("MAIL", "RCPT", "RSET", "NOOP"):
+                self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                lines = []
+                while (data := self.rfile.readline()) not in (b".\r\n", b".\n", b""):
+                    lines.append(data)
+                if server.delay:
+                    time.sleep(server.delay)
+                if server.should_drop():
+                    return
+                server.store(b"".join(lines))
+                self._reply("250 OK: queued")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+
+class LocalSMTPServer(socketserver.ThreadingTCPServer):
+    """Threaded SMTP stand-in; ``drop_every=n`` closes the connection on every nth message"""
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host="127.0.0.1", port=0, delay=0.0, drop_every=0):
+        super().__init__((host, port), _Handler)
+        self.delay = delay
+        self.drop_every = drop_every
+        self.messages = []
+        self.connections = 0
+        self._received = 0
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def config(self, **overrides):
+        """EMAIL_CONFIG-style dict pointing at this server"""
+        config = {"smtp_server": self.server_address[0], "smtp_port": self.port,
+                  "sender_email": "alerts@localhost", "sender_password": "",
+                  "admin_email": "staff@localhost", "use_tls": False}
+        config.update(overrides)
+        return config
+
+    def process_request(self, request, client_address):
+        with self._lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+    def should_drop(self):
+        with self._lock:
+            self._received += 1
+            return bool(self.drop_every) and self._received % self.drop_every == 0
+
+    def store(self, message):
+        with self._lock:
+            self.messages.append(message)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="signlink-local-smtp", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
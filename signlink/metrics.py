@@ -0,0 +1,59 @@
+"""Measured benchmark results shown in the app header."""
+import json
+import os
+from pathlib import Path
+
+RESULTS_PATH = Path(os.environ.get(
+    "SIGNLINK_BENCH_RESULTS", Path(__file__).resolve().parent.parent / "bench_results.json"
+))
+
+_cache = {"key": None, "results": None}
+
+
+def load_results(path=None):
+    """Latest benchmark results, re-read only when the file changes"""
+    path = Path(path or RESULTS_PATH)
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    if _cache["key"] != key:
+        try:
+            results = json.loads(path.read_text())
+        except (OSError, ValueError):
+            results = None
+        _cache.update(key=key, results=results)
+    return _cache["results"]
+
+
+def save_results(results, path=None):
+    path = Path(path or RESULTS_PATH)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(results, indent=2))
+    tmp.replace(path)
+
+
+def header_metrics(path=None):
+    """Return display strings for the Accuracy and Response header cards
+
+    Only measurements of the real thing are shown: accuracy on labelled
+    datasets (not the synthetic templates the classifier was fitted on) and
+    latency through the full pipeline, with decoding and MediaPipe.
+    Anything else reads "n/a".
+    """
+    results = load_results(path)
+    if not results:
+        return "n/a", "n/a"
+    accuracy_results = results.get("accuracy", {})
+    end_to_end = results.get("stages", {}).get("end_to_end", {})
+    accuracy = accuracy_results.get("frame_accuracy") if accuracy_results.get("source") == "datasets" else None
+    latency = end_to_end.get("p50_ms") if end_to_end.get("full_pipeline") else None
+    accuracy_text = f"{accuracy * 100:.0f}%" if accuracy is not None else "n/a"
+    if latency is None:
+        response_text = "n/a"
+    elif latency < 10:
+        response_text = f"{latency:.1f}ms"
+    else:
+        response_text = f"{latency:.0f}ms"
+    return accuracy_text, response_text
@@ -0,0 +1,195 @@
+"""Background SMTP delivery of healthcare notifications.
+
+``NotificationDispatcher.submit`` only enqueues; worker threads each hold one
+SMTP connection open between messages, reconnect on failure and retry with
+exponential backoff, so gesture processing never waits on the mail server.
+A full queue drops the message unless the caller waits for room, as the
+recognizer's email consumer does for emergencies.
+"""
+import queue
+import random
+import sys
+import threading
+import time
+from collections import deque
+
+_STOP = object()
+
+# ==================== MESSAGE FORMATTING ====================
+def format_notification(notification):
+    """Return (subject, body) for a healthcare notification"""
+    subject = "URGENT" if notification["emergency"] else "Patient Request"
+    body = f"""Patient Gesture Notification:
+
+Gesture: {notification['gesture']} - {notification['name']}
+Description: {notification['description']}
+Time: {notification['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}
+Emergency: {'YES' if notification['emergency'] else 'No'}
+Hold Duration: {notification['hold_duration']:.1f} seconds
+"""
+    if notification.get("patient"):
+        body += f"Patient: {notification['patient']}\n"
+    if notification.get("count", 1) > 1:
+        body += f"Repeated: {notification['count']} times\n"
+    body += "\nPlease respond accordingly.\n"
+    return f"{subject}: {notification['name']}", body
+
+
+def build_message(config, notification):
+    from email.mime.text import MIMEText
+
+    subject, body = format_notification(notification)
+    message = MIMEText(body)
+    message["Subject"] = subject
+    message["From"] = config["sender_email"]
+    message["To"] = config["admin_email"]
+    return message
+
+# ==================== SMTP CONNECTIONS ====================
+def smtp_connect(config, timeout=10.0):
+    """Open an authenticated SMTP connection described by an EMAIL_CONFIG dict"""
+    import smtplib
+
+    host, port = config["smtp_server"], int(config["smtp_port"])
+    if port == 465:
+        connection = smtplib.SMTP_SSL(host, port, timeout=timeout)
+    else:
+        connection = smtplib.SMTP(host, port, timeout=timeout)
+        if config.get("use_tls", port == 587):
+            connection.starttls()
+    password = config.get("sender_password")
+    if password:
+        connection.login(config["sender_email"], password)
+    return connection
+
+# ==================== DISPATCHER ====================
+class NotificationDispatcher:
+    """Queue plus a pool of SMTP worker threads with connection reuse and retries"""
+
+    def __init__(self, config, workers=1, max_queue=1000, max_retries=5, backoff=0.5,
+                 max_backoff=30.0, idle_timeout=60.0, connect=smtp_connect):
+        self.config = config
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.idle_timeout = idle_timeout
+        self._connect = connect
+        self._queue = queue.Queue(max_queue)
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=10000)
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.retries = 0
+        self.connections_opened = 0
+        self._first_send = None
+        self._last_send = None
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"signlink-smtp-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, notification, timeout=0.0):
+        """Enqueue a notification, waiting up to ``timeout`` seconds (None: forever) for room
+
+        Returns False, counting it in ``dropped``, if the queue stayed full.
+        """
+        try:
+            self._queue.put((time.monotonic(), notification), timeout != 0.0, timeout or None)
+            return True
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+
+    def flush(self, timeout=None):
+        """Wait until every queued notification was sent or given up on"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def close(self, timeout=5.0):
+        """Deliver what is queued, then stop the workers and close connections"""
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def stats(self):
+        with self._lock:
+            latencies = sorted(self._latencies)
+            sent = self.sent
+            span = (self._last_send - self._first_send) if sent > 1 else 0.0
+            stats = {"sent": sent, "failed": self.failed, "dropped": self.dropped,
+                     "retries": self.retries, "queued": self._queue.qsize(),
+                     "connections_opened": self.connections_opened,
+                     "messages_per_second": (sent - 1) / span if span else 0.0}
+        if latencies:
+            stats["latency_p50_ms"] = latencies[len(latencies) // 2] * 1000
+            stats["latency_p95_ms"] = latencies[int(len(latencies) * 0.95)] * 1000
+        return stats
+
+    def _worker(self):
+        connection = None
+        last_used = 0.0
+        while True:
+            try:
+                item = self._queue.get(timeout=1.0)
+            except queue.Empty:
+                if connection is not None and time.monotonic() - last_used > self.idle_timeout:
+                    connection = self._disconnect(connection)
+                continue
+            if item is _STOP:
+                self._disconnect(connection)
+                self._queue.task_done()
+                return
+            enqueued_at, notification = item
+            try:
+                connection = self._deliver(connection, notification)
+            finally:
+                self._queue.task_done()
+            last_used = time.monotonic()
+            if connection is not None:
+                with self._lock:
+                    self._latencies.append(last_used - enqueued_at)
+                    self._first_send = self._first_send or last_used
+                    self._last_send = last_used
+
+    def _deliver(self, connection, notification):
+        """Send one notification, reconnecting and backing off on failure"""
+        message = build_message(self.config, notification)
+        for attempt in range(self.max_retries + 1):
+            try:
+                if connection is None:
+                    connection = self._connect(self.config)
+                    with self._lock:
+                        self.connections_opened += 1
+                connection.send_message(message)
+                with self._lock:
+                    self.sent += 1
+                return connection
+            except Exception as e:
+                connection = self._disconnect(connection)
+                if attempt == self.max_retries:
+                    print(f"Failed to send email: {e}", file=sys.stderr)
+                    with self._lock:
+                        self.failed += 1
+                    return None
+                with self._lock:
+                    self.retries += 1
+                delay = min(self.backoff * 2 ** attempt, self.max_backoff)
+                time.sleep(delay * random.uniform(0.5, 1.0))
+
+    @staticmethod
+    def _disconnect(connection):
+        if connection is not None:
+            try:
+                connection.quit()
+            except Exception:
+                pass
+        return None
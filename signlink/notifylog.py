@@ -0,0 +1,264 @@
+"""Durable append-only log of healthcare notification events.
+
+Every healthcare request is appended as an event row (including ones the
+coalescer merged or rate-limited) to a SQLite database in WAL mode.  Appends
+only enqueue; a writer thread commits them in batches.  Acknowledgements are
+appended to a separate table, so "open emergencies" are emergency events
+without an acknowledgement row; triggers keep those in a small derived
+``open_emergencies`` table so the query never scans acknowledged history.
+SQLite is imported and the database opened on first use, by the writer
+thread.
+
+A batch the database rejects is reported on stderr and counted in
+``failed``; the writer carries on with the next one.  If the writer itself
+stops (the database cannot be opened, say), ``error`` says why, ``append``
+counts events in ``failed`` instead of queueing them, and ``acknowledge``
+and ``flush`` raise.  Appending never raises, so a broken log cannot stop
+the alert it records.
+"""
+import queue
+import sys
+import threading
+import time
+from datetime import datetime
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS notifications (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    patient TEXT NOT NULL,
+    gesture TEXT NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    emergency INTEGER NOT NULL,
+    hold_duration REAL NOT NULL,
+    outcome TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS notifications_ts ON notifications (ts);
+CREATE INDEX IF NOT EXISTS notifications_patient_ts ON notifications (patient, ts);
+CREATE INDEX IF NOT EXISTS notifications_emergency_ts ON notifications (ts) WHERE emergency = 1;
+CREATE TABLE IF NOT EXISTS acknowledgements (
+    notification_id INTEGER PRIMARY KEY REFERENCES notifications (id),
+    ts REAL NOT NULL,
+    staff TEXT
+);
+CREATE TABLE IF NOT EXISTS open_emergencies (
+    notification_id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS open_emergencies_ts ON open_emergencies (ts);
+CREATE TRIGGER IF NOT EXISTS open_emergency AFTER INSERT ON notifications WHEN NEW.emergency = 1
+BEGIN
+    INSERT INTO open_emergencies (notification_id, ts) VALUES (NEW.id, NEW.ts);
+END;
+CREATE TRIGGER IF NOT EXISTS close_emergency AFTER INSERT ON acknowledgements
+BEGIN
+    DELETE FROM open_emergencies WHERE notification_id = NEW.notification_id;
+END;
+"""
+
+COLUMNS = ("id", "ts", "patient", "gesture", "name", "description", "emergency", "hold_duration", "outcome")
+
+_STOP = object()
+
+
+def _timestamp(value):
+    return value.timestamp() if isinstance(value, datetime) else float(value)
+
+
+class NotificationLog:
+    def __init__(self, path, batch_size=500, flush_interval=0.2):
+        self.path = str(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._writer = None
+        self._ready = threading.Event()  # schema created, or the writer gave up
+        self._waiters = []
+        self._start_lock = threading.Lock()
+        self._local = threading.local()
+        self.written = 0
+        self.failed = 0
+        self.error = None
+
+    # ==================== WRITES ====================
+    def append(self, notification, outcome="new"):
+        """Enqueue one notification event; never blocks on disk
+
+        Returns False, counting the event in ``failed``, if the writer stopped.
+        """
+        if self.error is not None:
+            self.failed += 1
+            return False
+        self._ensure_started()
+        self._queue.put((
+            _timestamp(notification["timestamp"]),
+            notification.get("patient") or "default",
+            notification["gesture"],
+            notification["name"],
+            notification["description"],
+            int(bool(notification["emergency"])),
+            float(notification.get("hold_duration", 0.0)),
+            outcome,
+        ))
+        return True
+
+    def acknowledge(self, notification_ids, staff=None, when=None):
+        """Record staff acknowledgement of notification events"""
+        self._ensure_started()
+        when = time.time() if when is None else _timestamp(when)
+        self._queue.put(("ack", [(int(i), when, staff) for i in notification_ids]))
+
+    def flush(self, timeout=30.0):
+        """Block until queued events were handled; False on timeout"""
+        if self._writer is None:
+            return True
+        self._check()
+        done = threading.Event()
+        self._queue.put(done)
+        flushed = done.wait(timeout)
+        self._check()
+        return flushed
+
+    def close(self, timeout=30.0):
+        if self._writer is not None:
+            self._queue.put(_STOP)
+            self._writer.join(timeout)
+            self._writer = None
+
+    def _check(self):
+        if self.error is not None:
+            raise RuntimeError(f"notification log {self.path} stopped: {self.error}")
+
+    def _ensure_started(self):
+        self._check()
+        if self._writer is not None:
+            return
+        with self._start_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="signlink-notification-log",
+                                                daemon=True)
+                self._writer.start()
+
+    def _connect(self):
+        import sqlite3
+
+        connection = sqlite3.connect(self.path, timeout=30.0)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _write_loop(self):
+        connection = None
+        try:
+            connection = self._connect()
+            connection.executescript(SCHEMA)
+            self._ready.set()
+            self._write_batches(connection)
+        except Exception as exc:
+            self.error = repr(exc)
+            print(f"Notification log {self.path} stopped: {exc!r}", file=sys.stderr)
+            self._ready.set()
+            # Wake flushes waiting behind the failure; they raise
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(item, threading.Event):
+                    self._waiters.append(item)
+            for waiter in self._waiters:
+                waiter.set()
+        finally:
+            if connection is not None:
+                connection.close()
+
+    def _write_batches(self, connection):
+        import sqlite3
+
+        events, acks, waiters = [], [], self._waiters
+        stopping = False
+        while not stopping:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = None
+            while item is not None:
+                if item is _STOP:
+                    stopping = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                elif item[0] == "ack":
+                    acks.extend(item[1])
+                else:
+                    events.append(item)
+                if len(events) >= self.batch_size or stopping:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    item = None
+            if events or acks:
+                try:
+                    with connection:
+                        connection.executemany(
+                            "INSERT INTO notifications (ts, patient, gesture, name, description, emergency,"
+                            " hold_duration, outcome) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", events)
+                        connection.executemany(
+                            "INSERT OR IGNORE INTO acknowledgements (notification_id, ts, staff) VALUES (?, ?, ?)",
+                            acks)
+                    self.written += len(events)
+                except sqlite3.Error as exc:
+                    self.failed += len(events) + len(acks)
+                    print(f"Notification log {self.path}: {len(events)} events and {len(acks)} acknowledgements"
+                          f" not written: {exc!r}", file=sys.stderr)
+                events, acks = [], []
+            # Everything queued ahead of a flush marker is now committed or reported
+            for waiter in waiters:
+                waiter.set()
+            waiters.clear()
+
+    # ==================== QUERIES ====================
+    def _reader(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            self._ensure_started()
+            if not self._ready.wait(30.0):  # the writer creates the schema
+                raise RuntimeError(f"notification log {self.path} did not open")
+            self._check()
+            connection = self._local.connection = self._connect()
+        return connection
+
+    def _rows(self, sql, params):
+        return [dict(zip(COLUMNS, row)) for row in self._reader().execute(sql, params)]
+
+    def between(self, start, end, patient=None, limit=None):
+        """Events with start <= ts < end, optionally for one patient, newest first"""
+        sql = f"SELECT {', '.join(COLUMNS)} FROM notifications WHERE ts >= ? AND ts < ?"
+        params = [_timestamp(start), _timestamp(end)]
+        if patient is not None:
+            sql += " AND patient = ?"
+            params.append(patient)
+        sql += " ORDER BY ts DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self._rows(sql, params)
+
+    def emergencies(self, start, end, limit=None):
+        """Emergency events with start <= ts < end, newest first"""
+        sql = (f"SELECT {', '.join(COLUMNS)} FROM notifications"
+               " WHERE emergency = 1 AND ts >= ? AND ts < ? ORDER BY ts DESC")
+        params = [_timestamp(start), _timestamp(end)]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self._rows(sql, params)
+
+    def open_emergencies(self, since=None, limit=100):
+        """Unacknowledged emergency events, newest first"""
+        since = 0.0 if since is None else _timestamp(since)
+        return self._rows(
+            f"SELECT {', '.join('n.' + c for c in COLUMNS)} FROM open_emergencies AS o"
+            " JOIN notifications AS n ON n.id = o.notification_id"
+            " WHERE o.ts >= ? ORDER BY o.ts DESC LIMIT ?", (since, limit))
@@ -0,0 +1,359 @@
+"""Landmark inference in worker processes fed through shared-memory frame rings.
+
+Each stream (one session's camera) owns a ring of frame slots in a
+``multiprocessing.shared_memory`` block.  Submitting a frame copies the image
+into a free slot and sends only the slot number to the worker the stream is
+pinned to, so images are never pickled.  A worker keeps one landmarker per
+stream (MediaPipe tracks a hand across consecutive frames) and one shared
+classifier, and returns landmarks and class probabilities on a single result
+queue that a router thread fans out to per-stream queues.  Streams are spread
+over the workers, so throughput scales with cores as sessions are added and
+inference no longer competes with the Streamlit server for the GIL.
+
+A resolution change gives the stream a new ring; the old one is unlinked, and
+dropped by the worker, as soon as no frame in flight refers to it.  A worker
+that dies is restarted, and the frames its streams had in flight are counted
+as failed so they never hold slots or wait for a result that cannot come.
+"""
+import multiprocessing
+import queue
+import sys
+import threading
+import time
+
+import numpy as np
+
+from signlink.capture import LatestQueue, MediaPipeHands, Result
+from signlink.features import default_classifier
+
+_STOP = None
+
+# ==================== SHARED FRAME RING ====================
+class FrameRing:
+    """Fixed number of identically shaped frames in one shared-memory block"""
+
+    def __init__(self, slots, shape, dtype=np.uint8, name=None):
+        from multiprocessing import shared_memory
+        self.slots = slots
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        size = slots * int(np.prod(self.shape)) * self.dtype.itemsize
+        if name is None:
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+        self.name = self._shm.name
+        self.frames = np.ndarray((slots,) + self.shape, self.dtype, buffer=self._shm.buf)
+
+    @property
+    def spec(self):
+        return self.name, self.slots, self.shape, self.dtype.str
+
+    def close(self):
+        self.frames = None
+        self._shm.close()
+
+    def unlink(self):
+        self.close()
+        self._shm.unlink()
+
+# ==================== WORKER PROCESS ====================
+def _worker_main(tasks, results, landmarker_factory, classifier_factory):
+    classifier = classifier_factory() if classifier_factory is not None else None
+    rings = {}        # ring name -> FrameRing attached in this process
+    landmarkers = {}  # stream id -> landmarker
+    while True:
+        task = tasks.get()
+        if task is _STOP:
+            break
+        if task[0] in ("close", "detach"):
+            kind, stream_id, names = task
+            if kind == "close":
+                landmarker = landmarkers.pop(stream_id, None)
+                if landmarker is not None and hasattr(landmarker, "close"):
+                    landmarker.close()
+            for name in names:
+                if name in rings:
+                    rings.pop(name).close()
+            continue
+
+        _, stream_id, spec, slot, index, timestamp, landmarks = task
+        started = time.perf_counter()
+        if landmarks is None:
+            ring = rings.get(spec[0])
+            if ring is None:
+                try:
+                    ring = rings[spec[0]] = FrameRing(*spec[1:], name=spec[0])
+                except FileNotFoundError:
+                    continue  # stream closed while this frame was queued
+            landmarker = landmarkers.get(stream_id)
+            if landmarker is None:
+                landmarker = landmarkers[stream_id] = landmarker_factory()
+            landmarks = landmarker.process(ring.frames[slot])
+        gesture, confidence, proba = None, 0.0, None
+        if landmarks is not None and classifier is not None:
+            proba = classifier.predict_proba(landmarks)[0]
+            best = int(proba.argmax())
+            gesture, confidence = classifier.labels[best], float(proba[best])
+        results.put((stream_id, spec and spec[0], slot, index, timestamp, landmarks, gesture, confidence,
+                     proba, time.perf_counter() - started))
+
+    for landmarker in landmarkers.values():
+        if hasattr(landmarker, "close"):
+            landmarker.close()
+    for ring in rings.values():
+        ring.close()
+
+# ==================== STREAMS ====================
+class PoolStream:
+    """One session's frames in flight through an InferencePool
+
+    ``submit`` never blocks: when every slot is still being processed the
+    frame is dropped, like ``LatestQueue`` does for in-process inference.
+    Results arrive on ``results``, a small drop-oldest queue.
+    """
+
+    def __init__(self, pool, stream_id, worker, slots=4, results_size=4):
+        self.pool = pool
+        self.id = stream_id
+        self.worker = worker
+        self.slots = slots
+        self.ring = None
+        self._retired = {}    # ring name -> replaced FrameRing with frames still in flight
+        self._in_ring = {}    # ring name -> frames in flight in that ring
+        self._free = []
+        self._pending = {}    # frame index -> (submit time, ring name)
+        self._lock = threading.Lock()
+        self.results = LatestQueue(results_size)
+        self.submitted = 0
+        self.completed = 0
+        self.dropped = 0
+        self.failed = 0
+        self.closed = False
+
+    @property
+    def in_flight(self):
+        return len(self._pending)
+
+    def submit(self, frame):
+        """Send a frame to the stream's worker; returns False if it was dropped"""
+        spec, slot, ring = None, None, None
+        with self._lock:
+            if frame.landmarks is None:
+                image = frame.image
+                if self.ring is None or self.ring.shape != image.shape or self.ring.dtype != image.dtype:
+                    self._replace_ring(image.shape, image.dtype)
+                if not self._free:
+                    self.dropped += 1
+                    return False
+                slot = self._free.pop()
+                ring = self.ring
+                self._in_ring[ring.name] = self._in_ring.get(ring.name, 0) + 1
+            self._pending[frame.index] = (time.monotonic(), ring and ring.name)
+        if ring is not None:
+            ring.frames[slot] = image
+            spec = ring.spec
+        self.submitted += 1
+        self.pool._tasks[self.worker].put(("frame", self.id, spec, slot, frame.index, frame.timestamp,
+                                           frame.landmarks))
+        return True
+
+    def _replace_ring(self, shape, dtype):
+        # Resolution changed: frames still in flight keep the old ring alive until they come back
+        if self.ring is not None:
+            self._retired[self.ring.name] = self.ring
+            self._release_retired(self.ring.name)
+        self.ring = FrameRing(self.slots, shape, dtype)
+        self._free = list(range(self.slots))
+
+    def _release_retired(self, name):
+        # Called with the lock held; the worker has handled every task naming
+        # the ring once nothing is in flight in it, so it can let go too
+        if self._in_ring.get(name, 0) > 0 or name not in self._retired:
+            return
+        self._in_ring.pop(name, None)
+        self.pool._detach_rings(self, [name])
+        self._retired.pop(name).unlink()
+
+    def _deliver(self, ring_name, slot, index, timestamp, landmarks, gesture, confidence, proba, compute):
+        with self._lock:
+            pending = self._pending.pop(index, None)
+            if pending is None:
+                return  # failed with its worker
+            if slot is not None:
+                self._in_ring[ring_name] -= 1
+                if self.ring is not None and ring_name == self.ring.name:
+                    self._free.append(slot)
+                else:
+                    self._release_retired(ring_name)
+        self.completed += 1
+        self.results.put(Result(index, timestamp, landmarks, gesture, confidence, proba,
+                                time.monotonic() - pending[0]))
+
+    def _fail_pending(self):
+        """The stream's worker died: give up on every frame it had in flight"""
+        with self._lock:
+            self.failed += len(self._pending)
+            self._pending.clear()
+            self._in_ring.clear()
+            self._free = list(range(self.slots)) if self.ring is not None else []
+            for name in list(self._retired):
+                self._retired.pop(name).unlink()  # the restarted worker never attached them
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        with self._lock:
+            rings = list(self._retired.values()) + ([self.ring] if self.ring is not None else [])
+            self.ring = None
+            self._retired = {}
+        self.pool._close_stream(self, [ring.name for ring in rings])
+        for ring in rings:
+            ring.unlink()
+
+# ==================== POOL ====================
+class InferencePool:
+    """Worker processes running landmark extraction and classification
+
+    ``landmarker_factory`` and ``classifier_factory`` are called inside each
+    worker (so they must be picklable, e.g. module-level callables); by
+    default every worker runs MediaPipe Hands and the built-in classifier.
+    Workers start with the ``spawn`` method, which is safe from a threaded
+    server process.  The router checks every ``check_interval`` seconds that
+    the workers are alive and restarts any that died, up to ``max_restarts``
+    times per worker; past that, frames sent to the dead worker keep failing.
+    """
+
+    def __init__(self, workers=2, landmarker_factory=MediaPipeHands, classifier_factory=default_classifier,
+                 start_method="spawn", check_interval=1.0, max_restarts=3):
+        self.workers = workers
+        self.landmarker_factory = landmarker_factory
+        self.classifier_factory = classifier_factory
+        self._context = multiprocessing.get_context(start_method)
+        self._tasks = []
+        self._processes = []
+        self._results = None
+        self._router = None
+        self._streams = {}
+        self._load = [0] * workers
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self._closing = False
+        self.check_interval = check_interval
+        self.max_restarts = max_restarts
+        self._restarts = [0] * workers
+
+    def start(self):
+        if self._processes:
+            return self
+        self._closing = False
+        self._results = self._context.Queue()
+        self._tasks = [None] * self.workers
+        self._processes = [None] * self.workers
+        for number in range(self.workers):
+            self._spawn(number)
+        self._router = threading.Thread(target=self._route_results, name="signlink-pool-router", daemon=True)
+        self._router.start()
+        return self
+
+    def open_stream(self, slots=4, results_size=4):
+        """Register a frame stream, pinned to the least loaded worker"""
+        self.start()
+        with self._lock:
+            worker = self._load.index(min(self._load))
+            self._load[worker] += 1
+            stream = PoolStream(self, self._next_id, worker, slots, results_size)
+            self._streams[stream.id] = stream
+            self._next_id += 1
+        return stream
+
+    def _spawn(self, number):
+        # A fresh task queue: a worker killed inside get() can leave the old one locked
+        tasks = self._context.Queue()
+        process = self._context.Process(
+            target=_worker_main, name=f"signlink-inference-{number}", daemon=True,
+            args=(tasks, self._results, self.landmarker_factory, self.classifier_factory))
+        process.start()
+        self._tasks[number] = tasks
+        self._processes[number] = process
+
+    def _check_workers(self):
+        for number, process in enumerate(self._processes):
+            if process.is_alive() or self._closing:
+                continue
+            if self._restarts[number] < self.max_restarts:
+                print(f"Inference worker {number} exited with code {process.exitcode}; restarting it",
+                      file=sys.stderr)
+                self._restarts[number] += 1
+                self._spawn(number)
+            elif self._restarts[number] == self.max_restarts:
+                print(f"Inference worker {number} exited with code {process.exitcode}; not restarting it again",
+                      file=sys.stderr)
+                self._restarts[number] += 1
+            with self._lock:
+                streams = [stream for stream in self._streams.values() if stream.worker == number]
+            for stream in streams:
+                stream._fail_pending()
+
+    def _detach_rings(self, stream, ring_names):
+        if self._processes:
+            self._tasks[stream.worker].put(("detach", stream.id, ring_names))
+
+    def _close_stream(self, stream, ring_names):
+        with self._lock:
+            if self._streams.pop(stream.id, None) is not None:
+                self._load[stream.worker] -= 1
+        if self._processes:
+            self._tasks[stream.worker].put(("close", stream.id, ring_names))
+
+    def _route_results(self):
+        checked = time.monotonic()
+        while True:
+            try:
+                item = self._results.get(timeout=self.check_interval)
+            except queue.Empty:
+                item = ()
+            if time.monotonic() - checked >= self.check_interval:
+                self._check_workers()
+                checked = time.monotonic()
+            if item is _STOP:
+                break
+            if not item:
+                continue
+            stream = self._streams.get(item[0])
+            if stream is not None:
+                stream._deliver(*item[1:])
+
+    def close(self, timeout=5.0):
+        self._closing = True
+        for stream in list(self._streams.values()):
+            stream.close()
+        for tasks in self._tasks:
+            tasks.put(_STOP)
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        if self._router is not None:
+            self._results.put(_STOP)
+            self._router.join(timeout)
+        self._tasks, self._processes, self._router = [], [], None
+
+    def stats(self):
+        streams = list(self._streams.values())
+        return {
+            "workers": self.workers,
+            "streams": len(streams),
+            "submitted": sum(s.submitted for s in streams),
+            "completed": sum(s.completed for s in streams),
+            "dropped": sum(s.dropped for s in streams),
+            "failed": sum(s.failed for s in streams),
+            "restarts": sum(min(count, self.max_restarts) for count in self._restarts),
+        }
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
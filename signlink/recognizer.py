@@ -0,0 +1,494 @@
+"""Gesture recognizers and gesture dispatch, independent of the Streamlit runtime.
+
+Recognizers read and write a ``state`` object with attribute access; the app
+passes ``st.session_state``, replay and tooling pass a ``RecognizerState``.
+"""
+import functools
+import random
+import sys
+import time
+import webbrowser
+from datetime import datetime
+from types import SimpleNamespace
+
+from signlink.bindings import GESTURES, default_bindings
+from signlink.coalesce import NEW, NotificationCoalescer
+from signlink.events import AlertRaised, EventBus, GestureCommitted, StabilityChanged, UrlRequested
+from signlink.notify import format_notification
+from signlink.ringbuffer import RingBuffer
+from signlink.textbuffer import SectorBuffers
+
+# Sectors, quick actions, patient requests and gesture bindings live in
+# signlink/gestures.json (see signlink.bindings)
+GESTURE_COOLDOWN = 2.0  # seconds between committed gestures
+
+# Words that trigger an action when typed in a sector (see signlink.triggers).
+# Each is matched as a whole word once its closing space is typed, so keep
+# them to explicit command tokens rather than words used in sentences.
+TRIGGERS = {
+    "education": {"GOOGLE": {"name": "Google", "url": "https://www.google.com"}},
+}
+
+# Temporal smoothing of per-frame class probabilities (see signlink.smoothing)
+SMOOTHING = {
+    "mode": "vote",
+    "window": 8,
+    "alpha": 0.35,
+    "commit_threshold": 0.875,  # 7 of the last 8 frames
+    "release_threshold": 0.4,
+    "min_frames": 2,
+}
+
+# Consumers of committed gestures: the binding actions each runs, its
+# delivery policy and queue size (see signlink.events).  The text buffer runs
+# inline because the next gesture depends on it: its mode switches pick that
+# gesture's binding, and triggers and completions read the text typed so far.
+# The others queue losslessly on their own threads, as do the emergency emails
+# they cause; only browser launches are dropped once a few are pending.
+GESTURE_CONSUMERS = {
+    "text": (("type", "delete", "complete", "move_cursor", "set_mode"), "inline", None),
+    "presentation": (("slide",), "block", 64),
+    "healthcare": (("request",), "block", 1000),
+    "quick_actions": (("quick_action",), "block", 64),
+}
+
+# ==================== RECOGNIZER STATE ====================
+def is_emergency(notification):
+    return notification["emergency"]
+
+
+class RecognizerState(SimpleNamespace):
+    """Plain stand-in for st.session_state when running outside Streamlit"""
+    def __init__(self, **overrides):
+        fields = {
+            "current_sector": "enterprise",
+            "text_buffers": SectorBuffers(),
+            "feedback_message": "",
+            "asl_prediction": "",
+            "gesture_stability": 0.0,
+            "last_gesture_time": 0,
+            "current_slide": 1,
+            "total_slides": 10,
+            "email_notifications": RingBuffer(1000, flag=is_emergency),
+            "gesture_hold_start": None,
+            "patient_id": "default",
+            "notification_coalescer": NotificationCoalescer(),
+            "trigger_matcher": None,
+            "gesture_mode": "type",
+        }
+        fields.update(overrides)
+        super().__init__(**fields)
+
+
+@functools.lru_cache(maxsize=1)
+def default_triggers():
+    """The built-in TRIGGERS, compiled once per process"""
+    from signlink.triggers import TriggerSet
+    return TriggerSet(TRIGGERS)
+
+
+@functools.lru_cache(maxsize=1)
+def default_completions():
+    """Word completion over the built-in sector vocabularies, compiled once per process"""
+    from signlink.completion import WordCompleter
+    from signlink.vocabulary import vocabularies
+    return WordCompleter(vocabularies())
+
+# ==================== GESTURE RECOGNITION SIMULATION ====================
+class GestureRecognitionSimulator:
+    def __init__(self, state, clock=time.time, open_url=webbrowser.open, notifier=None,
+                 notification_log=None, smoothing=None, triggers=None, completions=None, bindings=None, bus=None):
+        self.gestures = list(GESTURES)
+        self.state = state
+        self.clock = clock
+        self.open_url = open_url
+        self.notifier = notifier
+        self.notification_log = notification_log
+        self.smoothing = dict(SMOOTHING, **(smoothing or {}))
+        self.triggers = triggers
+        self.completions = completions
+        self.gesture_bindings = bindings
+        # Handlers the names in a Binding refer to
+        self.handlers = {
+            "type": self._type_gesture,
+            "delete": self._delete_gesture,
+            "complete": self._complete_gesture,
+            "move_cursor": self._move_cursor,
+            "slide": self._slide,
+            "request": self._request,
+            "quick_action": self._quick_action,
+            "set_mode": self._set_mode,
+        }
+        self.smoother = None
+        self.current_gesture = None
+        self.simulated_target = None
+        self.last_result_index = -1
+        self.published_stability = None
+        self.bus = EventBus() if bus is None else bus
+        self.consumers = {
+            name: self.bus.subscribe(GestureCommitted, self._gesture_consumer(frozenset(actions)), policy, maxsize,
+                                     name)
+            for name, (actions, policy, maxsize) in GESTURE_CONSUMERS.items()
+        }
+        self.bus.subscribe(UrlRequested, self._open_url, policy="drop_newest", maxsize=8, name="browser")
+        self.bus.subscribe(AlertRaised, self._email_alert, policy="block", maxsize=1000, name="email")
+
+    def use_labels(self, labels):
+        """Reset temporal smoothing for a classifier emitting probabilities over ``labels``"""
+        from signlink.smoothing import GestureSmoother
+        self.smoother = GestureSmoother(labels, **self.smoothing)
+
+    def detect_gesture(self):
+        """Simulate a signer holding random gestures, smoothed like live frames"""
+        from signlink.smoothing import peaked_probabilities
+        if self.smoother is None:
+            self.use_labels(self.gestures)
+
+        # A new sign starts on 40% of idle frames and is held until it commits
+        if self.simulated_target is None and random.random() < 0.4:
+            self.simulated_target = random.randrange(len(self.gestures))
+        proba = None
+        if self.simulated_target is not None:
+            proba = peaked_probabilities(len(self.gestures), self.simulated_target, random.uniform(0.7, 0.98))
+        if self.observe(self.last_result_index + 1, proba) is not None:
+            self.simulated_target = None
+        return self.current_gesture
+
+    def observe(self, index, proba):
+        """Smooth one classified frame (class probabilities, or None without a hand) and commit when stable"""
+        state = self.state
+        self.last_result_index = index
+        current_time = self.clock()
+        ready = current_time - state.last_gesture_time > GESTURE_COOLDOWN
+        gesture = self.smoother.update(proba, allow_commit=ready)
+        state.gesture_stability = self.smoother.confidence
+        stability = round(state.gesture_stability, 2)
+        if stability != self.published_stability:
+            self.published_stability = stability
+            self.bus.publish(StabilityChanged(stability, index, current_time))
+        if gesture is None:
+            return None
+        self.current_gesture = gesture
+        self.process_gesture(gesture)
+        state.last_gesture_time = current_time
+        return gesture
+
+    def bindings(self):
+        """The current compiled gesture bindings"""
+        return (self.gesture_bindings or default_bindings()).current()
+
+    def process_gesture(self, gesture):
+        """Publish the gesture with its binding in the current sector and mode
+
+        The consumer of the binding's action runs it (see GESTURE_CONSUMERS).
+        One-shot modes such as "command" revert to the default mode after one
+        gesture.
+        """
+        state = self.state
+        bindings = self.bindings()
+        mode = state.gesture_mode
+        if mode not in bindings.modes:
+            mode = state.gesture_mode = bindings.default_mode
+
+        binding = bindings.lookup(state.current_sector, mode, gesture)
+        self.bus.publish(GestureCommitted(gesture, state.current_sector, mode, binding, self.clock(),
+                                          state.patient_id))
+        if bindings.one_shot(mode) and state.gesture_mode == mode:
+            if binding is None:
+                state.feedback_message = f"✖️ Nothing bound to {gesture}"
+            state.gesture_mode = bindings.default_mode
+
+        state.asl_prediction = gesture
+
+    def settle(self, timeout=1.0):
+        """Wait until every committed gesture was run by its consumer; False on timeout
+
+        Only the gesture consumers are waited for, not the browser launches
+        or emails they caused.
+        """
+        deadline = time.monotonic() + timeout
+        return all(subscription.flush(max(0.0, deadline - time.monotonic()))
+                   for subscription in self.consumers.values())
+
+    def _gesture_consumer(self, actions):
+        """Bus handler running bindings whose action is in ``actions``
+
+        Handlers get the event, so they act on the sector and patient the
+        gesture was signed in.  A binding's feedback message is shown unless
+        its handler returns False (nothing happened).
+        """
+        def consume(event):
+            binding = event.binding
+            if binding is None or binding.action not in actions:
+                return
+            state = self.state
+            previous = state.feedback_message
+            if binding.feedback:
+                state.feedback_message = binding.feedback.format(gesture=event.gesture)
+            if self.handlers[binding.action](event, **binding.params) is False:
+                state.feedback_message = previous
+        return consume
+
+    def _open_url(self, event):
+        self.open_url(event.url)
+
+    def _email_alert(self, event):
+        # Email new requests that are emergencies or were held
+        if event.outcome == NEW and event.notification["emergency"]:
+            self.send_healthcare_notification(event.notification)
+
+    def _type_gesture(self, event, text=None):
+        self.type_text(event.gesture if text is None else text)
+
+    def _delete_gesture(self, event, count=1):
+        return bool(self.delete_text(count))
+
+    def _complete_gesture(self, event, fallback_mode=None):
+        # One gesture finishes the word being spelled; otherwise it can switch mode
+        if self.complete_word() is None:
+            if fallback_mode is None:
+                return False
+            self.set_mode(fallback_mode)
+
+    def _move_cursor(self, event, offset):
+        self.buffer.move(offset)
+
+    def _slide(self, event, step):
+        if step > 0:
+            self.next_slide()
+        else:
+            self.previous_slide()
+
+    def _request(self, event):
+        self.process_healthcare_gesture(event.gesture, event.sector, event.patient)
+
+    def _quick_action(self, event, name):
+        return self.run_quick_action(name, event.sector)
+
+    def _set_mode(self, event, mode):
+        self.set_mode(mode)
+
+    def set_mode(self, mode):
+        """Switch how gestures are interpreted, showing the mode's prompt if it has one"""
+        self.state.gesture_mode = mode
+        prompt = self.bindings().modes[mode].get("prompt")
+        if prompt:
+            self.state.feedback_message = prompt
+
+    @property
+    def buffer(self):
+        """The current sector's typed text (a TextBuffer)"""
+        return self.state.text_buffers[self.state.current_sector]
+
+    def trigger_matcher(self):
+        """The session's trigger matcher, in step with the text before the cursor"""
+        state = self.state
+        buffer = self.buffer
+        matcher = state.trigger_matcher
+        triggers = self.triggers or default_triggers()
+        if matcher is None or matcher.sector != state.current_sector or matcher.automaton is not triggers.automaton(matcher.sector):
+            matcher = state.trigger_matcher = triggers.matcher(state.current_sector)
+        if matcher.version != buffer.version or len(matcher) != buffer.cursor:
+            matcher.resync(buffer.before_cursor(), buffer.version)
+        return matcher
+
+    def type_text(self, text, triggers=True):
+        """Type characters at the cursor and run the first sector trigger they complete, if ``triggers``"""
+        buffer = self.buffer
+        matcher = self.trigger_matcher()
+        buffer.insert(text)
+        found = matcher.push(text)
+        matcher.version = buffer.version
+        if found and triggers:
+            self.run_trigger(*found[0])
+
+    def delete_text(self, count=1):
+        """Delete characters before the cursor; return the deleted text"""
+        buffer = self.buffer
+        matcher = self.trigger_matcher()
+        removed = buffer.delete(count)
+        matcher.pop(len(removed))
+        matcher.version = buffer.version
+        return removed
+
+    def suggestions(self, k=3):
+        """Completions of the word being typed, most frequent first"""
+        state = self.state
+        return (self.completions or default_completions()).suggest(state.current_sector, self.buffer.current_word(), k)
+
+    def complete_word(self, word=None):
+        """Finish the current word with ``word`` (default: the top completion) and a space
+
+        Returns the completed word, or None if there was nothing to complete.
+        A completed word never runs a trigger: the signer accepted a
+        suggestion, not a command.
+        """
+        state = self.state
+        typed = self.buffer.current_word()
+        if word is None:
+            word = (self.completions or default_completions()).best(state.current_sector, typed)
+        if not word or not typed or not word.upper().startswith(typed.upper()):
+            return None
+        state.feedback_message = f"✨ Completed: {word}"
+        self.type_text(word[len(typed):].upper() + " ", triggers=False)
+        return word
+
+    def run_trigger(self, word, action):
+        """Open the trigger's URL (or report the action) and remove the trigger word
+
+        Only the word and its closing space are removed; text typed before it stays.
+        """
+        state = self.state
+        if action.get("url"):
+            self.bus.publish(UrlRequested(action["url"], action["name"], self.clock()))
+            state.feedback_message = f"🌐 Opening {action['name']}..."
+        else:
+            state.feedback_message = f"✅ {action['name']} activated"
+        self.delete_text(len(word) + 1)
+
+    def run_quick_action(self, name, sector=None):
+        """Run the quick action called ``name`` of ``sector`` (default: the current one); False if there is none"""
+        state = self.state
+        sector = state.current_sector if sector is None else sector
+        bindings = self.bindings()
+        action = bindings.quick_action(sector, name)
+        if action is None:
+            return False
+        if action["url"]:
+            self.bus.publish(UrlRequested(action["url"], name, self.clock()))
+            state.feedback_message = f"🌐 Opening {name}..."
+        else:
+            state.feedback_message = f"✅ {name} activated in {bindings.sectors[sector]['name']} mode"
+        return True
+
+    def process_healthcare_gesture(self, gesture, sector=None, patient=None):
+        """Send the patient request signed with ``gesture``, if the sector has one
+
+        ``sector`` and ``patient`` default to the session's current ones.
+        """
+        state = self.state
+        sector = state.current_sector if sector is None else sector
+        patient = state.patient_id if patient is None else patient
+        gesture_info = self.bindings().request(sector, gesture)
+        if gesture_info is not None:
+            current_time = datetime.fromtimestamp(self.clock())
+
+            # Track gesture hold time for emergency tagging
+            if state.gesture_hold_start is None:
+                state.gesture_hold_start = current_time
+
+            hold_duration = (current_time - state.gesture_hold_start).total_seconds()
+
+            # Create notification
+            notification = {
+                "gesture": gesture,
+                "name": gesture_info["name"],
+                "description": gesture_info["description"],
+                "timestamp": current_time,
+                "emergency": gesture_info["emergency"] or hold_duration > 3.0,
+                "hold_duration": hold_duration,
+                "patient": patient,
+                "count": 1
+            }
+
+            # Fold repeats into the earlier request; emergencies always pass through
+            outcome, shown = state.notification_coalescer.offer(notification, self.clock())
+            self.bus.publish(AlertRaised(notification, outcome, sector))
+            if outcome != NEW:
+                if shown is None:
+                    state.feedback_message = f"⏳ {gesture_info['name']} request limit reached"
+                else:
+                    state.feedback_message = f"🏥 {gesture_info['name']} requested (×{shown['count']})"
+            else:
+                state.email_notifications.append(notification)
+                if notification["emergency"]:
+                    state.feedback_message = f"🚨 EMERGENCY: {gesture_info['name']} - Notification sent!"
+                else:
+                    state.feedback_message = f"🏥 {gesture_info['name']} requested"
+
+            # Audit the request only once it was raised; the log never holds up an alert
+            if self.notification_log is not None:
+                self.notification_log.append(notification, outcome)
+
+            # Reset hold timer
+            state.gesture_hold_start = None
+
+    def send_healthcare_notification(self, notification):
+        """Hand an emergency notification to the SMTP dispatcher (called on the bus's email thread)
+
+        Waits for room in the dispatcher's queue rather than dropping it.
+        """
+        if self.notifier is None:
+            subject, message = format_notification(notification)
+            print(f"EMAIL NOT CONFIGURED: {subject}\n{message}", file=sys.stderr)
+            return False
+        return self.notifier.submit(notification, timeout=None)
+
+    def next_slide(self):
+        """Navigate to next presentation slide"""
+        if self.state.current_slide < self.state.total_slides:
+            self.state.current_slide += 1
+            self.state.feedback_message = "➡️ Next slide"
+
+    def previous_slide(self):
+        """Navigate to previous presentation slide"""
+        if self.state.current_slide > 1:
+            self.state.current_slide -= 1
+            self.state.feedback_message = "⬅️ Previous slide"
+
+class GestureRecognizer(GestureRecognitionSimulator):
+    """Camera-backed recognizer reading results from a background RecognitionPipeline"""
+    def __init__(self, state, clock=time.time, open_url=webbrowser.open, notifier=None,
+                 notification_log=None, smoothing=None, triggers=None, completions=None, bindings=None, bus=None):
+        super().__init__(state, clock, open_url, notifier, notification_log, smoothing, triggers, completions,
+                         bindings, bus)
+        self.pipeline = None
+
+    def start(self, source=None, classifier=None, pool=None, roi_tracking=False, scheduler=None):
+        """Start capture and landmark extraction on the given frame source
+
+        With an ``InferencePool``, landmarks and probabilities come from its
+        worker processes; ``classifier`` must then have the same labels.
+        ``roi_tracking`` crops frames around the last hand (see RoiTracker)
+        and an ``AdaptiveScheduler`` sets the processed frame rate.
+        """
+        from signlink.capture import CameraSource, RecognitionPipeline
+        from signlink.features import default_classifier
+        self.stop()
+        classifier = classifier or default_classifier()
+        self.pipeline = RecognitionPipeline(source or CameraSource(), classifier=classifier, pool=pool,
+                                            roi_tracking=roi_tracking, scheduler=scheduler).start()
+        self.use_labels(classifier.labels)
+        self.last_result_index = -1
+
+    def stop(self):
+        """Stop the background pipeline and release the camera"""
+        if self.pipeline is not None:
+            self.pipeline.stop()
+            self.pipeline = None
+
+    @property
+    def running(self):
+        return self.pipeline is not None and self.pipeline.running
+
+    def poll(self, timeout=None, on_commit=None):
+        """Smooth every result published since the last poll; return how many gestures committed
+
+        Waits up to ``timeout`` seconds for a result if none is pending, and
+        calls ``on_commit(result, gesture)`` right after each commit.
+        """
+        committed = 0
+        if self.pipeline is not None:
+            for result in self.pipeline.drain(timeout):
+                if result.index != self.last_result_index:
+                    gesture = self.observe(result.index, result.proba)
+                    if gesture is not None:
+                        committed += 1
+                        if on_commit is not None:
+                            on_commit(result, gesture)
+        return committed
+
+    def detect_gesture(self):
+        """Smooth every result published since the last poll and commit gestures that stay stable"""
+        self.poll()
+        return self.current_gesture
@@ -0,0 +1,305 @@
+"""Offline replay of recorded clips and landmark dumps through the recognizer.
+
+Frames are classified in large batches and then fed to
+``GestureRecognizer.observe`` one by one under a virtual clock, so the
+cooldown and temporal smoothing behave exactly as live while the run itself
+goes as fast as the CPU allows.
+
+    python -m signlink.replay session.npz clip.mp4 --labels labels.csv
+"""
+import argparse
+import csv
+import json
+import time
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+NO_HAND = ""
+
+# ==================== VIRTUAL CLOCK ====================
+class VirtualClock:
+    """Callable clock whose time only moves when told to"""
+    def __init__(self, start=0.0):
+        self.now = float(start)
+
+    def __call__(self):
+        return self.now
+
+    def set(self, now):
+        self.now = float(now)
+
+    def advance(self, seconds):
+        self.now += seconds
+
+# ==================== LOADING ====================
+def load_landmarks(path, fps=30.0):
+    """Load a landmark dump, returning (landmarks, timestamps, frame_labels or None)
+
+    ``.npy`` files hold an (n, 21, 3) array.  ``.npz`` files hold ``landmarks``
+    and optionally ``timestamps`` (seconds) and per-frame ``labels``.  Frames
+    without a hand are rows of NaN.
+    """
+    path = Path(path)
+    labels = None
+    if path.suffix == ".npz":
+        with np.load(path, allow_pickle=False) as data:
+            landmarks = data["landmarks"]
+            timestamps = data["timestamps"] if "timestamps" in data else None
+            if "labels" in data:
+                labels = data["labels"].astype(str)
+    else:
+        landmarks = np.load(path, allow_pickle=False)
+        timestamps = None
+    landmarks = np.asarray(landmarks, dtype=np.float32)
+    if timestamps is None:
+        timestamps = np.arange(len(landmarks)) / fps
+    return landmarks, np.asarray(timestamps, dtype=np.float64), labels
+
+
+def extract_video_landmarks(path, landmarker=None):
+    """Decode a clip and run landmark extraction on every frame"""
+    from signlink.capture import MediaPipeHands, VideoFileSource
+
+    source = VideoFileSource(path, realtime=False)
+    landmarker = landmarker or MediaPipeHands()
+    landmarks, timestamps = [], []
+    try:
+        while (frame := source.read()) is not None:
+            points = landmarker.process(frame.image)
+            landmarks.append(np.full((21, 3), np.nan, np.float32) if points is None else points)
+            timestamps.append(frame.timestamp)
+    finally:
+        source.close()
+    return np.asarray(landmarks, dtype=np.float32).reshape(-1, 21, 3), np.asarray(timestamps)
+
+
+def load_label_segments(path):
+    """Read ``start,end,label`` rows (seconds) from a CSV label file"""
+    segments = []
+    with open(path, newline="") as handle:
+        for row in csv.reader(handle):
+            if not row or row[0].strip().lower() in ("start", "#"):
+                continue
+            segments.append((float(row[0]), float(row[1]), row[2].strip().upper()))
+    return segments
+
+
+def labels_for_frames(segments, timestamps):
+    """Expand label segments to one label per frame timestamp"""
+    labels = np.full(len(timestamps), NO_HAND, dtype=object)
+    for start, end, label in segments:
+        labels[(timestamps >= start) & (timestamps <= end)] = label
+    return labels.astype(str)
+
+
+def segments_from_frames(labels, timestamps):
+    """Collapse runs of equal per-frame labels into (start, end, label) segments"""
+    segments = []
+    start = 0
+    for i in range(1, len(labels) + 1):
+        if i == len(labels) or labels[i] != labels[start]:
+            if labels[start] != NO_HAND:
+                segments.append((timestamps[start], timestamps[i - 1], labels[start]))
+            start = i
+    return segments
+
+# ==================== REPLAY ====================
+def classify_frames(landmarks, classifier, batch_size=4096):
+    """Classify every frame in batches
+
+    Returns per-frame gestures, confidences and class probabilities; frames
+    without a hand get no gesture and an all-zero probability row.
+    """
+    gestures = np.full(len(landmarks), None, dtype=object)
+    confidences = np.zeros(len(landmarks), dtype=np.float32)
+    probabilities = np.zeros((len(landmarks), len(classifier.labels)), dtype=np.float32)
+    present = np.flatnonzero(~np.isnan(landmarks).any(axis=(1, 2)))
+    labels = np.asarray(classifier.labels, dtype=object)
+    for offset in range(0, len(present), batch_size):
+        rows = present[offset:offset + batch_size]
+        proba = classifier.predict_proba(landmarks[rows])
+        best = proba.argmax(axis=1)
+        gestures[rows] = labels[best]
+        confidences[rows] = proba[np.arange(len(rows)), best]
+        probabilities[rows] = proba
+    return gestures, confidences, probabilities
+
+
+def replay_session(landmarks, timestamps, classifier=None, sector="enterprise",
+                   frame_labels=None, segments=None, grace=1.0, smoothing=None):
+    """Replay one session and return a report dict"""
+    from signlink.features import default_classifier
+    from signlink.recognizer import GestureRecognizer, RecognizerState
+
+    classifier = classifier or default_classifier()
+    clock = VirtualClock(timestamps[0] if len(timestamps) else 0.0)
+    state = RecognizerState(current_sector=sector, last_gesture_time=clock() - 1e9)
+    recognizer = GestureRecognizer(state, clock=clock, open_url=lambda url: None, smoothing=smoothing)
+    recognizer.use_labels(classifier.labels)
+
+    started = time.perf_counter()
+    gestures, confidences, probabilities = classify_frames(landmarks, classifier)
+    commits = []
+    try:
+        for index, (timestamp, proba) in enumerate(zip(timestamps, probabilities)):
+            clock.set(timestamp)
+            committed = recognizer.observe(index, proba)
+            if committed is not None:
+                commits.append((float(timestamp), committed))
+    finally:
+        recognizer.bus.close()  # queued consumers finish here, not 30 s later
+    elapsed = time.perf_counter() - started
+
+    report = {
+        "frames": len(landmarks),
+        "seconds": elapsed,
+        "frames_per_second": len(landmarks) / elapsed if elapsed else 0.0,
+        "realtime_factor": (float(timestamps[-1] - timestamps[0]) / elapsed) if elapsed and len(timestamps) > 1 else 0.0,
+        "gestures_committed": len(commits),
+        "commits": commits,
+        "typed_text": recognizer.buffer.text,
+    }
+    if frame_labels is None and segments is not None:
+        frame_labels = labels_for_frames(segments, timestamps)
+    if frame_labels is not None:
+        if segments is None:
+            segments = segments_from_frames(frame_labels, timestamps)
+        report["letters"] = score(frame_labels, gestures, segments, commits, grace)
+        report.update(summarize_letters(report["letters"]))
+    return report
+
+
+def _letter_entry():
+    return {"frames": 0, "frame_correct": 0, "segments": 0, "segments_committed": 0,
+            "false_commits": 0, "time_to_commit_total": 0.0}
+
+
+def _derive(entry):
+    entry["frame_accuracy"] = entry["frame_correct"] / entry["frames"] if entry["frames"] else 0.0
+    entry["commit_accuracy"] = entry["segments_committed"] / entry["segments"] if entry["segments"] else 0.0
+    entry["mean_time_to_commit"] = (entry["time_to_commit_total"] / entry["segments_committed"]
+                                    if entry["segments_committed"] else 0.0)
+    return entry
+
+
+def score(frame_labels, gestures, segments, commits, grace=1.0):
+    """Per-letter accuracy, false commits and time-to-commit against labelled segments
+
+    A commit is correct when it falls inside (or ``grace`` seconds after) a
+    segment of the same letter; every other commit is a false commit,
+    counted against the committed letter.  Time-to-commit is measured from
+    the segment start to its first correct commit.
+    """
+    stats = {}
+    labelled = frame_labels != NO_HAND
+    correct = labelled & (gestures.astype(str) == frame_labels)
+    for letter in np.unique(frame_labels[labelled]):
+        rows = frame_labels == letter
+        entry = stats[letter] = _letter_entry()
+        entry["frames"] = int(rows.sum())
+        entry["frame_correct"] = int(correct[rows].sum())
+    matched = set()
+    for start, end, letter in segments:
+        entry = stats.setdefault(letter, _letter_entry())
+        entry["segments"] += 1
+        hits = [i for i, (t, g) in enumerate(commits) if start <= t <= end + grace and g == letter]
+        if hits:
+            entry["segments_committed"] += 1
+            entry["time_to_commit_total"] += commits[hits[0]][0] - start
+            matched.update(hits)
+    for i, (t, gesture) in enumerate(commits):
+        if i not in matched:
+            stats.setdefault(gesture, _letter_entry())["false_commits"] += 1
+    return {letter: _derive(entry) for letter, entry in stats.items()}
+
+
+def summarize_letters(letters):
+    """Totals across letters: false commits and mean time-to-commit"""
+    committed = sum(entry["segments_committed"] for entry in letters.values())
+    return {
+        "false_commits": sum(entry["false_commits"] for entry in letters.values()),
+        "mean_time_to_commit": (sum(entry["time_to_commit_total"] for entry in letters.values()) / committed
+                                if committed else 0.0),
+    }
+
+
+def merge_reports(reports):
+    """Aggregate per-session reports into one summary"""
+    frames = sum(r["frames"] for r in reports)
+    seconds = sum(r["seconds"] for r in reports)
+    letters = {}
+    for report in reports:
+        for letter, entry in report.get("letters", {}).items():
+            total = letters.setdefault(letter, Counter())
+            total.update({k: v for k, v in entry.items() if not k.endswith("accuracy") and not k.startswith("mean_")})
+    letters = {letter: _derive(dict(entry)) for letter, entry in sorted(letters.items())}
+    summary = {
+        "sessions": len(reports),
+        "frames": frames,
+        "seconds": seconds,
+        "frames_per_second": frames / seconds if seconds else 0.0,
+        "gestures_committed": sum(r["gestures_committed"] for r in reports),
+        "letters": letters,
+    }
+    summary.update(summarize_letters(letters))
+    return summary
+
+
+def replay_path(path, labels=None, sector="enterprise", classifier=None, fps=30.0, smoothing=None):
+    """Replay a single .npy/.npz dump or video clip"""
+    path = Path(path)
+    frame_labels = None
+    if path.suffix in (".npy", ".npz"):
+        landmarks, timestamps, frame_labels = load_landmarks(path, fps)
+    else:
+        landmarks, timestamps = extract_video_landmarks(path)
+    segments = load_label_segments(labels) if labels else None
+    return replay_session(landmarks, timestamps, classifier, sector, frame_labels, segments,
+                          smoothing=smoothing)
+
+# ==================== CLI ====================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay recorded sessions through the recognizer")
+    parser.add_argument("paths", nargs="+", help=".npy/.npz landmark dumps or video clips")
+    parser.add_argument("--labels", help="CSV of start,end,label segments (single path only)")
+    parser.add_argument("--sector", default="enterprise")
+    parser.add_argument("--fps", type=float, default=30.0, help="frame rate for dumps without timestamps")
+    parser.add_argument("--model", help="saved LetterClassifier .npz")
+    parser.add_argument("--smoothing", choices=("ema", "vote"), help="temporal smoothing mode")
+    parser.add_argument("--window", type=int, help="smoothing window in frames (vote mode)")
+    parser.add_argument("--alpha", type=float, help="EMA weight of the newest frame")
+    parser.add_argument("--commit", type=float, help="smoothed probability needed to commit")
+    parser.add_argument("--release", type=float, help="smoothed probability below which a held sign releases")
+    parser.add_argument("--json", action="store_true", help="print the full report as JSON")
+    args = parser.parse_args(argv)
+    if args.labels and len(args.paths) > 1:
+        parser.error("--labels applies to a single path; store per-frame labels in .npz dumps instead")
+
+    classifier = None
+    if args.model:
+        from signlink.features import LetterClassifier
+        classifier = LetterClassifier.load(args.model)
+    smoothing = {key: value for key, value in (
+        ("mode", args.smoothing), ("window", args.window), ("alpha", args.alpha),
+        ("commit_threshold", args.commit), ("release_threshold", args.release)) if value is not None}
+    reports = [replay_path(path, args.labels, args.sector, classifier, args.fps, smoothing)
+               for path in args.paths]
+    summary = merge_reports(reports)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+    print(f"{summary['sessions']} sessions, {summary['frames']} frames in {summary['seconds']:.2f}s "
+          f"({summary['frames_per_second']:.0f} frames/s), {summary['gestures_committed']} gestures committed")
+    if summary["letters"]:
+        print(f"{summary['false_commits']} false commits, "
+              f"mean time-to-commit {summary['mean_time_to_commit'] * 1000:.0f} ms")
+    for letter, entry in summary["letters"].items():
+        print(f"  {letter}: frame accuracy {entry['frame_accuracy']:.1%} ({entry['frames']} frames), "
+              f"commit accuracy {entry['commit_accuracy']:.1%} ({entry['segments']} segments), "
+              f"{entry['false_commits']} false, {entry['mean_time_to_commit'] * 1000:.0f} ms to commit")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,380 @@
+"""Offline retrieval over per-sector FAQ documents for the chat assistant.
+
+Each sector's corpus is every ``*.md`` file under ``<corpus>/<sector>/``;
+a ``## `` heading starts a document (the heading is its question, the body its
+answer).  Documents are ranked with BM25.  The per-term document weights are
+precomputed into a sparse term-by-document (CSR) matrix saved as ``.npy`` files
+and memory-mapped, so a query only touches the rows of its own terms and
+answers in microseconds.
+
+The documents, vocabulary and per-document term counts are stored the same
+way (strings as a byte blob plus offsets), so opening an index reads no more
+than a small ``meta.json`` and maps the rest.
+
+Index generations are addressed by the corpus files' names, sizes and
+modification times: an unchanged corpus reopens its existing index, and a
+changed one is rebuilt in full, re-tokenizing only the documents whose text
+changed.  Everything runs locally; if the index directory is not writable
+the index is kept in memory instead.
+"""
+import functools
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+
+import numpy as np
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+FAQ_DIR = os.environ.get("SIGNLINK_FAQ_DIR", os.path.join(_HERE, "faq"))
+FAQ_INDEX = os.environ.get("SIGNLINK_FAQ_INDEX", os.path.join(os.path.dirname(_HERE), "signlink_faq_index"))
+
+STOPWORDS = frozenset("""
+a an and are as at be but by can do does for from had has have how i if in into is it its me my no not
+of on or our so than that the their them then there these they this to up was we what when where which
+who why will with you your
+""".split())
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    """Lower-case word tokens without stopwords, with a plural "s" stripped"""
+    tokens = []
+    for token in _TOKEN.findall(text.lower()):
+        if token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+# ==================== CORPUS ====================
+def parse_documents(path):
+    """``[{"id", "title", "text"}]`` for each ``## `` section of a markdown file"""
+    name = os.path.basename(path)
+    documents = []
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            if line.startswith("## "):
+                documents.append({"id": f"{name}#{len(documents)}", "title": line[3:].strip(), "text": ""})
+            elif documents:
+                documents[-1]["text"] += line
+    for document in documents:
+        document["text"] = document["text"].strip()
+    return documents
+
+
+def corpus_files(directory):
+    """Sorted ``*.md`` paths of one sector's corpus"""
+    if not os.path.isdir(directory):
+        return []
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(".md"))
+
+
+def corpus_signature(paths):
+    """Digest of the corpus files' names, sizes and modification times"""
+    digest = hashlib.sha1()
+    for path in paths:
+        stat = os.stat(path)
+        digest.update(f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()[:16]
+
+
+def _document_hash(document):
+    return hashlib.sha1(f"{document['title']}\n{document['text']}".encode()).digest()
+
+# ==================== PACKED STRINGS ====================
+class StringTable:
+    """Strings packed into one UTF-8 byte blob plus an array of offsets
+
+    Both are plain arrays, so a saved table is memory-mapped on open and only
+    the strings actually read are paged in.
+    """
+
+    def __init__(self, offsets, blob):
+        self.offsets = offsets
+        self.blob = blob
+
+    @classmethod
+    def pack(cls, strings):
+        encoded = [string.encode("utf-8") for string in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(item) for item in encoded], out=offsets[1:])
+        return cls(offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def raw(self, i):
+        return self.blob[self.offsets[i]:self.offsets[i + 1]].tobytes()
+
+    def tolist(self):
+        data = self.blob.tobytes()
+        offsets = self.offsets.tolist()
+        return [data[start:end].decode("utf-8") for start, end in zip(offsets, offsets[1:])]
+
+    def __getitem__(self, i):
+        return self.raw(i).decode("utf-8")
+
+    def find(self, string):
+        """Position of ``string`` in a table packed in sorted order, or None"""
+        key = string.encode("utf-8")
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self.raw(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low if low < len(self) and self.raw(low) == key else None
+
+
+class Documents:
+    """``{"id", "title", "text"}`` dicts read on demand from a StringTable of three strings per document"""
+
+    FIELDS = ("id", "title", "text")
+
+    def __init__(self, table):
+        self.table = table
+
+    def __len__(self):
+        return len(self.table) // len(self.FIELDS)
+
+    def __getitem__(self, doc):
+        if not 0 <= doc < len(self):
+            raise IndexError("document index out of range")
+        first = int(doc) * len(self.FIELDS)
+        return {field: self.table[first + i] for i, field in enumerate(self.FIELDS)}
+
+# ==================== INDEX ====================
+class SectorIndex:
+    """BM25 weights of one sector's documents as a CSR term-by-document matrix
+
+    Everything but a few counts in ``meta.json`` is saved as ``.npy`` arrays
+    and memory-mapped on load: the weights, the sorted vocabulary and the
+    documents (as StringTables), and each document's SHA-1 and term counts
+    (a document-by-term CSR matrix) for reuse by the next build.
+    """
+
+    ARRAYS = ("indptr", "doc_ids", "weights", "term_offsets", "term_blob", "doc_offsets", "doc_blob",
+              "doc_hashes", "doc_indptr", "doc_terms", "doc_counts")
+
+    def __init__(self, meta, arrays):
+        self.meta = meta
+        self.arrays = arrays
+        self.indptr = arrays["indptr"]
+        self.doc_ids = arrays["doc_ids"]
+        self.weights = arrays["weights"]
+        self.terms = StringTable(arrays["term_offsets"], arrays["term_blob"])
+        self.documents = Documents(StringTable(arrays["doc_offsets"], arrays["doc_blob"]))
+
+    @classmethod
+    def build(cls, documents, signature="", previous=None, k1=1.2, b=0.75):
+        """Index ``documents``, reusing the term counts ``previous`` has for unchanged texts
+
+        The whole matrix is recomputed, since every weight depends on the
+        corpus-wide document frequencies and mean length; only tokenization
+        is skipped for documents whose text is unchanged.  Returns the index
+        and the number of documents that had to be tokenized.
+        """
+        known = {}
+        if previous is not None:
+            digests = previous.arrays["doc_hashes"].tobytes()
+            known = {digests[i:i + 20]: doc for doc, i in enumerate(range(0, len(digests), 20))}
+            if known:
+                # Decode the previous generation's vocabulary and counts once, not per document
+                previous_terms = previous.terms.tolist()
+                doc_indptr = previous.arrays["doc_indptr"].tolist()
+                doc_terms = previous.arrays["doc_terms"].tolist()
+                doc_counts = previous.arrays["doc_counts"].tolist()
+        hashes = [_document_hash(document) for document in documents]
+        counts = {}
+        tokenized = 0
+        for document, key in zip(documents, hashes):
+            if key not in counts:
+                if key in known:
+                    start, end = doc_indptr[known[key]], doc_indptr[known[key] + 1]
+                    counts[key] = dict(zip([previous_terms[row] for row in doc_terms[start:end]],
+                                           doc_counts[start:end]))
+                else:
+                    counts[key] = {}
+                    for token in tokenize(f"{document['title']} {document['title']} {document['text']}"):
+                        counts[key][token] = counts[key].get(token, 0) + 1
+                    tokenized += 1
+
+        terms = sorted({term for key in hashes for term in counts[key]})
+        rows = {term: row for row, term in enumerate(terms)}
+        term_rows, doc_ids, frequencies = [], [], []
+        doc_indptr = np.zeros(len(documents) + 1, dtype=np.int64)
+        for doc, key in enumerate(hashes):
+            for term, count in counts[key].items():
+                term_rows.append(rows[term])
+                doc_ids.append(doc)
+                frequencies.append(count)
+            doc_indptr[doc + 1] = len(term_rows)
+
+        term_rows = np.asarray(term_rows, dtype=np.int64)
+        doc_ids = np.asarray(doc_ids, dtype=np.int32)
+        frequencies = np.asarray(frequencies, dtype=np.float64)
+        doc_terms, doc_counts = term_rows.astype(np.int32), frequencies.astype(np.int32)
+        lengths = np.bincount(doc_ids, weights=frequencies, minlength=len(documents))
+        order = np.lexsort((doc_ids, term_rows))
+        term_rows, doc_ids, frequencies = term_rows[order], doc_ids[order], frequencies[order]
+        df = np.bincount(term_rows, minlength=len(terms))
+        idf = np.log1p((len(documents) - df + 0.5) / (df + 0.5))
+        norm = k1 * (1.0 - b + b * lengths / max(lengths.mean(), 1.0)) if len(documents) else lengths
+        weights = idf[term_rows] * frequencies * (k1 + 1.0) / (frequencies + norm[doc_ids])
+        indptr = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(df, out=indptr[1:])
+
+        term_table = StringTable.pack(terms)
+        doc_table = StringTable.pack(document[field] for document in documents for field in Documents.FIELDS)
+        arrays = {
+            "indptr": indptr, "doc_ids": doc_ids, "weights": weights.astype(np.float32),
+            "term_offsets": term_table.offsets, "term_blob": term_table.blob,
+            "doc_offsets": doc_table.offsets, "doc_blob": doc_table.blob,
+            "doc_hashes": np.frombuffer(b"".join(hashes), dtype=np.uint8).reshape(len(hashes), 20),
+            "doc_indptr": doc_indptr, "doc_terms": doc_terms, "doc_counts": doc_counts,
+        }
+        meta = {"signature": signature, "documents": len(documents), "terms": len(terms)}
+        return cls(meta, arrays), tokenized
+
+    def save(self, directory):
+        """Write the index into ``directory``; meta.json goes last and marks it complete"""
+        os.makedirs(directory, exist_ok=True)
+        for name in self.ARRAYS:
+            np.save(os.path.join(directory, f"{name}.npy"), self.arrays[name])
+        partial = os.path.join(directory, "meta.json.tmp")
+        with open(partial, "w", encoding="utf-8") as handle:
+            json.dump(self.meta, handle)
+        os.replace(partial, os.path.join(directory, "meta.json"))
+
+    @classmethod
+    def load(cls, directory):
+        """Open a saved index with its arrays memory-mapped"""
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as handle:
+            meta = json.load(handle)
+        # Plain ndarray views of the maps skip np.memmap's per-access overhead
+        arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r").view(np.ndarray)
+                  for name in cls.ARRAYS}
+        return cls(meta, arrays)
+
+    def search(self, query, k=3):
+        """``[(score, document)]`` for the best ``k`` matches, best first"""
+        rows = {self.terms.find(token) for token in set(tokenize(query))} - {None}
+        if not rows:
+            return []
+        scores = np.zeros(len(self.documents), dtype=np.float32)
+        for row in rows:
+            start, end = self.indptr[row], self.indptr[row + 1]
+            scores[self.doc_ids[start:end]] += self.weights[start:end]
+        if k < len(scores):
+            best = np.argpartition(-scores, k)[:k]
+        else:
+            best = np.arange(len(scores))
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [(float(scores[doc]), self.documents[doc]) for doc in best if scores[doc] > 0]
+
+# ==================== RETRIEVER ====================
+class FaqRetriever:
+    """Per-sector FAQ indexes, rebuilt when a sector's files change
+
+    The corpus is checked for changes at most every ``refresh_interval``
+    seconds, when a query arrives.
+    """
+
+    def __init__(self, corpus_dir=FAQ_DIR, index_dir=FAQ_INDEX, default_sector="enterprise",
+                 refresh_interval=5.0, min_score=1.5, clock=time.monotonic):
+        self.corpus_dir = corpus_dir
+        self.index_dir = index_dir
+        self.default_sector = default_sector
+        self.refresh_interval = refresh_interval
+        self.min_score = min_score
+        self.clock = clock
+        self._indexes = {}
+        self._checked = {}
+        self._lock = threading.Lock()
+        self.rebuilds = 0
+        self.tokenized = 0
+
+    def has_sector(self, sector):
+        return sector in self._indexes or os.path.isdir(os.path.join(self.corpus_dir, sector))
+
+    def index(self, sector):
+        """The sector's current index, refreshed first if its check is due"""
+        now = self.clock()
+        if sector not in self._indexes or now - self._checked.get(sector, now) >= self.refresh_interval:
+            self.refresh(sector)
+        return self._indexes[sector]
+
+    def refresh(self, sector):
+        """Reopen or rebuild the sector's index if its files changed; True if it was rebuilt"""
+        with self._lock:
+            self._checked[sector] = self.clock()
+            paths = corpus_files(os.path.join(self.corpus_dir, sector))
+            signature = corpus_signature(paths)
+            current = self._indexes.get(sector)
+            if current is not None and current.meta["signature"] == signature:
+                return False
+            directory = os.path.join(self.index_dir, f"{sector}-{signature}")
+            try:
+                self._indexes[sector] = SectorIndex.load(directory)
+                return False
+            except (OSError, ValueError):
+                pass
+            previous = current or self._latest_saved(sector)
+            documents = [document for path in paths for document in parse_documents(path)]
+            index, tokenized = SectorIndex.build(documents, signature, previous)
+            self.rebuilds += 1
+            self.tokenized += tokenized
+            try:
+                index.save(directory)
+                index = SectorIndex.load(directory)
+                self._remove_generations(sector, keep=directory)
+            except OSError as exc:
+                print(f"FAQ index for {sector} kept in memory: {exc}", file=sys.stderr)
+            self._indexes[sector] = index
+            return True
+
+    def _generations(self, sector):
+        if not os.path.isdir(self.index_dir):
+            return []
+        prefix = f"{sector}-"
+        return [os.path.join(self.index_dir, name) for name in os.listdir(self.index_dir) if name.startswith(prefix)]
+
+    def _latest_saved(self, sector):
+        for directory in sorted(self._generations(sector), key=os.path.getmtime, reverse=True):
+            try:
+                return SectorIndex.load(directory)
+            except (OSError, ValueError):
+                continue
+        return None
+
+    def _remove_generations(self, sector, keep):
+        # Open memory maps of an old generation stay valid after its files are removed
+        for directory in self._generations(sector):
+            if directory != keep:
+                shutil.rmtree(directory, ignore_errors=True)
+
+    def search(self, sector, query, k=3):
+        if not self.has_sector(sector):
+            sector = self.default_sector
+        return self.index(sector).search(query, k)
+
+    def answer(self, sector, query):
+        """The best document's answer if it scores at least ``min_score``, else None"""
+        found = self.search(sector, query, 1)
+        if found and found[0][0] >= self.min_score:
+            return found[0][1]["text"]
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def default_retriever():
+    """Process-wide retriever over FAQ_DIR, indexed into FAQ_INDEX"""
+    return FaqRetriever()
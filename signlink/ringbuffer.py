@@ -0,0 +1,84 @@
+"""Fixed-capacity history buffers for chat messages and notifications."""
+from collections import deque
+
+
+class RingBuffer:
+    """Keeps the newest ``capacity`` items with O(1) append and O(k) tail queries
+
+    When ``flag`` is given (a predicate over items), a secondary index of the
+    sequence numbers of flagged items is maintained on append, so
+    ``last_flagged(k)`` never scans the buffer.
+    """
+
+    def __init__(self, capacity, flag=None):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.flag = flag
+        self._slots = []  # grows to ``capacity``, then wraps
+        self._next = 0  # sequence number of the next append
+        self._flagged = deque()
+
+    def append(self, item):
+        seq = self._next
+        if seq < self.capacity:
+            self._slots.append(item)
+        else:
+            self._slots[seq % self.capacity] = item
+        self._next = seq + 1
+        if self.flag is not None:
+            oldest = self._next - self.capacity
+            while self._flagged and self._flagged[0] < oldest:
+                self._flagged.popleft()
+            if self.flag(item):
+                self._flagged.append(seq)
+
+    def clear(self):
+        self._slots = []
+        self._next = 0
+        self._flagged.clear()
+
+    @property
+    def total_appended(self):
+        return self._next
+
+    def _oldest(self):
+        return max(0, self._next - self.capacity)
+
+    def __len__(self):
+        return self._next - self._oldest()
+
+    def __iter__(self):
+        """Oldest to newest"""
+        for seq in range(self._oldest(), self._next):
+            yield self._slots[seq % self.capacity]
+
+    def __getitem__(self, index):
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("ring buffer index out of range")
+        return self._slots[(self._oldest() + index) % self.capacity]
+
+    def last(self, k):
+        """The newest ``k`` items, oldest first"""
+        start = max(self._oldest(), self._next - k)
+        return [self._slots[seq % self.capacity] for seq in range(start, self._next)]
+
+    def last_flagged(self, k):
+        """The newest ``k`` flagged items still in the buffer, oldest first"""
+        oldest = self._oldest()
+        found = []
+        for seq in reversed(self._flagged):
+            if seq < oldest or len(found) == k:
+                break
+            found.append(self._slots[seq % self.capacity])
+        found.reverse()
+        return found
+
+    def count_flagged(self):
+        oldest = self._oldest()
+        while self._flagged and self._flagged[0] < oldest:
+            self._flagged.popleft()
+        return len(self._flagged)
@@ -0,0 +1,216 @@
+"""Headless recognition from the command line, without the web UI.
+
+Runs a frame source through landmark extraction, classification, temporal
+smoothing and gesture dispatch against a plain ``RecognizerState`` and prints
+one event per committed gesture:
+
+    python -m signlink.run synthetic --text "SIGN LINK"
+    python -m signlink.run file session.npz --sector healthcare --json
+    python -m signlink.run camera --device 0 --workers 2
+
+With ``--serve PORT`` the same events, plus stability updates and healthcare
+notifications, are also published to local clients (see signlink.eventserver).
+
+Live sources (a camera, or a file or synthetic source with ``--realtime``) go
+through the threaded ``RecognitionPipeline`` as in the app.  Otherwise frames
+are processed in this thread as fast as the CPU allows, under a clock that
+follows the frame timestamps so the cooldown behaves as it does live.  Events
+go to stdout and the run summary to stderr.
+"""
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+
+def synthetic_landmarks(text, frames_per_letter=60, gap_frames=30, noise=0.006, seed=0):
+    """Landmarks of a signer holding each letter of ``text``, with no hand between letters and at spaces"""
+    from signlink.features import LETTERS, template_landmarks
+
+    rng = np.random.default_rng(seed)
+    gap = np.full((gap_frames, 21, 3), np.nan, np.float32)
+    chunks = [gap]
+    for char in text.upper():
+        if char in LETTERS:
+            chunks.append(template_landmarks(char, frames_per_letter, noise, rng).astype(np.float32))
+        chunks.append(gap)
+    return np.concatenate(chunks)
+
+
+def open_source(kind, path=None, text="SIGNLINK", device=0, fps=30.0, realtime=False, loop=False):
+    """A frame source: "camera", "file" (.npy/.npz landmark dump or video clip) or "synthetic" """
+    from signlink.capture import CameraSource, SyntheticSource, VideoFileSource
+
+    if kind == "camera":
+        return CameraSource(device, fps=int(fps))
+    if kind == "synthetic":
+        return SyntheticSource(synthetic_landmarks(text), fps=fps, realtime=realtime, loop=loop)
+    if path is None:
+        raise ValueError("a file source needs a path")
+    if str(path).endswith((".npy", ".npz")):
+        from signlink.replay import load_landmarks
+        landmarks, _, _ = load_landmarks(path, fps)
+        return SyntheticSource(landmarks, fps=fps, realtime=realtime, loop=loop)
+    return VideoFileSource(path, realtime=realtime, loop=loop)
+
+
+def commit_event(recognizer, result, gesture, origin=0.0):
+    """What a committed gesture did, as a JSON-friendly dict"""
+    state = recognizer.state
+    return {
+        "t": round(result.timestamp - origin, 3),
+        "frame": result.index,
+        "gesture": gesture,
+        "confidence": round(state.gesture_stability, 3),
+        "sector": state.current_sector,
+        "mode": state.gesture_mode,
+        "feedback": state.feedback_message,
+        "text": recognizer.buffer.text,
+    }
+
+
+def format_event(event):
+    return (f"{event['t']:9.3f}s  frame {event['frame']:>6}  {event['gesture']:<11}  "
+            f"{event['feedback']}  | {event['text']!r}")
+
+# ==================== RUNNERS ====================
+def run_offline(recognizer, source, classifier, on_commit, max_frames=None):
+    """Process every frame in this thread as fast as possible; returns run stats
+
+    ``recognizer.clock`` must be a ``VirtualClock``; it is moved to each frame's timestamp.
+    """
+    from signlink.capture import RecognitionPipeline
+
+    pipeline = RecognitionPipeline(source, classifier=classifier)  # for process_frame only, no threads
+    recognizer.use_labels(classifier.labels)
+    base = recognizer.clock()
+    frames = commits = 0
+    started = time.perf_counter()
+    try:
+        while max_frames is None or frames < max_frames:
+            frame = source.read()
+            if frame is None:
+                break
+            result = pipeline.process_frame(frame)
+            recognizer.clock.set(base + frame.timestamp)
+            gesture = recognizer.observe(result.index, result.proba)
+            if gesture is not None:
+                commits += 1
+                on_commit(result, gesture)
+            frames += 1
+    finally:
+        pipeline.stop()
+    elapsed = time.perf_counter() - started
+    return {"frames": frames, "commits": commits, "seconds": elapsed,
+            "frames_per_second": frames / elapsed if elapsed else 0.0}
+
+
+def run_live(recognizer, source, classifier, on_commit, duration=None, pool=None, roi_tracking=False,
+             scheduler=None):
+    """Run the threaded pipeline until the source ends or ``duration`` seconds pass; returns run stats"""
+    recognizer.start(source, classifier, pool=pool, roi_tracking=roi_tracking, scheduler=scheduler)
+    started = time.monotonic()
+    commits = 0
+    try:
+        while recognizer.running and (duration is None or time.monotonic() - started < duration):
+            commits += recognizer.poll(0.1, on_commit)
+        commits += recognizer.poll(None, on_commit)
+        stats = recognizer.pipeline.stats()
+    finally:
+        recognizer.stop()
+    stats.update(commits=commits, seconds=time.monotonic() - started)
+    return stats
+
+# ==================== CLI ====================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run gesture recognition without the web UI and print events")
+    parser.add_argument("source", choices=("camera", "file", "synthetic"))
+    parser.add_argument("path", nargs="?", help="landmark dump (.npy/.npz) or video clip for the file source")
+    parser.add_argument("--text", default="SIGNLINK", help="letters the synthetic signer holds")
+    parser.add_argument("--device", type=int, default=0, help="camera index")
+    parser.add_argument("--fps", type=float, default=30.0, help="frame rate of cameras, dumps and synthetic frames")
+    parser.add_argument("--realtime", action="store_true", help="pace file and synthetic frames as if live")
+    parser.add_argument("--loop", action="store_true", help="repeat file and synthetic sources")
+    parser.add_argument("--duration", type=float, help="stop live runs after this many seconds")
+    parser.add_argument("--max-frames", type=int, help="stop offline runs after this many frames")
+    parser.add_argument("--sector", default="enterprise")
+    parser.add_argument("--model", help="saved LetterClassifier .npz")
+    parser.add_argument("--workers", type=int, default=0, help="landmark inference worker processes (live only)")
+    parser.add_argument("--roi", action="store_true", help="track the hand in a crop (live only)")
+    parser.add_argument("--json", action="store_true", help="print events as JSON lines")
+    parser.add_argument("--serve", type=int, metavar="PORT",
+                        help="also publish events over SSE/WebSocket on this localhost port")
+    parser.add_argument("--allow-origin", action="append", default=[], metavar="ORIGIN",
+                        help="browser origin allowed to read the --serve stream (repeatable)")
+    args = parser.parse_args(argv)
+    if args.source == "file" and not args.path:
+        parser.error("the file source needs a path")
+    if args.loop and not args.realtime and args.max_frames is None:
+        parser.error("--loop runs forever offline; add --realtime or --max-frames")
+
+    from signlink.bindings import default_bindings
+    from signlink.features import LetterClassifier, default_classifier
+    from signlink.recognizer import GestureRecognizer, RecognizerState
+    from signlink.replay import VirtualClock
+
+    if args.sector not in default_bindings().current().sectors:
+        parser.error(f"unknown sector {args.sector!r}")
+    classifier = LetterClassifier.load(args.model) if args.model else default_classifier()
+    live = args.source == "camera" or args.realtime
+    clock = time.time if live else VirtualClock(time.time())
+    state = RecognizerState(current_sector=args.sector)
+    recognizer = GestureRecognizer(state, clock=clock, open_url=lambda url: None)
+    source = open_source(args.source, args.path, args.text, args.device, args.fps, args.realtime, args.loop)
+    server = None
+    if args.serve is not None:
+        from signlink.eventserver import EventServer
+        try:
+            server = EventServer(port=args.serve, allowed_origins=args.allow_origin).start()
+        except RuntimeError as exc:
+            parser.exit(1, f"{exc}\n")
+        server.attach(recognizer.bus)
+        print(f"Publishing events on http://127.0.0.1:{server.port}/events and ws://127.0.0.1:{server.port}/ws",
+              file=sys.stderr)
+
+    origin = []
+
+    def on_commit(result, gesture):
+        if not origin:
+            origin.append(result.timestamp if args.source == "camera" else 0.0)
+        recognizer.settle()  # slides and requests are handled on the bus's threads
+        event = commit_event(recognizer, result, gesture, origin[0])
+        print(json.dumps(event, ensure_ascii=False) if args.json else format_event(event), flush=True)
+
+    try:
+        if live:
+            pool = None
+            if args.workers > 0:
+                import functools
+                from signlink.capture import MediaPipeHands, tracked_hands
+                from signlink.procpool import InferencePool
+                classifier_factory = (functools.partial(LetterClassifier.load, args.model) if args.model
+                                      else default_classifier)
+                pool = InferencePool(args.workers, landmarker_factory=tracked_hands if args.roi else MediaPipeHands,
+                                     classifier_factory=classifier_factory).start()
+            try:
+                stats = run_live(recognizer, source, classifier, on_commit, args.duration, pool, args.roi)
+            finally:
+                if pool is not None:
+                    pool.close()
+        else:
+            stats = run_offline(recognizer, source, classifier, on_commit, args.max_frames)
+    except KeyboardInterrupt:
+        recognizer.stop()
+        return
+    finally:
+        recognizer.bus.close()
+        if server is not None:
+            server.close()
+    print(", ".join(f"{key}={value:.4g}" if isinstance(value, float) else f"{key}={value}"
+                    for key, value in stats.items()), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Adaptive frame rate and resolution for the recognition pipeline.
+
+The scheduler admits camera frames at its current rate (skipping the rest)
+and picks the resolution they are processed at.  Once per review interval it
+compares the observed end-to-end latency (capture to published result) with
+the target and checks machine-wide CPU load: over budget it sheds work, first
+by lowering the frame rate to a floor, then by stepping the resolution down,
+then (for latency only) by lowering the rate further; with headroom it undoes
+those steps in reverse order, raising the rate additively.  Every change is
+recorded with its reason.  Frames are admitted on the capture thread and
+latencies observed on the result thread, so both take the scheduler's lock.
+"""
+import os
+import threading
+import time
+from collections import deque
+
+
+class CpuLoad:
+    """Machine-wide CPU busy fraction since the previous call
+
+    Reads ``/proc/stat`` where available, so the reading reacts within one
+    review interval; elsewhere falls back to the one-minute load average per
+    CPU, or None.
+    """
+
+    def __init__(self):
+        self._last = None
+
+    def __call__(self):
+        try:
+            with open("/proc/stat") as handle:
+                values = [int(value) for value in handle.readline().split()[1:9]]
+        except (OSError, ValueError):
+            try:
+                return os.getloadavg()[0] / (os.cpu_count() or 1)
+            except (AttributeError, OSError):
+                return None
+        idle, total = values[3] + values[4], sum(values)
+        last, self._last = self._last, (idle, total)
+        if last is None or total == last[1]:
+            return None
+        return 1.0 - (idle - last[0]) / (total - last[1])
+
+
+class AdaptiveScheduler:
+    def __init__(self, target_latency=0.12, max_fps=30.0, min_fps=4.0, fps_floor=12.0,
+                 scales=(1.0, 0.75, 0.5), interval=0.5, load_high=0.95, load_low=0.8,
+                 clock=time.monotonic, load=None):
+        self.target_latency = target_latency
+        self.max_fps = max_fps
+        self.min_fps = min_fps
+        self.fps_floor = fps_floor
+        self.scales = tuple(scales)
+        self.interval = interval
+        self.load_high = load_high
+        self.load_low = load_low
+        self.clock = clock
+        self.load = CpuLoad() if load is None else load
+        self.fps = max_fps
+        self.scale_index = 0
+        self.admitted = 0
+        self.skipped = 0
+        self.changes = deque(maxlen=50)  # (time, fps, scale, reason)
+        self._latencies = deque(maxlen=256)
+        self._next_due = None
+        self._next_review = None
+        self._lock = threading.Lock()
+
+    @property
+    def scale(self):
+        return self.scales[self.scale_index]
+
+    @property
+    def reason(self):
+        return self.changes[-1][3] if self.changes else "starting at full rate"
+
+    # ==================== FRAME ADMISSION ====================
+    def admit(self, now=None):
+        """True if a frame captured now should be processed at the current rate"""
+        now = self.clock() if now is None else now
+        with self._lock:
+            if self._next_due is not None and now < self._next_due:
+                self.skipped += 1
+                return False
+            # Schedule from the previous due time so admission keeps the average rate
+            period = 1.0 / self.fps
+            due = now if self._next_due is None else self._next_due
+            self._next_due = max(due + period, now - period)
+            self.admitted += 1
+            return True
+
+    def observe(self, latency, now=None):
+        """Record one result's end-to-end latency and review the rate when due"""
+        now = self.clock() if now is None else now
+        with self._lock:
+            self._latencies.append(latency)
+            if self._next_review is None:
+                self._next_review = now + self.interval
+            elif now >= self._next_review:
+                self._review(now)
+                self._next_review = now + self.interval
+
+    # ==================== RATE CONTROL ====================
+    def review(self, now=None):
+        """Adjust rate and resolution from the latencies seen since the last review"""
+        now = self.clock() if now is None else now
+        with self._lock:
+            return self._review(now)
+
+    def _review(self, now):
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        latency = ordered[int(0.9 * (len(ordered) - 1))]
+        self._latencies.clear()
+        load = self.load() if self.load else None
+
+        if latency > self.target_latency:
+            # Cut the rate in proportion to the overshoot, by at most half per review
+            factor = min(max(self.target_latency / latency, 0.5), 0.85)
+            return self._shed(now, f"p90 latency {latency * 1000:.0f}ms over {self.target_latency * 1000:.0f}ms target",
+                              factor)
+        if load is not None and load > self.load_high:
+            # Yield to other applications, but only latency pushes below the floor rate
+            return self._shed(now, f"CPU {load:.0%} busy", below_floor=False)
+        if latency < 0.6 * self.target_latency and (load is None or load < self.load_low):
+            return self._restore(now, f"p90 latency {latency * 1000:.0f}ms leaves headroom")
+        return None
+
+    def _shed(self, now, reason, factor=0.75, below_floor=True):
+        if self.fps > self.fps_floor:
+            return self._change(now, max(self.fps * factor, self.fps_floor), self.scale_index, reason)
+        if self.scale_index < len(self.scales) - 1:
+            return self._change(now, self.fps, self.scale_index + 1, reason)
+        if below_floor and self.fps > self.min_fps:
+            return self._change(now, max(self.fps * factor, self.min_fps), self.scale_index, reason)
+        return None
+
+    def _restore(self, now, reason):
+        if self.fps < self.fps_floor:
+            return self._change(now, min(self.fps / 0.75, self.fps_floor), self.scale_index, reason)
+        if self.scale_index > 0:
+            return self._change(now, self.fps, self.scale_index - 1, reason)
+        if self.fps < self.max_fps:
+            return self._change(now, min(self.fps + 2.0, self.max_fps), self.scale_index, reason)
+        return None
+
+    def _change(self, now, fps, scale_index, reason):
+        self.fps, self.scale_index = fps, scale_index
+        change = (now, fps, self.scales[scale_index], reason)
+        self.changes.append(change)
+        return change
+
+    def stats(self):
+        with self._lock:
+            return {
+                "target_fps": self.fps,
+                "scale": self.scale,
+                "frames_skipped": self.skipped,
+                "rate_changes": len(self.changes),
+                "rate_reason": self.reason,
+            }
@@ -0,0 +1,101 @@
+"""Temporal smoothing of per-frame class probabilities with commit hysteresis."""
+import numpy as np
+
+EMA = "ema"
+VOTE = "vote"
+
+
+class GestureSmoother:
+    """Smooths per-frame probabilities and decides when a gesture commits
+
+    Frames go into a fixed-size NumPy ring.  In ``vote`` mode the smoothed
+    distribution is each label's share of per-frame argmax votes over the
+    window, which tolerates confusable letters whose probabilities stay low
+    even when they win; in ``ema`` mode it is an exponential moving average of
+    the probabilities themselves.  A label commits once
+    its smoothed probability reaches ``commit_threshold`` for ``min_frames``
+    consecutive frames, and it cannot commit again until it drops below
+    ``release_threshold`` (hysteresis), so a held sign commits once.
+    Frames without a hand are passed as None (or an all-zero row) and carry
+    no vote.
+    """
+
+    def __init__(self, labels, mode=VOTE, window=8, alpha=0.35, commit_threshold=0.875,
+                 release_threshold=0.4, min_frames=2):
+        if mode not in (EMA, VOTE):
+            raise ValueError(f"Unknown smoothing mode: {mode}")
+        if release_threshold > commit_threshold:
+            raise ValueError("release_threshold must not exceed commit_threshold")
+        self.labels = tuple(labels)
+        self.mode = mode
+        self.alpha = alpha
+        self.commit_threshold = commit_threshold
+        self.release_threshold = release_threshold
+        self.min_frames = min_frames
+        self._ring = np.zeros((window, len(self.labels)), dtype=np.float32)
+        self._votes = np.full(window, -1, dtype=np.int64)
+        self._counts = np.zeros(len(self.labels), dtype=np.float64)
+        self._ema = np.zeros(len(self.labels), dtype=np.float64)
+        self._pos = 0
+        self._streak = 0
+        self.leader = None
+        self.confidence = 0.0
+        self.held = None
+
+    def reset(self):
+        self._ring[:] = 0
+        self._votes[:] = -1
+        self._counts[:] = 0
+        self._ema[:] = 0
+        self._pos = self._streak = 0
+        self.leader = self.held = None
+        self.confidence = 0.0
+
+    def smoothed(self):
+        if self.mode == EMA:
+            return self._ema
+        return self._counts / len(self._ring)
+
+    def update(self, proba, allow_commit=True):
+        """Add one frame (a probability row or None); return the committed label or None"""
+        row = self._ring[self._pos]
+        if self._votes[self._pos] >= 0:
+            self._counts[self._votes[self._pos]] -= 1
+        if proba is None or not np.any(proba):
+            row[:] = 0
+            self._votes[self._pos] = -1
+        else:
+            row[:] = proba
+            vote = self._votes[self._pos] = int(row.argmax())
+            self._counts[vote] += 1
+        self._pos = (self._pos + 1) % len(self._ring)
+        if self.mode == EMA:
+            self._ema *= 1.0 - self.alpha
+            self._ema += self.alpha * row
+
+        smoothed = self.smoothed()
+        best = int(smoothed.argmax())
+        leader = self.labels[best] if smoothed[best] > 0 else None
+        self._streak = self._streak + 1 if leader == self.leader else 1
+        self.leader = leader
+        self.confidence = float(smoothed[best])
+
+        if self.held is not None:
+            held_index = self.labels.index(self.held)
+            if smoothed[held_index] < self.release_threshold:
+                self.held = None
+        if (allow_commit and leader is not None and leader != self.held
+                and self.confidence >= self.commit_threshold and self._streak >= self.min_frames):
+            self.held = leader
+            return leader
+        return None
+
+
+_rng = np.random.default_rng()
+
+
+def peaked_probabilities(size, index, peak, rng=None):
+    """Noisy probability row concentrated on ``index``, for simulated recognizers"""
+    row = (rng or _rng).dirichlet(np.ones(size)) * (1.0 - peak)
+    row[index] += peak
+    return row
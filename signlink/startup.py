@@ -0,0 +1,88 @@
+"""Cold-start import profiling with a time budget.
+
+    python -m signlink.startup appy.py --budget 1500
+
+Runs the target in fresh interpreters under ``-X importtime``, prints the
+slowest modules and exits non-zero when the import time exceeds the budget or
+a deferred heavy module was loaded eagerly, so it can gate CI.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+DEFAULT_BUDGET_MS = float(os.environ.get("SIGNLINK_STARTUP_BUDGET_MS", "1500"))
+
+# Modules that only specific subsystems need; they must not load at startup
+HEAVY_MODULES = ("cv2", "mediapipe", "numpy", "PIL", "smtplib", "email.mime", "sqlite3")
+
+_IMPORTTIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def _target_code(target):
+    if target.endswith(".py"):
+        return f"import runpy; runpy.run_path({str(Path(target).resolve())!r})"
+    return f"import {target}"
+
+
+def _run(code, cwd=None):
+    wrapped = f"import time as _t; _s = _t.perf_counter(); {code}; print(_t.perf_counter() - _s)"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", wrapped], cwd=cwd,
+                            capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1]) * 1000, result.stderr
+
+
+def parse_importtime(stderr):
+    """Return [(module, self_ms, cumulative_ms, depth)] from ``-X importtime`` output"""
+    modules = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.append((name, int(self_us) / 1000, int(cumulative_us) / 1000, len(indent) // 2))
+    return modules
+
+
+def measure(target, runs=3, cwd=None):
+    """Best-of-``runs`` import time of a module name or script path"""
+    best = None
+    for _ in range(runs):
+        elapsed, stderr = _run(_target_code(target), cwd)
+        if best is None or elapsed < best[0]:
+            best = (elapsed, stderr)
+    modules = parse_importtime(best[1])
+    loaded = {name for name, *_ in modules}
+    heavy = sorted(name for name in loaded
+                   if any(name == heavy or name.startswith(heavy + ".") for heavy in HEAVY_MODULES))
+    return {"import_ms": best[0], "modules": modules, "heavy_loaded": heavy}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile cold-start imports against a time budget")
+    parser.add_argument("target", nargs="?", default="appy.py", help="script path or module name")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_MS, help="import budget in ms")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15, help="number of slowest modules to list")
+    args = parser.parse_args(argv)
+
+    report = measure(args.target, args.runs)
+    top_level = sorted((m for m in report["modules"] if m[3] == 0), key=lambda m: -m[2])
+    print(f"{'module':<40} {'self ms':>9} {'total ms':>9}")
+    for name, self_ms, cumulative_ms, _ in top_level[:args.top]:
+        print(f"{name:<40} {self_ms:>9.1f} {cumulative_ms:>9.1f}")
+    print(f"\n{args.target}: {report['import_ms']:.0f} ms (budget {args.budget:.0f} ms)")
+
+    failed = False
+    if report["heavy_loaded"]:
+        print("eagerly loaded heavy modules: " + ", ".join(report["heavy_loaded"]))
+        failed = True
+    if report["import_ms"] > args.budget:
+        print("over budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
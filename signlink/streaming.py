@@ -0,0 +1,121 @@
+"""Streamed assistant replies with cancellation and latency metrics.
+
+A reply is any iterator of text chunks.  ``ResponseStream`` passes the chunks
+through as they are produced (so the chat can render the first words at
+once), stops early once cancelled, and on finishing records the time
+to first token and total time in a ``StreamMetrics``.
+"""
+import functools
+import re
+import threading
+import time
+from collections import deque
+
+_WORD = re.compile(r"\S+\s*")
+
+
+def word_chunks(text):
+    """Yield ``text`` a word at a time, each word with its trailing whitespace"""
+    for match in _WORD.finditer(text):
+        yield match.group()
+
+
+class ResponseStream:
+    """Iterate a reply's chunks once, timing them and honouring ``cancel()``
+
+    ``on_finish`` is called with the stream when iteration ends for any
+    reason: exhausted, cancelled, or abandoned by an interrupted script run.
+    """
+
+    def __init__(self, chunks, metrics=None, on_finish=None, clock=time.perf_counter):
+        self._chunks = chunks
+        self.metrics = metrics
+        self.on_finish = on_finish
+        self.clock = clock
+        self._cancelled = threading.Event()
+        self.parts = []
+        self.started = clock()
+        self.first_token_at = None
+        self.finished_at = None
+        self.completed = False
+
+    @property
+    def text(self):
+        return "".join(self.parts)
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    @property
+    def time_to_first_token(self):
+        return None if self.first_token_at is None else self.first_token_at - self.started
+
+    @property
+    def total_time(self):
+        return None if self.finished_at is None else self.finished_at - self.started
+
+    def cancel(self):
+        """Stop at the next chunk boundary; safe to call from another thread or after the end"""
+        self._cancelled.set()
+
+    def __iter__(self):
+        chunks = iter(self._chunks)
+        try:
+            for chunk in chunks:
+                if self._cancelled.is_set():
+                    break
+                if self.first_token_at is None:
+                    self.first_token_at = self.clock()
+                self.parts.append(chunk)
+                yield chunk
+            else:
+                self.completed = not self._cancelled.is_set()
+        finally:
+            if hasattr(chunks, "close"):
+                chunks.close()
+            self.finished_at = self.clock()
+            if self.metrics is not None:
+                self.metrics.record(self)
+            if self.on_finish is not None:
+                self.on_finish(self)
+
+
+class StreamMetrics:
+    """Time to first token and total time of recent replies"""
+
+    def __init__(self, window=500):
+        self._first_token = deque(maxlen=window)
+        self._total = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.cancelled = 0
+
+    def record(self, stream):
+        with self._lock:
+            if stream.completed:
+                self.completed += 1
+            else:
+                self.cancelled += 1
+            if stream.time_to_first_token is not None:
+                self._first_token.append(stream.time_to_first_token)
+            if stream.completed:
+                self._total.append(stream.total_time)
+
+    def stats(self):
+        """Percentiles in milliseconds over the recent window (None before any reply)"""
+        with self._lock:
+            first_token, total = list(self._first_token), list(self._total)
+            stats = {"completed": self.completed, "cancelled": self.cancelled}
+        for name, samples in (("ttft", first_token), ("total", total)):
+            ordered = sorted(samples)
+            for percent in (50, 95):
+                key = f"{name}_p{percent}_ms"
+                stats[key] = ordered[int(percent / 100 * (len(ordered) - 1))] * 1000 if ordered else None
+        return stats
+
+
+@functools.lru_cache(maxsize=1)
+def default_metrics():
+    """Process-wide reply metrics shared by every session"""
+    return StreamMetrics()
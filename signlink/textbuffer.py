@@ -0,0 +1,159 @@
+"""Editable typed text with a cursor, undo/redo and per-sector buffers.
+
+The text is a gap buffer: characters before the cursor in one list and
+characters after it in another, stored reversed.  Typing at the cursor is a
+list append and backspace a list pop, both amortized O(1) however long the
+session gets, and moving the cursor costs the distance moved.  Every edit is
+logged for undo.  The string form is only built when something reads it after
+a change, so a render serializes the buffer at most once, and then only the
+characters from the first edited position are joined again.
+"""
+import itertools
+from collections import deque
+
+# Versions are unique across buffers, so a cached (buffer, version) pair never goes stale
+_versions = itertools.count(1)
+
+
+class TextBuffer:
+    def __init__(self, text="", history=500):
+        self._before = list(text)
+        self._after = []  # reversed: the character right after the cursor is last
+        self._undo = deque(maxlen=history)  # (kind, position, text) with kind "insert" or "delete"
+        self._redo = []
+        self.version = next(_versions)
+        self._text = text
+        self._dirty_from = None  # first position edited since the text was last built
+
+    def __len__(self):
+        return len(self._before) + len(self._after)
+
+    def __str__(self):
+        return self.text
+
+    @property
+    def text(self):
+        start = self._dirty_from
+        if start is not None:
+            cursor = len(self._before)
+            if start <= cursor:
+                changed = "".join(self._before[start:]) + "".join(reversed(self._after))
+            else:
+                changed = "".join(reversed(self._after[:len(self._after) - (start - cursor)]))
+            self._text = self._text[:start] + changed
+            self._dirty_from = None
+        return self._text
+
+    @property
+    def cursor(self):
+        return len(self._before)
+
+    @property
+    def can_undo(self):
+        return bool(self._undo)
+
+    @property
+    def can_redo(self):
+        return bool(self._redo)
+
+    def before_cursor(self):
+        return "".join(self._before)
+
+    def current_word(self):
+        """The word ending at the cursor ("" right after a space)"""
+        start = len(self._before)
+        while start and self._before[start - 1] != " ":
+            start -= 1
+        return "".join(self._before[start:])
+
+    # ==================== EDITING ====================
+    def insert(self, text):
+        """Type ``text`` at the cursor"""
+        if text:
+            self._undo.append(("insert", len(self._before), text))
+            self._redo.clear()
+            self._insert(text)
+
+    def delete(self, count=1):
+        """Delete up to ``count`` characters before the cursor; return the deleted text"""
+        removed = self._delete(count)
+        if removed:
+            self._undo.append(("delete", len(self._before), removed))
+            self._redo.clear()
+        return removed
+
+    def clear(self):
+        """Delete everything (undoable)"""
+        self.move_to(len(self))
+        return self.delete(len(self))
+
+    def _changed(self, position):
+        if self._dirty_from is None or position < self._dirty_from:
+            self._dirty_from = position
+        self.version = next(_versions)
+
+    def _insert(self, text):
+        self._changed(len(self._before))
+        self._before.extend(text)
+
+    def _delete(self, count):
+        count = min(count, len(self._before))
+        if count <= 0:
+            return ""
+        removed = "".join(self._before[-count:])
+        del self._before[-count:]
+        self._changed(len(self._before))
+        return removed
+
+    # ==================== CURSOR ====================
+    def move(self, offset):
+        """Move the cursor by ``offset`` characters, clamped to the text"""
+        self.move_to(len(self._before) + offset)
+
+    def move_to(self, position):
+        position = max(0, min(position, len(self)))
+        while len(self._before) > position:
+            self._after.append(self._before.pop())
+        while len(self._before) < position:
+            self._before.append(self._after.pop())
+
+    # ==================== UNDO ====================
+    def undo(self):
+        """Revert the last edit; returns False if there was none"""
+        if not self._undo:
+            return False
+        kind, position, text = self._undo.pop()
+        if kind == "insert":
+            self.move_to(position + len(text))
+            self._delete(len(text))
+        else:
+            self.move_to(position)
+            self._insert(text)
+        self._redo.append((kind, position, text))
+        return True
+
+    def redo(self):
+        """Reapply the last undone edit; returns False if there was none"""
+        if not self._redo:
+            return False
+        kind, position, text = self._redo.pop()
+        if kind == "insert":
+            self.move_to(position)
+            self._insert(text)
+        else:
+            self.move_to(position + len(text))
+            self._delete(len(text))
+        self._undo.append((kind, position, text))
+        return True
+
+
+class SectorBuffers(dict):
+    """One TextBuffer per sector, created on first use, so text survives sector switches"""
+
+    def __init__(self, history=500):
+        super().__init__()
+        self.history = history
+
+    def __missing__(self, sector):
+        buffer = self[sector] = TextBuffer(history=self.history)
+        return buffer
@@ -0,0 +1,120 @@
+"""Incremental matching of typed text against sector trigger words.
+
+Trigger words are compiled into an Aho-Corasick automaton whose failure links
+are folded into a complete transition table, so advancing by one typed
+character is a single dict lookup regardless of how many triggers exist.
+A per-session ``TriggerMatcher`` keeps the automaton state after every typed
+character, so backspace is a pop rather than a rescan of the buffer.
+
+Triggers match whole words only, and only once the word is finished: each
+word is compiled with a space on both sides and the matcher starts as if a
+space preceded the text, so "GOOGLE" fires on "... GOOGLE " but not inside
+"GOOGLES" or "XGOOGLE".  With ``delimited=False`` the words are compiled as
+they are and match anywhere, inside other words and across spaces, which is
+what keyword search (signlink.assistant) wants.
+"""
+DELIMITER = " "
+
+
+class TriggerAutomaton:
+    """Aho-Corasick automaton over upper-cased trigger words, delimited by spaces unless not ``delimited``"""
+
+    def __init__(self, triggers, delimited=True):
+        goto = [{}]
+        outputs = [[]]
+        for word, action in triggers.items():
+            if not word or (delimited and DELIMITER in word):
+                raise ValueError(f"trigger {word!r} must be a single word")
+            state = 0
+            for char in (DELIMITER + word.upper() + DELIMITER if delimited else word.upper()):
+                if char not in goto[state]:
+                    goto.append({})
+                    outputs.append([])
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            outputs[state].append((word.upper(), action))
+
+        alphabet = {char for edges in goto for char in edges}
+        fail = [0] * len(goto)
+        delta = [dict(goto[0])] + [None] * (len(goto) - 1)
+        queue = list(goto[0].values())
+        # Breadth-first, so every failure target is complete before it is used
+        for state in queue:
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            delta[state] = {}
+            for char in alphabet:
+                child = goto[state].get(char)
+                if child is None:
+                    target = delta[fail[state]].get(char, 0)
+                    if target:
+                        delta[state][char] = target
+                else:
+                    fail[child] = delta[fail[state]].get(char, 0)
+                    delta[state][char] = child
+                    queue.append(child)
+        self._delta = delta
+        self._outputs = [tuple(found) for found in outputs]
+        self.size = len(triggers)
+        self.delimited = delimited
+        # Start of text counts as a word boundary
+        self.start = self.step(0, DELIMITER) if delimited else 0
+
+    @property
+    def states(self):
+        return len(self._delta)
+
+    def step(self, state, char):
+        return self._delta[state].get(char.upper(), 0)
+
+    def matches(self, state):
+        """(word, action) pairs for every trigger completed at ``state`` (by its closing space, if delimited)"""
+        return self._outputs[state]
+
+
+class TriggerSet:
+    """One compiled automaton per sector, shared read-only by all sessions"""
+
+    def __init__(self, triggers_by_sector):
+        self._automata = {sector: TriggerAutomaton(triggers) for sector, triggers in triggers_by_sector.items()}
+        self._empty = TriggerAutomaton({})
+
+    def automaton(self, sector):
+        return self._automata.get(sector, self._empty)
+
+    def matcher(self, sector):
+        return TriggerMatcher(self.automaton(sector), sector)
+
+
+class TriggerMatcher:
+    """Automaton state after each typed character of one session's text"""
+
+    def __init__(self, automaton, sector=None):
+        self.automaton = automaton
+        self.sector = sector
+        self.version = None  # caller's tag for the text the states were built from
+        self._states = [automaton.start]
+
+    def __len__(self):
+        return len(self._states) - 1
+
+    def push(self, text):
+        """Advance over ``text``; return the triggers completed by its characters"""
+        found = []
+        state = self._states[-1]
+        for char in text:
+            state = self.automaton.step(state, char)
+            self._states.append(state)
+            found.extend(self.automaton.matches(state))
+        return found
+
+    def pop(self, count=1):
+        del self._states[max(1, len(self._states) - count):]
+
+    def reset(self):
+        self._states = [self.automaton.start]
+
+    def resync(self, text, version=None):
+        """Rebuild from scratch after the text was edited behind the matcher's back"""
+        self.reset()
+        self.push(text)
+        self.version = version
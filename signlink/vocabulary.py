@@ -0,0 +1,66 @@
+"""Built-in word lists for fingerspelling completion.
+
+Common English words are listed most frequent first and weighted by rank
+(Zipf's law); each sector adds its own terms, weighted as if they ranked
+among the fifty most common words, so domain words win ties on short
+prefixes.
+"""
+
+COMMON_WORDS = """
+THE OF AND TO A IN IS YOU THAT IT HE WAS FOR ON ARE AS WITH HIS THEY I AT BE THIS
+HAVE FROM OR ONE HAD BY WORD BUT NOT WHAT ALL WERE WE WHEN YOUR CAN SAID THERE USE
+AN EACH WHICH SHE DO HOW THEIR IF WILL UP OTHER ABOUT OUT MANY THEN THEM THESE SO
+SOME HER WOULD MAKE LIKE HIM INTO TIME HAS LOOK TWO MORE WRITE GO SEE NUMBER NO WAY
+COULD PEOPLE MY THAN FIRST WATER BEEN CALL WHO OIL ITS NOW FIND LONG DOWN DAY DID
+GET COME MADE MAY PART OVER NEW SOUND TAKE ONLY LITTLE WORK KNOW PLACE YEAR LIVE ME
+BACK GIVE MOST VERY AFTER THING OUR JUST NAME GOOD SENTENCE MAN THINK SAY GREAT WHERE
+HELP THROUGH MUCH BEFORE LINE RIGHT TOO MEAN OLD ANY SAME TELL BOY FOLLOW CAME WANT
+SHOW ALSO AROUND FORM THREE SMALL SET PUT END DOES ANOTHER WELL LARGE MUST BIG EVEN
+SUCH BECAUSE TURN HERE WHY ASK WENT MEN READ NEED LAND DIFFERENT HOME US MOVE TRY
+KIND HAND PICTURE AGAIN CHANGE OFF PLAY SPELL AIR AWAY ANIMAL HOUSE POINT PAGE LETTER
+MOTHER ANSWER FOUND STUDY STILL LEARN SHOULD WORLD HIGH EVERY NEAR ADD FOOD BETWEEN
+OWN BELOW COUNTRY PLANT LAST SCHOOL FATHER KEEP TREE NEVER START CITY EARTH EYE LIGHT
+THOUGHT HEAD UNDER STORY SAW LEFT FEW WHILE ALONG MIGHT CLOSE SOMETHING SEEM NEXT HARD
+OPEN EXAMPLE BEGIN LIFE ALWAYS THOSE BOTH PAPER TOGETHER GOT GROUP OFTEN RUN IMPORTANT
+UNTIL CHILDREN SIDE FEET CAR MILE NIGHT WALK WHITE SEA BEGAN GROW TOOK RIVER FOUR CARRY
+STATE ONCE BOOK HEAR STOP WITHOUT SECOND LATER MISS IDEA ENOUGH EAT FACE WATCH FAR REALLY
+ALMOST LET ABOVE GIRL SOMETIMES MOUNTAIN CUT YOUNG TALK SOON LIST SONG BEING LEAVE FAMILY
+PLEASE THANK THANKS YES SORRY HELLO MEETING TODAY TOMORROW CALLED QUESTION FEEL FINE
+""".split()
+
+SECTOR_WORDS = {
+    "healthcare": """
+    PAIN NURSE DOCTOR MEDICINE WATER HELP EMERGENCY BATHROOM BREAKFAST LUNCH DINNER
+    TABLETS BLANKET COLD HOT TIRED DIZZY SICK NAUSEA BREATHE BREATHING CHEST HEAD
+    STOMACH BACK LEG ARM APPOINTMENT APPOINTMENTS FAMILY VISITOR PILLOW BED SLEEP
+    HUNGRY THIRSTY MEDICATION MEDICAL PATIENT CHART TEMPERATURE PRESSURE REHABILITATION
+    THERAPY EXERCISE ALLERGY ALLERGIC WHEELCHAIR TOILET SHOWER GLASSES PHONE CALL
+    COMMUNICATE VOICE INFO
+    """.split(),
+    "enterprise": """
+    DASHBOARD PRESENTATION SLIDE SLIDES NEXT PREVIOUS MEETING REPORT REPORTS MONITORS
+    MONITOR SCREEN SHARE PROJECT DEADLINE SCHEDULE CALENDAR EMAIL MANAGER TEAM CLIENT
+    CUSTOMER BUDGET QUARTERLY REVENUE SALES PRODUCTION MANUFACTURING QUALITY INVENTORY
+    SHIPMENT ORDER ORDERS MACHINE ASSEMBLY DESIGN DRAWING MODEL ROTATE ZOOM CAD CONTROL
+    DOCUMENT SPREADSHEET AGENDA UPDATE REVIEW APPROVE DASH VOICE CMD
+    """.split(),
+    "education": """
+    GOOGLE LESSON LESSONS WHITEBOARD ASSESSMENT ACCESSIBILITY HOMEWORK TEACHER STUDENT
+    STUDENTS CLASS CLASSROOM QUESTION ANSWER EXAM TEST QUIZ ASSIGNMENT READING WRITING
+    MATH SCIENCE HISTORY ENGLISH LIBRARY BOOK CHAPTER PAGE NOTES REPEAT EXPLAIN SLOWER
+    UNDERSTAND LEARN PROJECT GROUP BREAK RECESS LUNCH SCHEDULE GRADE CONTROL VOICE CMD
+    """.split(),
+}
+
+
+def sector_vocabulary(sector):
+    """``{word: frequency}`` for one sector: the common words plus its own terms"""
+    vocabulary = {word: 1_000_000 // (rank + 10) for rank, word in enumerate(COMMON_WORDS)}
+    for rank, word in enumerate(SECTOR_WORDS.get(sector, ())):
+        vocabulary[word] = max(vocabulary.get(word, 0), 1_000_000 // (rank + 60))
+    return vocabulary
+
+
+def vocabularies():
+    """Built-in vocabularies for every sector"""
+    return {sector: sector_vocabulary(sector) for sector in SECTOR_WORDS}
@@ -0,0 +1,39 @@
+"""Assistant keyword matching per sector."""
+from signlink.assistant import SECTOR_KNOWLEDGE, KnowledgeIndex, default_knowledge
+
+
+def test_keywords_match_inside_words_and_phrases():
+    knowledge = default_knowledge()
+    assert knowledge.match("healthcare", "patient records") == "patient"
+    assert knowledge.match("healthcare", "i need a doctor") == "doctor"
+    assert knowledge.match("education", "teacher help") == "teach"
+    assert knowledge.match("education", "how do i teach") == "teach"
+
+
+def test_every_sector_keyword_matches_in_a_sentence():
+    knowledge = default_knowledge()
+    for sector, context in SECTOR_KNOWLEDGE.items():
+        for keyword in context["keywords"]:
+            assert knowledge.responses(sector, f"Tell me about the {keyword.upper()}  please") == \
+                tuple(context["responses"]), (sector, keyword)
+        assert knowledge.responses(sector, "what time is it") == ()
+
+
+def test_phrase_keywords_and_sector_fallback():
+    knowledge = KnowledgeIndex({
+        "healthcare": {"keywords": ["call the nurse", "pain"], "responses": ["nurse"]},
+        "enterprise": {"keywords": ["dashboard"], "responses": ["dashboard"]},
+    })
+    assert knowledge.responses("healthcare", "Please   CALL the nurse now") == ("nurse",)
+    assert knowledge.responses("healthcare", "call the doctor") == ()
+    assert knowledge.responses("healthcare", "painful wrist") == ("nurse",)
+    assert knowledge.responses("healthcare", "open the dashboard") == ()
+    assert knowledge.responses("retail", "open the dashboard") == ("dashboard",)  # unknown: the default sector
+
+
+def test_repeated_queries_hit_the_cache():
+    knowledge = KnowledgeIndex(SECTOR_KNOWLEDGE)
+    for text in ("Open the dashboard", "open  the DASHBOARD", "open the dashboard"):
+        knowledge.responses("enterprise", text)
+    info = knowledge.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
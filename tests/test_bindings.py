@@ -0,0 +1,65 @@
+"""Gesture bindings: compiled lookups and hot reload of the config file."""
+import json
+
+import pytest
+
+from signlink.bindings import GESTURE_CONFIG, BindingsFile, ConfigError, load_bindings
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def config():
+    with open(GESTURE_CONFIG) as handle:
+        return json.load(handle)
+
+
+def write(path, config):
+    path.write_text(json.dumps(config))
+
+
+def test_sector_bindings_override_shared_ones(config):
+    bindings = load_bindings(GESTURE_CONFIG)
+    assert bindings.lookup("healthcare", "type", "P").action == "request"
+    assert bindings.lookup("healthcare", "type", "A") is None  # no request signed with A
+    assert bindings.lookup("enterprise", "type", "P").action == "type"
+    assert bindings.lookup("enterprise", "type", "SWIPE_RIGHT").params == {"step": 1}
+    assert bindings.lookup("education", "command", "W").params == {"name": "Whiteboard"}
+
+
+def test_edited_file_is_picked_up_after_the_refresh_interval(tmp_path, config):
+    path = tmp_path / "gestures.json"
+    write(path, config)
+    clock = Clock()
+    bindings = BindingsFile(str(path), refresh_interval=1.0, clock=clock)
+    assert bindings.current().lookup("enterprise", "type", "A").action == "type"
+
+    config["bindings"]["enterprise"]["type"]["A"] = {"action": "quick_action", "name": "Dashboard"}
+    write(path, dict(config, _edited=True))  # a different size, whatever the file system's mtime resolution
+    assert bindings.current().lookup("enterprise", "type", "A").action == "type"  # not checked yet
+    clock.now = 1.0
+    assert bindings.current().lookup("enterprise", "type", "A").params == {"name": "Dashboard"}
+    assert bindings.reloads == 2 and bindings.error is None
+
+
+def test_invalid_edit_keeps_the_previous_bindings(tmp_path, config, capsys):
+    path = tmp_path / "gestures.json"
+    write(path, config)
+    bindings = BindingsFile(str(path), refresh_interval=0.0)
+    previous = bindings.current()
+
+    path.write_text("{not json")
+    assert bindings.current() is previous and bindings.error
+    config["bindings"]["*"]["type"]["A-Z"] = {"action": "nope"}
+    write(path, config)
+    assert bindings.current() is previous and "unknown action" in bindings.error
+    assert "not reloaded" in capsys.readouterr().err
+
+    with pytest.raises(ConfigError):
+        BindingsFile(str(path)).current()  # nothing to fall back on
@@ -0,0 +1,45 @@
+"""Coalescing of repeated requests and per-patient rate limiting."""
+from signlink.coalesce import LIMITED, MERGED, NEW, NotificationCoalescer, TokenBucket
+
+
+def request(gesture="W", patient="bed-1", emergency=False, when=0.0):
+    return {"gesture": gesture, "patient": patient, "emergency": emergency, "timestamp": when}
+
+
+def test_token_bucket_refills_at_its_rate():
+    bucket = TokenBucket(capacity=2, rate=0.5)
+    assert [bucket.take(0.0) for _ in range(3)] == [True, True, False]
+    assert not bucket.take(1.0)
+    assert bucket.take(2.0)
+    assert bucket.take(100.0) and bucket.take(100.0) and not bucket.take(100.0)  # never above capacity
+
+
+def test_burst_of_duplicates_folds_into_the_first():
+    coalescer = NotificationCoalescer(window=60.0)
+    first = request()
+    assert coalescer.offer(first, 0.0) == (NEW, first)
+    for i in range(1, 6):
+        outcome, shown = coalescer.offer(request(when=float(i)), float(i))
+        assert outcome == MERGED and shown is first
+    assert first["count"] == 6 and first["last_timestamp"] == 5.0
+    assert coalescer.merged == 5
+    assert coalescer.offer(request(patient="bed-2"), 6.0)[0] == NEW  # another patient
+    assert coalescer.offer(request(when=61.0), 61.0)[0] == NEW  # window over
+
+
+def test_new_requests_are_rate_limited_per_patient():
+    coalescer = NotificationCoalescer(window=1.0, burst=3, per_minute=6.0)
+    outcomes = [coalescer.offer(request(gesture), 0.0)[0] for gesture in "BLDT"]
+    assert outcomes == [NEW, NEW, NEW, LIMITED]
+    assert coalescer.offer(request("T"), 0.0) == (LIMITED, None)  # nothing earlier to fold into
+    outcome, shown = coalescer.offer(request("B"), 5.0)  # outside the window, bucket still empty
+    assert outcome == LIMITED and shown["gesture"] == "B" and shown["count"] == 2
+    assert coalescer.offer(request("T"), 10.0)[0] == NEW  # one token back after ten seconds
+    assert coalescer.offer(request("W", patient="bed-2"), 10.0)[0] == NEW
+    assert coalescer.limited == 3
+
+
+def test_emergencies_are_never_merged_or_limited():
+    coalescer = NotificationCoalescer(burst=1)
+    outcomes = [coalescer.offer(request("H", emergency=True), 0.0)[0] for _ in range(10)]
+    assert outcomes == [NEW] * 10 and coalescer.merged == coalescer.limited == 0
@@ -0,0 +1,49 @@
+"""Word completion: ranking by frequency, per sector."""
+from signlink.completion import PrefixTrie, WordCompleter, current_word
+from signlink.recognizer import default_completions
+
+VOCABULARIES = {
+    "healthcare": {"nurse": 50, "nausea": 20, "name": 80, "NURSE": 5, "need": 80},
+    "enterprise": {"name": 10, "network": 60, "new": 90},
+}
+
+
+def test_current_word_is_the_text_after_the_last_space():
+    assert current_word("CALL THE NUR") == "NUR"
+    assert current_word("CALL ") == ""
+    assert current_word("") == ""
+
+
+def test_suggestions_rank_by_frequency_then_alphabetically():
+    completer = WordCompleter(VOCABULARIES)
+    assert completer.suggest("healthcare", "CALL N") == ("NAME", "NEED", "NURSE")
+    assert completer.suggest("healthcare", "CALL NA", k=5) == ("NAME", "NAUSEA")
+    assert completer.suggest("healthcare", "nu") == ("NURSE",)
+    assert completer.trie("healthcare").frequencies["NURSE"] == 55  # case variants merge
+    assert completer.suggest("enterprise", "N") == ("NEW", "NETWORK", "NAME")
+    assert completer.suggest("enterprise", "CALL ") == ()
+    assert completer.suggest("enterprise", "X") == ()
+    assert completer.suggest("education", "N") == ()  # no vocabulary
+
+
+def test_best_only_offers_words_that_add_letters():
+    completer = WordCompleter(VOCABULARIES)
+    assert completer.best("enterprise", "NE") == "NEW"
+    assert completer.best("enterprise", "NEW") is None  # already complete
+    assert completer.best("enterprise", "NETW") == "NETWORK"
+    assert completer.best("enterprise", "") is None
+
+
+def test_trie_keeps_max_k_per_prefix():
+    trie = PrefixTrie({f"W{i:02d}": i for i in range(20)}, max_k=4)
+    assert trie.complete("W") == ("W19", "W18", "W17", "W16")
+    assert trie.complete("W0", k=2) == ("W09", "W08")
+    assert "w05" in trie and len(trie) == 20
+
+
+def test_sector_terms_outrank_common_words():
+    completer = default_completions()
+    assert completer.best("healthcare", "ME") == "MEDICINE"
+    assert completer.best("enterprise", "DA") == "DASHBOARD"
+    assert completer.best("education", "LE") == "LESSON"
+    assert completer.best("healthcare", "TH") == "THE"
@@ -0,0 +1,59 @@
+"""Gesture consumers on the event bus."""
+import threading
+import time
+
+import numpy as np
+
+from signlink.recognizer import GestureRecognitionSimulator, RecognizerState
+from signlink.replay import replay_session
+from signlink.run import synthetic_landmarks
+
+
+def bus_threads():
+    return [thread for thread in threading.enumerate() if thread.name.startswith("signlink-bus-")]
+
+
+def test_slow_consumer_does_not_delay_typing():
+    state = RecognizerState(current_sector="healthcare")
+    recognizer = GestureRecognitionSimulator(state, open_url=lambda url: None)
+    recognizer.handlers["request"] = lambda event: time.sleep(0.2)
+    state.gesture_mode = "type"
+    started = time.perf_counter()
+    recognizer.process_gesture("P")  # a patient request, run on the healthcare consumer's thread
+    state.current_sector = "enterprise"
+    recognizer.process_gesture("A")
+    assert time.perf_counter() - started < 0.1
+    assert recognizer.buffer.text == "A"
+    assert recognizer.settle(2.0)
+    recognizer.bus.close()
+
+
+class SlowLog:
+    def __init__(self):
+        self.appended = []
+
+    def append(self, notification, outcome):
+        time.sleep(0.1)
+        self.appended.append((notification["name"], notification["patient"], outcome))
+
+
+def test_queued_request_uses_the_sector_and_patient_it_was_signed_in():
+    state = RecognizerState(current_sector="healthcare", patient_id="bed-4")
+    log = SlowLog()
+    recognizer = GestureRecognitionSimulator(state, open_url=lambda url: None, notification_log=log)
+    recognizer.process_gesture("W")
+    recognizer.process_gesture("P")  # queued behind the slow log
+    state.current_sector = "enterprise"
+    state.patient_id = "bed-9"
+    assert recognizer.settle(2.0)
+    assert log.appended == [("Water", "bed-4", "new"), ("Pain", "bed-4", "new")]
+    assert [n["name"] for n in state.email_notifications.last_flagged(1)] == ["Pain"]
+    recognizer.bus.close()
+
+
+def test_replay_leaves_no_bus_threads():
+    landmarks = synthetic_landmarks("PAIN", frames_per_letter=20, gap_frames=10)
+    timestamps = np.arange(len(landmarks)) / 30.0
+    report = replay_session(landmarks, timestamps, sector="healthcare")
+    assert report["gestures_committed"] > 0
+    assert bus_threads() == []
@@ -0,0 +1,68 @@
+"""Fan-out of the local event stream to many SSE and WebSocket clients."""
+import asyncio
+import socket
+import threading
+import time
+
+from signlink.bench import _stream_client
+from signlink.eventserver import EventServer
+
+
+def publish(server, count, interval=0.0):
+    start = time.perf_counter()
+    for i in range(count):
+        delay = start + i * interval - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        server.publish("gesture", {"gesture": "A", "n": i, "sent": time.perf_counter()})
+    server.publish("end", {})
+
+
+async def run_clients(server, clients, count, interval, stalled=False):
+    received = [[] for _ in range(clients)]
+    tasks = [asyncio.ensure_future(_stream_client(server.port, "sse" if i % 2 else "ws", received[i]))
+             for i in range(clients)]
+    sock = None
+    if stalled:
+        # Connects and never reads
+        sock = socket.socket()
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        sock.setblocking(False)
+        await asyncio.get_running_loop().sock_connect(sock, ("127.0.0.1", server.port))
+        sock.send(b"GET /events HTTP/1.1\r\nHost: localhost\r\n\r\n")
+    while server.stats()["clients"] < clients + stalled:
+        await asyncio.sleep(0.01)
+    publisher = threading.Thread(target=publish, args=(server, count, interval))
+    started = time.perf_counter()
+    publisher.start()
+    await asyncio.wait_for(asyncio.gather(*tasks), 30)
+    publisher.join()
+    if sock is not None:
+        sock.close()
+    return received, time.perf_counter() - started
+
+
+def test_every_client_receives_every_event():
+    with EventServer(port=0, buffer_size=256) as server:
+        received, _ = asyncio.run(run_clients(server, 20, 200, 0.001))
+        stats = server.stats()
+    assert [len(client) for client in received] == [200] * 20
+    assert stats["dropped"] == 0 and stats["evicted"] == 0
+
+
+def test_stalled_client_is_evicted_without_blocking_the_others():
+    with EventServer(port=0, buffer_size=64, evict_after=128, send_buffer=4096) as server:
+        received, elapsed = asyncio.run(run_clients(server, 4, 2000, 0.0005, stalled=True))
+        stats = server.stats()
+    assert stats["evicted"] == 1
+    assert elapsed < 10
+    # The readers kept up while the stalled client's queue overflowed
+    assert all(len(client) >= 0.95 * 2000 for client in received), [len(client) for client in received]
+
+
+def test_unlisted_browser_origin_is_refused():
+    with EventServer(port=0, allowed_origins=["http://localhost:3000"]) as server:
+        for origin, status in (("http://evil.example", b"403"), ("http://localhost:3000", b"200")):
+            with socket.create_connection(("127.0.0.1", server.port), timeout=5) as sock:
+                sock.sendall(b"GET /events HTTP/1.1\r\nHost: localhost\r\nOrigin: " + origin.encode() + b"\r\n\r\n")
+                assert sock.recv(64).split()[1] == status
@@ -0,0 +1,69 @@
+"""SMTP dispatch against the in-process test server: pooling, retries and failures."""
+import socket
+from datetime import datetime
+
+from signlink.localsmtp import LocalSMTPServer
+from signlink.notify import NotificationDispatcher
+from signlink.recognizer import GestureRecognitionSimulator, RecognizerState
+
+
+def notification(i=0):
+    return {"gesture": "H", "name": "Help", "description": "Request assistance", "timestamp": datetime.now(),
+            "emergency": True, "hold_duration": 0.0, "patient": f"bed-{i}"}
+
+
+def test_worker_reuses_its_connection():
+    with LocalSMTPServer() as server:
+        dispatcher = NotificationDispatcher(server.config(), workers=1)
+        for i in range(20):
+            assert dispatcher.submit(notification(i))
+        assert dispatcher.flush(10.0)
+        dispatcher.close()
+        assert len(server.messages) == 20 and b"Patient: bed-19" in server.messages[-1]
+        assert dispatcher.stats()["connections_opened"] == 1 and server.connections == 1
+
+
+def test_dropped_connections_are_retried():
+    with LocalSMTPServer(drop_every=3) as server:
+        dispatcher = NotificationDispatcher(server.config(), workers=2, backoff=0.001)
+        for i in range(12):
+            dispatcher.submit(notification(i))
+        assert dispatcher.flush(10.0)
+        dispatcher.close()
+        stats = dispatcher.stats()
+        assert stats["sent"] == 12 and stats["failed"] == 0 and stats["retries"] >= 4
+        assert len(server.messages) == 12
+
+
+def test_unreachable_server_fails_on_stderr(capsys):
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]  # nothing listens here once closed
+    config = {"smtp_server": "127.0.0.1", "smtp_port": port, "sender_email": "alerts@localhost",
+              "admin_email": "staff@localhost", "use_tls": False}
+    dispatcher = NotificationDispatcher(config, max_retries=2, backoff=0.001)
+    dispatcher.submit(notification())
+    assert dispatcher.flush(10.0)
+    dispatcher.close()
+    assert dispatcher.stats()["failed"] == 1 and dispatcher.retries == 2
+    assert "Failed to send email" in capsys.readouterr().err
+
+
+def test_emergency_emails_wait_for_room_instead_of_dropping():
+    with LocalSMTPServer(delay=0.02) as server:
+        dispatcher = NotificationDispatcher(server.config(), max_queue=1)
+        accepted = [dispatcher.submit(notification(i)) for i in range(5)]
+        assert not all(accepted)  # without waiting, a full queue drops
+        assert dispatcher.flush(10.0)
+        dropped = dispatcher.dropped
+
+        state = RecognizerState(current_sector="healthcare")
+        recognizer = GestureRecognitionSimulator(state, open_url=lambda url: None, notifier=dispatcher)
+        for i in range(10):
+            state.patient_id = f"bed-{i}"
+            recognizer.process_healthcare_gesture("H")
+        recognizer.bus.close(10.0)
+        assert dispatcher.flush(10.0)
+        dispatcher.close()
+        assert dispatcher.dropped == dropped
+        assert dispatcher.sent == len(server.messages) == 5 - dropped + 10
@@ -0,0 +1,81 @@
+"""Durable notification log: batching, acknowledgements and writer failures."""
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from signlink.events import AlertRaised
+from signlink.notifylog import NotificationLog
+from signlink.recognizer import GestureRecognitionSimulator, RecognizerState
+
+
+def notification(name="Water", emergency=False, when=None):
+    return {"timestamp": when or datetime.now(), "gesture": name[0], "name": name,
+            "description": f"Request {name.lower()}", "emergency": emergency}
+
+
+def test_open_emergencies_until_acknowledged(tmp_path):
+    log = NotificationLog(tmp_path / "log.db")
+    now = datetime.now()
+    for i in range(10):
+        log.append(notification("Help" if i % 3 == 0 else "Water", i % 3 == 0, now + timedelta(seconds=i)))
+    assert log.flush()
+    open_ids = [row["id"] for row in log.open_emergencies()]
+    assert len(open_ids) == 4
+    log.acknowledge(open_ids[:2], staff="nurse")
+    assert log.flush()
+    assert [row["id"] for row in log.open_emergencies()] == open_ids[2:]
+    assert len(log.between(now, now + timedelta(seconds=10))) == 10
+    log.close()
+
+
+def test_schema_is_created_by_the_writer(tmp_path):
+    log = NotificationLog(tmp_path / "log.db")
+    opened_by = []
+    connect = log._connect
+    log._connect = lambda: opened_by.append(threading.current_thread()) or connect()
+    log.append(notification())
+    assert log.flush()
+    assert opened_by == [log._writer]
+    assert len(log.between(0, datetime.now() + timedelta(days=1))) == 1
+    log.close()
+
+
+def test_rejected_batch_is_reported_and_the_writer_carries_on(tmp_path, capsys):
+    log = NotificationLog(tmp_path / "log.db")
+    log.append(dict(notification(), name=None))  # violates NOT NULL
+    assert log.flush()
+    assert log.failed == 1 and log.error is None
+    assert "not written" in capsys.readouterr().err
+    log.append(notification())
+    assert log.flush()
+    assert log.written == 1
+    log.close()
+
+
+def test_writer_failure_counts_appends_and_raises_on_flush(tmp_path, capsys):
+    log = NotificationLog(tmp_path / "missing" / "log.db")
+    log.append(notification())
+    with pytest.raises(RuntimeError):
+        log.flush(5.0)
+    assert log.append(notification()) is False
+    assert log.failed == 1 and log.error is not None
+    assert "stopped" in capsys.readouterr().err
+
+
+def test_failed_log_does_not_stop_alerts(tmp_path):
+    log = NotificationLog(tmp_path / "missing" / "log.db")
+    log.append(notification())
+    with pytest.raises(RuntimeError):
+        log.flush(5.0)
+    state = RecognizerState(current_sector="healthcare")
+    recognizer = GestureRecognitionSimulator(state, open_url=lambda url: None, notification_log=log)
+    alerts = []
+    recognizer.bus.subscribe(AlertRaised, alerts.append, name="test")
+    recognizer.process_healthcare_gesture("P")
+    recognizer.process_healthcare_gesture("H")
+    assert [alert.notification["name"] for alert in alerts] == ["Pain", "Help"]
+    assert [n["name"] for n in state.email_notifications.last_flagged(2)] == ["Pain", "Help"]
+    assert "EMERGENCY" in state.feedback_message
+    assert log.failed == 2
+    recognizer.bus.close()
@@ -0,0 +1,81 @@
+"""Inference pool: result order, shared-memory rings and worker restarts."""
+import os
+import time
+
+import numpy as np
+
+from signlink.capture import Frame
+from signlink.procpool import InferencePool
+
+
+class PixelLandmarker:
+    """Stand-in for MediaPipe: every landmark is the frame's first pixel value"""
+
+    def process(self, image):
+        return np.full((21, 3), float(image[0, 0, 0]), np.float32)
+
+
+class SlowLandmarker(PixelLandmarker):
+    def process(self, image):
+        time.sleep(0.2)
+        return super().process(image)
+
+
+def shared_segments():
+    return {name for name in os.listdir("/dev/shm") if name.startswith("psm_")} if os.path.isdir("/dev/shm") else set()
+
+
+def collect(stream, count, timeout=30.0):
+    results = []
+    deadline = time.monotonic() + timeout
+    while len(results) < count and time.monotonic() < deadline:
+        result = stream.results.get(0.1)
+        if result is not None:
+            results.append(result)
+    return results
+
+
+def image(value, shape=(48, 64)):
+    return np.full(shape + (3,), value, np.uint8)
+
+
+def test_results_come_back_in_order_through_shared_memory():
+    before = shared_segments()
+    with InferencePool(1, landmarker_factory=PixelLandmarker, classifier_factory=None) as pool:
+        stream = pool.open_stream(slots=64, results_size=64)
+        for index in range(40):
+            shape = (48, 64) if index < 20 else (96, 128)  # a resolution change swaps the ring
+            assert stream.submit(Frame(index, index / 30, image(index, shape), None))
+        results = collect(stream, 40)
+        assert [result.index for result in results] == list(range(40))
+        assert [int(result.landmarks[0, 0]) for result in results] == list(range(40))
+        assert stream.in_flight == 0 and not stream._retired
+        assert len(shared_segments() - before) <= 1  # only the current ring is left
+        assert pool.stats()["completed"] == 40
+    assert shared_segments() - before == set()
+
+
+def test_full_ring_drops_instead_of_blocking():
+    with InferencePool(1, landmarker_factory=PixelLandmarker, classifier_factory=None) as pool:
+        stream = pool.open_stream(slots=2, results_size=64)
+        accepted = [stream.submit(Frame(index, 0.0, image(index), None)) for index in range(50)]
+        assert accepted[:2] == [True, True] and not all(accepted)
+        collect(stream, sum(accepted))
+        assert stream.dropped == accepted.count(False) and stream.in_flight == 0
+
+
+def test_dead_worker_is_restarted_and_its_frames_fail():
+    with InferencePool(1, landmarker_factory=SlowLandmarker, classifier_factory=None,
+                       check_interval=0.1) as pool:
+        stream = pool.open_stream(slots=8, results_size=8)
+        assert stream.submit(Frame(0, 0.0, image(1), None)) and collect(stream, 1)
+        for index in range(1, 4):
+            stream.submit(Frame(index, 0.0, image(index), None))
+        pool._processes[0].kill()  # while the first of them is being processed
+        deadline = time.monotonic() + 10.0
+        while (stream.in_flight or pool.stats()["restarts"] == 0) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert pool.stats()["restarts"] == 1 and stream.in_flight == 0
+        assert stream.failed == 3 and stream.completed == 1
+        assert stream.submit(Frame(9, 0.0, image(9), None))
+        assert [result.index for result in collect(stream, 1)] == [9]
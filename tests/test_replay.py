@@ -0,0 +1,63 @@
+"""Offline replay: determinism, scoring against labels and loading dumps."""
+import numpy as np
+
+from signlink.replay import (NO_HAND, labels_for_frames, load_label_segments, merge_reports, replay_path,
+                             replay_session, segments_from_frames)
+from signlink.run import synthetic_landmarks
+
+TEXT = "HI LINK"
+
+
+def session():
+    landmarks = synthetic_landmarks(TEXT)
+    timestamps = np.arange(len(landmarks)) / 30.0
+    # Each run of frames with a hand holds the next letter
+    present = ~np.isnan(landmarks).any(axis=(1, 2))
+    starts = np.flatnonzero(present & ~np.concatenate([[False], present[:-1]]))
+    labels = np.full(len(landmarks), NO_HAND, dtype=object)
+    for start, letter in zip(starts, TEXT.replace(" ", "")):
+        end = start
+        while end < len(labels) and present[end]:
+            end += 1
+        labels[start:end] = letter
+    return landmarks, timestamps, labels.astype(str)
+
+
+def test_replay_is_deterministic():
+    landmarks, timestamps, _ = session()
+    first = replay_session(landmarks, timestamps)
+    second = replay_session(landmarks, timestamps)
+    assert first["commits"] == second["commits"]
+    assert first["typed_text"] == second["typed_text"] == "HILINK"
+    assert [gesture for _, gesture in first["commits"]] == list("HILINK")
+
+
+def test_scores_commits_against_labels():
+    landmarks, timestamps, labels = session()
+    report = replay_session(landmarks, timestamps, frame_labels=labels)
+    assert report["false_commits"] == 0
+    assert set(report["letters"]) == set("HILNK")
+    assert report["letters"]["I"]["segments"] == report["letters"]["I"]["segments_committed"] == 2
+    assert all(entry["commit_accuracy"] == 1.0 for entry in report["letters"].values())
+    assert 0 < report["mean_time_to_commit"] < 2.0
+    merged = merge_reports([report, report])
+    assert merged["sessions"] == 2 and merged["letters"]["I"]["segments"] == 4
+    assert merged["gestures_committed"] == 12
+
+
+def test_label_segments_round_trip():
+    timestamps = np.arange(10) / 10.0
+    labels = labels_for_frames([(0.2, 0.4, "A"), (0.6, 0.7, "B")], timestamps)
+    assert "".join(label or "." for label in labels) == "..AAA.BB.."
+    assert segments_from_frames(labels, timestamps) == [(0.2, 0.4, "A"), (0.6, 0.7, "B")]
+
+
+def test_replays_a_dump_with_a_label_file(tmp_path):
+    landmarks, timestamps, labels = session()
+    np.savez(tmp_path / "session.npz", landmarks=landmarks, timestamps=timestamps)
+    segments = segments_from_frames(labels, timestamps)
+    (tmp_path / "labels.csv").write_text("start,end,label\n" + "".join(
+        f"{start:.4f},{end:.4f},{letter.lower()}\n" for start, end, letter in segments))
+    assert len(load_label_segments(tmp_path / "labels.csv")) == len(segments)
+    report = replay_path(tmp_path / "session.npz", labels=tmp_path / "labels.csv")
+    assert report["typed_text"] == "HILINK" and report["false_commits"] == 0
@@ -0,0 +1,49 @@
+"""FAQ index: build, reopen from memory-mapped arrays, and rebuild after an edit."""
+from signlink.retrieval import FaqRetriever, SectorIndex, StringTable
+
+
+def write_corpus(root, sections):
+    corpus = root / "faq" / "enterprise"
+    corpus.mkdir(parents=True, exist_ok=True)
+    (corpus / "faq.md").write_text("".join(f"## {title}\n{text}\n\n" for title, text in sections))
+
+
+SECTIONS = [
+    ("How do I open the dashboard?", "Sign D in command mode to open the analytics dashboard."),
+    ("Can I export reports?", "Reports export as CSV from the reports page."),
+    ("Where are my settings?", "Settings live under your profile menu."),
+]
+
+
+def test_string_table_round_trip_and_lookup():
+    table = StringTable.pack(sorted(["zeta", "alpha", "über", "beta", ""]))
+    assert table.tolist() == ["", "alpha", "beta", "zeta", "über"]
+    assert [table.find(word) for word in ("beta", "über", "", "gamma")] == [2, 4, 0, None]
+
+
+def test_reopened_index_answers_like_the_built_one(tmp_path):
+    write_corpus(tmp_path, SECTIONS)
+    retriever = FaqRetriever(tmp_path / "faq", tmp_path / "index", refresh_interval=0.0)
+    built = retriever.search("enterprise", "open the dashboard")
+    reopened = FaqRetriever(tmp_path / "faq", tmp_path / "index")
+    assert reopened.search("enterprise", "open the dashboard") == built
+    assert reopened.rebuilds == 0
+    assert built[0][1] == {"id": "faq.md#0", "title": SECTIONS[0][0], "text": SECTIONS[0][1]}
+    index = reopened.index("enterprise")
+    assert len(index.documents) == 3 and index.meta == {"signature": index.meta["signature"], "documents": 3,
+                                                        "terms": len(index.terms)}
+
+
+def test_rebuild_retokenizes_only_changed_documents(tmp_path):
+    write_corpus(tmp_path, SECTIONS)
+    retriever = FaqRetriever(tmp_path / "faq", tmp_path / "index", refresh_interval=0.0)
+    retriever.refresh("enterprise")
+    assert retriever.tokenized == 3
+    edited = SECTIONS[:2] + [("Where are my settings?", "Settings moved to the gear icon.")]
+    write_corpus(tmp_path, edited)
+    assert retriever.refresh("enterprise")
+    assert retriever.tokenized == 4
+    fresh, _ = SectorIndex.build([{"id": f"faq.md#{i}", "title": title, "text": text}
+                                  for i, (title, text) in enumerate(edited)])
+    for query in ("gear icon", "export reports", "dashboard"):
+        assert retriever.search("enterprise", query) == fresh.search(query)
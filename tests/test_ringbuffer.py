@@ -0,0 +1,59 @@
+"""Bounded chat and notification history (signlink.ringbuffer)."""
+import tracemalloc
+from datetime import datetime
+
+from signlink.recognizer import RecognizerState, is_emergency
+from signlink.ringbuffer import RingBuffer
+
+
+def notification(i, emergency):
+    return {"gesture": "W", "name": f"Water {i}", "description": "Request water", "timestamp": datetime.now(),
+            "emergency": emergency, "hold_duration": 0.0, "count": 1}
+
+
+def test_keeps_only_the_newest_items():
+    buffer = RingBuffer(5)
+    for i in range(12):
+        buffer.append(i)
+    assert len(buffer) == 5
+    assert list(buffer) == [7, 8, 9, 10, 11]
+    assert buffer.last(3) == [9, 10, 11]
+    assert buffer.last(50) == [7, 8, 9, 10, 11]
+    assert buffer[0] == 7 and buffer[-1] == 11
+    assert buffer.total_appended == 12
+
+
+def test_flag_index_matches_a_scan():
+    buffer = RingBuffer(100, flag=is_emergency)
+    kept = []
+    for i in range(1000):
+        item = notification(i, i % 7 == 0 or i % 11 == 0)
+        buffer.append(item)
+        kept = (kept + [item])[-100:]
+        if i % 97 == 0:
+            emergencies = [n for n in kept if n["emergency"]]
+            assert buffer.last_flagged(3) == emergencies[-3:]
+            assert buffer.count_flagged() == len(emergencies)
+
+
+def test_memory_stays_bounded_over_a_million_notifications():
+    buffer = RingBuffer(1000, flag=is_emergency)
+    tracemalloc.start()
+    try:
+        for i in range(1_000_000):
+            buffer.append(notification(i, i % 20 == 0))
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(buffer) == 1000
+    assert buffer[-1]["name"] == "Water 999999"
+    assert current < 2 * 2**20  # about 1000 notifications' worth, not a million
+    assert [n["name"] for n in buffer.last_flagged(2)] == ["Water 999960", "Water 999980"]
+
+
+def test_recognizer_history_is_bounded():
+    state = RecognizerState()
+    assert isinstance(state.email_notifications, RingBuffer)
+    for i in range(5000):
+        state.email_notifications.append(notification(i, False))
+    assert len(state.email_notifications) == state.email_notifications.capacity
@@ -0,0 +1,60 @@
+"""ROI tracking: crops around the last hand, mapping back and reacquiring."""
+import numpy as np
+
+from signlink.capture import RoiTracker
+
+
+class BrightSquare:
+    """Stand-in landmarker: the 'hand' is the lit pixels, landmarks span their bounding box"""
+
+    def __init__(self):
+        self.shapes = []
+
+    def process(self, image):
+        self.shapes.append(image.shape[:2])
+        ys, xs = np.nonzero(image[..., 0])
+        if xs.size == 0:
+            return None
+        height, width = image.shape[:2]
+        t = np.linspace(0.0, 1.0, 21)
+        x = (xs.min() + t * (xs.max() + 1 - xs.min())) / width
+        y = (ys.min() + t * (ys.max() + 1 - ys.min())) / height
+        return np.stack([x, y, np.zeros(21)], axis=1).astype(np.float32)
+
+
+def frame(x, y, size=40, shape=(480, 640)):
+    image = np.zeros(shape + (3,), np.uint8)
+    image[y:y + size, x:x + size] = 255
+    return image
+
+
+def test_tracks_in_a_crop_and_maps_landmarks_back():
+    landmarker = BrightSquare()
+    tracker = RoiTracker(landmarker, padding=0.3, min_size=96)
+    first = tracker.process(frame(300, 200))
+    second = tracker.process(frame(305, 204))  # the hand moved a little
+    assert landmarker.shapes[0] == (480, 640) and landmarker.shapes[1][0] < 200
+    np.testing.assert_allclose(second, BrightSquare().process(frame(305, 204)), atol=1e-5)
+    assert not np.allclose(first, second)
+    assert tracker.tracked == 1 and tracker.redetections == 0
+    assert tracker.stats()["roi_pixel_fraction"] < 0.6
+
+
+def test_reacquires_on_the_full_frame_when_the_hand_leaves_the_crop():
+    landmarker = BrightSquare()
+    tracker = RoiTracker(landmarker)
+    tracker.process(frame(40, 40))
+    landmarks = tracker.process(frame(500, 380))
+    assert landmarker.shapes[-1] == (480, 640)  # the crop was empty, so the frame was re-detected
+    np.testing.assert_allclose(landmarks[0, :2], [500 / 640, 380 / 480], atol=1e-5)
+    assert tracker.redetections == 1 and tracker.stats()["roi_hit_rate"] == 0.0
+    assert tracker.process(np.zeros((480, 640, 3), np.uint8)) is None and tracker.box is None
+
+
+def test_box_follows_a_resolution_change():
+    landmarker = BrightSquare()
+    tracker = RoiTracker(landmarker, min_size=48)
+    tracker.process(frame(320, 240))
+    landmarks = tracker.process(frame(160, 120, size=20, shape=(240, 320)))  # the same hand at half size
+    assert landmarker.shapes[-1][0] < 240 and tracker.tracked == 1
+    np.testing.assert_allclose(landmarks[0, :2], [0.5, 0.5], atol=1e-5)
@@ -0,0 +1,68 @@
+"""Adaptive frame admission and rate control."""
+import threading
+import time
+
+from signlink.scheduler import AdaptiveScheduler
+
+
+def test_admits_at_the_current_rate():
+    scheduler = AdaptiveScheduler(max_fps=10.0, load=None)
+    admitted = [scheduler.admit(i / 100) for i in range(100)]  # a 100 fps camera for one second
+    assert sum(admitted) == 10 and scheduler.skipped == 90
+    assert admitted[0] and admitted[10] and not admitted[5]
+
+
+def test_sheds_rate_then_resolution_and_restores_in_reverse():
+    scheduler = AdaptiveScheduler(target_latency=0.1, max_fps=30.0, fps_floor=12.0, interval=1.0, load=None)
+    now = 0.0
+    while scheduler.scale_index < len(scheduler.scales) - 1:
+        now += 1.0
+        scheduler.observe(0.3, now)
+        scheduler.observe(0.3, now)
+        assert now < 20
+    assert scheduler.fps == 12.0 and scheduler.scale == 0.5
+    assert "over 100ms target" in scheduler.reason
+    while scheduler.fps < 30.0:
+        now += 1.0
+        scheduler.observe(0.01, now)
+        scheduler.observe(0.01, now)
+        assert now < 100
+    assert scheduler.scale == 1.0 and "headroom" in scheduler.reason
+
+
+def test_busy_cpu_sheds_only_to_the_floor():
+    scheduler = AdaptiveScheduler(target_latency=0.1, fps_floor=12.0, scales=(1.0,), load=lambda: 0.99)
+    for now in range(1, 20):
+        scheduler.observe(0.05, float(now))
+    assert scheduler.fps == 12.0 and "CPU 99% busy" in scheduler.reason
+
+
+def test_admission_under_load_from_several_threads():
+    scheduler = AdaptiveScheduler(target_latency=0.001, max_fps=200.0, fps_floor=50.0, min_fps=20.0,
+                                  interval=0.01, load=None)
+    calls = [0] * 4
+    stop = threading.Event()
+
+    def capture(slot):
+        while not stop.is_set():
+            scheduler.admit()
+            calls[slot] += 1
+
+    def results():
+        while not stop.is_set():
+            scheduler.observe(0.05)  # always over target, so the rate keeps falling
+            scheduler.stats()
+
+    threads = [threading.Thread(target=capture, args=(slot,)) for slot in range(3)]
+    threads.append(threading.Thread(target=results))
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    time.sleep(0.5)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+    assert scheduler.admitted + scheduler.skipped == sum(calls)
+    assert scheduler.admitted <= 200.0 * elapsed + 1  # never above the highest rate
+    assert scheduler.fps == 20.0 and scheduler.scale == scheduler.scales[-1]
@@ -0,0 +1,63 @@
+"""Sessions share one read-only classifier and keep only their own state."""
+import time
+import tracemalloc
+
+import numpy as np
+
+from signlink.capture import SyntheticSource
+from signlink.features import LETTERS, default_classifier, template_landmarks
+from signlink.recognizer import GestureRecognizer, RecognizerState
+
+SESSION_BUDGET_KB = 48  # state, smoothing buffers and event bus; a private model alone is ~30 KB more
+
+
+def open_session(classifier, probabilities, frames=50):
+    recognizer = GestureRecognizer(RecognizerState(), open_url=lambda url: None)
+    recognizer.use_labels(classifier.labels)
+    for i in range(frames):
+        recognizer.observe(i, probabilities[i % len(probabilities)])
+    return recognizer
+
+
+def test_sessions_share_the_classifier():
+    classifier = default_classifier()
+    assert default_classifier() is classifier
+    landmarks = template_landmarks("A", 40, 0.004, np.random.default_rng(0)).astype(np.float32)
+    recognizers = [GestureRecognizer(RecognizerState(), open_url=lambda url: None) for _ in range(3)]
+    try:
+        for recognizer in recognizers:
+            recognizer.start(SyntheticSource(landmarks, fps=100.0, realtime=True), classifier)
+        assert all(recognizer.pipeline.classifier is classifier for recognizer in recognizers)
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline and not all(r.last_result_index >= 0 for r in recognizers):
+            for recognizer in recognizers:
+                recognizer.detect_gesture()
+            time.sleep(0.01)
+        assert all(recognizer.last_result_index >= 0 for recognizer in recognizers)
+    finally:
+        for recognizer in recognizers:
+            recognizer.stop()
+    # Per-session state stays per session
+    assert len({id(recognizer.smoother) for recognizer in recognizers}) == 3
+    assert len({id(recognizer.state.text_buffers) for recognizer in recognizers}) == 3
+
+
+def test_memory_per_session_stays_flat():
+    classifier = default_classifier()
+    rng = np.random.default_rng(5)
+    landmarks = np.concatenate([template_landmarks(letter, 4, 0.004, rng) for letter in LETTERS])
+    probabilities = classifier.predict_proba(landmarks)
+    open_session(classifier, probabilities)  # warm caches outside the measurement
+
+    per_session = {}
+    for count in (1, 10, 100):
+        tracemalloc.start()
+        try:
+            sessions = [open_session(classifier, probabilities) for _ in range(count)]
+            current, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        per_session[count] = current / count / 1024
+        del sessions
+    assert per_session[100] < SESSION_BUDGET_KB, per_session
+    assert per_session[100] <= per_session[1] * 1.25, per_session
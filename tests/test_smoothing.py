@@ -0,0 +1,75 @@
+"""Temporal smoothing: voting, EMA and commit hysteresis."""
+import numpy as np
+import pytest
+
+from signlink.smoothing import EMA, VOTE, GestureSmoother
+
+LABELS = ("A", "B", "C")
+
+
+def onehot(label, peak=0.9):
+    row = np.full(len(LABELS), (1.0 - peak) / (len(LABELS) - 1))
+    row[LABELS.index(label)] = peak
+    return row
+
+
+def feed(smoother, frames):
+    """Committed labels, with the frame number each committed on"""
+    return [(i, label) for i, frame in enumerate(frames)
+            if (label := smoother.update(None if frame is None else onehot(frame))) is not None]
+
+
+def test_stable_gesture_commits_once_after_enough_frames():
+    smoother = GestureSmoother(LABELS, mode=VOTE, window=8, commit_threshold=0.875, min_frames=2)
+    # 7 of 8 votes reaches the threshold on the seventh frame, and the streak is long enough by then
+    assert feed(smoother, ["A"] * 30) == [(6, "A")]
+    assert smoother.held == "A" and smoother.confidence == 1.0
+
+
+def test_flicker_is_suppressed():
+    smoother = GestureSmoother(LABELS, mode=VOTE, window=8)
+    assert feed(smoother, ["A", "B"] * 20) == []
+    assert feed(GestureSmoother(LABELS, window=8), ["A", "A", "A", "B"] * 10) == []
+    assert feed(GestureSmoother(LABELS, window=8), ["A"] * 3 + [None] + ["A"] * 3) == []
+
+
+def test_single_outlier_does_not_break_a_held_sign():
+    smoother = GestureSmoother(LABELS, window=8)
+    frames = ["A"] * 10 + ["C"] + ["A"] * 10
+    assert feed(smoother, frames) == [(6, "A")]
+
+
+def test_hysteresis_needs_release_before_recommit():
+    smoother = GestureSmoother(LABELS, window=8, release_threshold=0.4)
+    assert feed(smoother, ["A"] * 10) == [(6, "A")]
+    # A short gap keeps A above the release threshold, so it is not committed twice
+    assert feed(smoother, [None] * 3 + ["A"] * 10) == []
+    # A longer one releases it, and the same sign commits again
+    assert feed(smoother, [None] * 6 + ["A"] * 10) == [(12, "A")]
+
+
+def test_min_frames_requires_a_streak():
+    smoother = GestureSmoother(LABELS, window=2, commit_threshold=0.5, min_frames=4)
+    assert feed(smoother, ["B"] * 6) == [(3, "B")]
+
+
+def test_commit_waits_for_allow_commit():
+    smoother = GestureSmoother(LABELS, window=4)
+    for _ in range(10):
+        assert smoother.update(onehot("A"), allow_commit=False) is None
+    assert smoother.update(onehot("A")) == "A"
+
+
+def test_ema_tracks_probabilities_and_commits():
+    smoother = GestureSmoother(LABELS, mode=EMA, alpha=0.5, commit_threshold=0.8, release_threshold=0.3)
+    committed = feed(smoother, ["C"] * 10)
+    assert committed == [(3, "C")]  # the average of 0.9 peaks: 0.45, 0.675, 0.7875, 0.84
+    np.testing.assert_allclose(smoother.smoothed().sum(), 1 - 0.5 ** 10)
+    assert feed(smoother, ["A", "C"] * 10) == []
+
+
+def test_invalid_settings_raise():
+    with pytest.raises(ValueError):
+        GestureSmoother(LABELS, mode="median")
+    with pytest.raises(ValueError):
+        GestureSmoother(LABELS, commit_threshold=0.5, release_threshold=0.6)
@@ -0,0 +1,27 @@
+"""Cold start of the apps stays under budget and defers heavy modules."""
+from pathlib import Path
+
+import pytest
+
+from signlink import startup
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_parse_importtime():
+    stderr = ("import time: self [us] | cumulative | imported package\n"
+              "import time:       120 |        120 |   _io\n"
+              "import time:      1500 |       2500 | numpy\n")
+    assert startup.parse_importtime(stderr) == [("_io", 0.12, 0.12, 1), ("numpy", 1.5, 2.5, 0)]
+
+
+@pytest.mark.parametrize("script", ["appy.py", "app.py"])
+def test_cold_start_within_budget(script):
+    report = startup.measure(str(ROOT / script), runs=2, cwd=ROOT)
+    assert report["heavy_loaded"] == []
+    assert report["import_ms"] < startup.DEFAULT_BUDGET_MS
+
+
+def test_cli_fails_over_budget(capsys):
+    assert startup.main([str(ROOT / "appy.py"), "--runs", "1", "--budget", "1"]) == 1
+    assert "over budget" in capsys.readouterr().out
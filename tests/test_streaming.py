@@ -0,0 +1,64 @@
+"""Streamed replies: chunking, cancellation and latency metrics."""
+import threading
+
+from signlink.streaming import ResponseStream, StreamMetrics, word_chunks
+
+
+class Ticks:
+    """A clock that advances one second per reading"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1.0
+        return self.now
+
+
+def test_word_chunks_keep_trailing_whitespace():
+    assert list(word_chunks("Open  the\ndashboard. ")) == ["Open  ", "the\n", "dashboard. "]
+    assert "".join(word_chunks("  leading space")) == "leading space"
+    assert list(word_chunks("")) == []
+
+
+def test_complete_stream_records_timings():
+    metrics = StreamMetrics()
+    finished = []
+    stream = ResponseStream(word_chunks("one two three"), metrics, finished.append, clock=Ticks())
+    assert list(stream) == ["one ", "two ", "three"]
+    assert stream.text == "one two three" and stream.completed and not stream.cancelled
+    assert stream.time_to_first_token == 1.0 and stream.total_time == 2.0
+    assert finished == [stream]
+    stats = metrics.stats()
+    assert stats["completed"] == 1 and stats["ttft_p50_ms"] == 1000.0 and stats["total_p95_ms"] == 2000.0
+
+
+def test_cancel_stops_at_the_next_chunk_and_closes_the_source():
+    closed = threading.Event()
+
+    def reply():
+        try:
+            for i in range(100):
+                yield f"w{i} "
+        finally:
+            closed.set()
+
+    metrics = StreamMetrics()
+    stream = ResponseStream(reply(), metrics)
+    received = []
+    for chunk in stream:
+        received.append(chunk)
+        if len(received) == 3:
+            stream.cancel()
+    assert received == ["w0 ", "w1 ", "w2 "] and stream.text == "w0 w1 w2 "
+    assert stream.cancelled and not stream.completed and closed.is_set()
+    assert metrics.stats()["cancelled"] == 1 and metrics.stats()["total_p50_ms"] is None
+
+
+def test_abandoned_stream_still_finishes():
+    finished = []
+    stream = ResponseStream(word_chunks("a b c"), on_finish=finished.append)
+    iterator = iter(stream)
+    next(iterator)
+    iterator.close()  # what an interrupted script run does to a half-read stream
+    assert finished == [stream] and not stream.completed and stream.text == "a "
@@ -0,0 +1,74 @@
+"""Gap buffer editing at the cursor, undo/redo and per-sector buffers."""
+from signlink.textbuffer import SectorBuffers, TextBuffer
+
+
+def test_insert_and_delete_at_the_cursor():
+    buffer = TextBuffer("HELLO WORLD")
+    buffer.move(-6)
+    assert buffer.cursor == 5 and buffer.before_cursor() == "HELLO"
+    buffer.insert(",")
+    assert buffer.text == "HELLO, WORLD"
+    buffer.move_to(0)
+    assert buffer.delete() == ""  # nothing before the cursor
+    buffer.insert("OH ")
+    assert buffer.text == "OH HELLO, WORLD" and buffer.cursor == 3
+    buffer.move(100)
+    assert buffer.cursor == len(buffer) == 15
+    assert buffer.delete(6) == " WORLD"
+    assert buffer.delete(100) == "OH HELLO,"
+    assert buffer.text == "" and len(buffer) == 0
+
+
+def test_current_word_ends_at_the_cursor():
+    buffer = TextBuffer("CALL THE NURSE")
+    assert buffer.current_word() == "NURSE"
+    buffer.move(-2)
+    assert buffer.current_word() == "NUR"
+    buffer.move_to(5)
+    assert buffer.current_word() == ""
+
+
+def test_text_and_version_follow_every_edit():
+    buffer = TextBuffer("ABCDEF")
+    seen = {buffer.version}
+    for edit in (lambda: buffer.move(-3), lambda: buffer.insert("X"), lambda: buffer.delete(2)):
+        edit()
+        seen.add(buffer.version)
+    assert buffer.text == "ABDEF"
+    assert len(seen) == 3  # moving the cursor does not change the text
+    assert TextBuffer().version not in seen
+
+
+def test_undo_and_redo_restore_text_and_cursor():
+    buffer = TextBuffer()
+    buffer.insert("HELO")
+    buffer.move(-1)
+    buffer.insert("L")
+    buffer.move(1)
+    buffer.delete(5)
+    assert buffer.text == "" and buffer.can_undo
+    assert buffer.undo() and buffer.text == "HELLO" and buffer.cursor == 5
+    assert buffer.undo() and buffer.text == "HELO" and buffer.cursor == 3
+    assert buffer.undo() and buffer.text == "" and not buffer.can_undo
+    assert not buffer.undo()
+    assert buffer.redo() and buffer.redo() and buffer.text == "HELLO" and buffer.cursor == 4
+    buffer.insert("!")  # a new edit drops the redo history
+    assert buffer.text == "HELL!O" and not buffer.can_redo and not buffer.redo()
+
+
+def test_clear_is_undoable_and_history_is_bounded():
+    buffer = TextBuffer(history=3)
+    for char in "ABCDE":
+        buffer.insert(char)
+    buffer.move(-2)
+    assert buffer.clear() == "ABCDE" and buffer.text == ""
+    assert buffer.undo() and buffer.text == "ABCDE"
+    assert buffer.undo() and buffer.undo() and not buffer.undo()  # only the last three edits
+    assert buffer.text == "ABC"
+
+
+def test_sector_buffers_keep_text_apart():
+    buffers = SectorBuffers(history=10)
+    buffers["healthcare"].insert("PAIN")
+    buffers["education"].insert("LESSON")
+    assert buffers["healthcare"].text == "PAIN" and buffers["enterprise"].text == ""
@@ -0,0 +1,60 @@
+"""Trigger automaton: whole-word matching, overlaps and incremental pushes."""
+import pytest
+
+from signlink.triggers import TriggerAutomaton, TriggerMatcher, TriggerSet
+
+
+def words(found):
+    return [word for word, _ in found]
+
+
+def test_whole_words_fire_on_their_closing_space():
+    matcher = TriggerMatcher(TriggerAutomaton({"google": "g", "go": "go"}))
+    assert words(matcher.push("GOOGLE")) == []
+    assert words(matcher.push(" ")) == ["GOOGLE"]
+    for text in ("GOOGLES ", "XGOOGLE ", "GOOG "):
+        matcher.reset()
+        assert matcher.push(text) == [], text
+    matcher.reset()
+    assert words(matcher.push("LET US GO GOOGLE ")) == ["GO", "GOOGLE"]
+
+
+def test_overlapping_words_share_their_boundary_space():
+    matcher = TriggerMatcher(TriggerAutomaton({"help": 1, "me": 2}))
+    assert [(word, action) for word, action in matcher.push("HELP ME ")] == [("HELP", 1), ("ME", 2)]
+
+
+def test_matches_across_pushes_and_after_backspace():
+    matcher = TriggerSet({"education": {"GOOGLE": "url"}}).matcher("education")
+    found = []
+    for char in "HI GOOGX":
+        found += matcher.push(char)
+    matcher.pop(1)
+    found += matcher.push("LE")
+    assert found == []
+    assert matcher.push(" ") == [("GOOGLE", "url")]
+    assert len(matcher) == len("HI GOOGLE ")
+    matcher.resync("GOOGLE", version=3)
+    assert matcher.version == 3 and words(matcher.push(" ")) == ["GOOGLE"]
+
+
+def test_unknown_sector_matches_nothing():
+    assert TriggerSet({}).matcher("healthcare").push("GOOGLE ") == []
+
+
+def test_delimited_triggers_must_be_single_words():
+    with pytest.raises(ValueError):
+        TriggerAutomaton({"open chart": 1})
+    with pytest.raises(ValueError):
+        TriggerAutomaton({"": 1})
+
+
+def test_undelimited_words_match_anywhere():
+    automaton = TriggerAutomaton({"teach": "teach", "need a doctor": "doctor", "she": "she", "he": "he"},
+                                 delimited=False)
+    matcher = TriggerMatcher(automaton)
+    assert words(matcher.push("teacher")) == ["TEACH", "HE"]
+    matcher.reset()
+    assert words(matcher.push("i need a doctor")) == ["NEED A DOCTOR"]
+    matcher.reset()
+    assert sorted(words(matcher.push("ushe"))) == ["HE", "SHE"]